@@ -0,0 +1,79 @@
+"""
+ScoreIQ — rerun delta size benchmark
+Runs each page headlessly with Streamlit's AppTest and reports what one full
+rerun (first load, navigation, any non-fragment widget) sends to the browser:
+the number of elements and the serialized bytes of their delta messages.
+Exits 1 if a page sends more than its absolute LIMITS, or grows past the
+recorded baseline by more than --threshold.
+
+Run from the repo root, where .streamlit/config.toml is picked up:
+     python benchmarks/delta.py            # report + regression check
+     python benchmarks/delta.py --update   # re-record the baseline
+     python benchmarks/delta.py [--json out.json] [--check before.json]
+"""
+
+import argparse, json, os, sys
+
+from streamlit.testing.v1 import AppTest
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from rerun import APP   # noqa: E402
+
+PAGES = ("predict", "simulator", "analytics", "about")
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "delta_baseline.json")
+# Bytes per page with the stylesheet inlined on every rerun (before static serving).
+# A rerun must stay under these whatever the baseline holds.
+LIMITS = {"predict": 21_444, "simulator": 30_310, "analytics": 37_284, "about": 22_145}
+
+
+def walk(node):
+    yield node
+    for child in getattr(node, "children", {}).values():
+        yield from walk(child)
+
+
+def bench_page(page):
+    at = AppTest.from_file(APP, default_timeout=120)
+    at.query_params["page"] = page
+    at.run()
+    if at.exception:
+        raise RuntimeError(f"{page}: {at.exception[0].value}")
+    protos = [n.proto for n in walk(at._tree) if getattr(n, "proto", None) is not None]
+    return {"elements": len(protos), "bytes": sum(p.ByteSize() for p in protos)}
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Elements and delta bytes of one full rerun per page.")
+    ap.add_argument("--json", help="write results to this file")
+    ap.add_argument("--check", default=BASELINE, help="recorded run to compare against (default: the baseline)")
+    ap.add_argument("--threshold", type=float, default=1.05, help="allowed growth vs the recorded run")
+    ap.add_argument("--update", action="store_true", help="write the result as the new baseline")
+    args = ap.parse_args(argv)
+
+    results = {p: bench_page(p) for p in PAGES}
+    before = json.load(open(args.check)) if os.path.exists(args.check) and not args.update else {}
+    print(f"{'page':<11} {'elements':>8} {'bytes':>9} {'limit':>9}" + (f" {'before':>9}" if before else ""))
+    worse = []
+    for p, r in results.items():
+        line = f"{p:<11} {r['elements']:>8} {r['bytes']:>9,} {LIMITS[p]:>9,}"
+        bad = r["bytes"] > LIMITS[p]
+        if p in before:
+            line += f" {before[p]['bytes']:>9,}"
+            bad |= r["bytes"] > before[p]["bytes"] * args.threshold
+        if bad:
+            line += "  FAIL"
+            worse.append(p)
+        print(line)
+    for path in filter(None, (args.json, BASELINE if args.update else None)):
+        with open(path, "w") as f:
+            json.dump(results, f, indent=2)
+            f.write("\n")
+    if args.update:
+        print(f"baseline written: {os.path.relpath(BASELINE)}")
+    if worse:
+        print(f"delta over its limit or grew on: {', '.join(worse)}", file=sys.stderr)
+    return 1 if worse else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,64 @@
+"""
+ScoreIQ — chart payload benchmark
+Drives each page headlessly with Streamlit's AppTest, moves its main slider,
+and reports per rerun the bytes of Plotly spec JSON the server sends and the
+server-side time spent building and serializing figures (the `figure:*` and
+`plotly_chart:*` spans of the rerun profiler).
+
+Run: python benchmarks/figures.py [--moves 10] [--json out.json]
+"""
+
+import argparse, json, os, statistics, sys, tempfile
+
+_jsonl = tempfile.NamedTemporaryFile(prefix="scoreiq-figures-", suffix=".jsonl", delete=False).name
+os.environ.update(SCOREIQ_PROFILE="1", SCOREIQ_PROFILE_JSONL=_jsonl)   # read when the app imports scoreiq
+
+from streamlit.testing.v1 import AppTest   # noqa: E402
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+from rerun import APP, INTERACTIONS, move   # noqa: E402
+
+
+def figure_ms(rec):
+    return sum(s["ms"] for s in rec["spans"] if s["name"].startswith(("figure:", "plotly_chart:")))
+
+
+def bench_page(page, moves):
+    key, values = INTERACTIONS[page]
+    at = AppTest.from_file(APP, default_timeout=120)
+    at.query_params["page"] = page
+    at.run()
+    sent, built = [], []
+    for i in range(moves):
+        move(at, key, values[i % len(values)])
+        start = os.path.getsize(_jsonl)
+        at.run()
+        if at.exception:
+            raise RuntimeError(f"{page}: {at.exception[0].value}")
+        sent.append(sum(len(e.proto.spec) + len(e.proto.config) for e in at.get("plotly_chart")))
+        with open(_jsonl) as f:
+            f.seek(start)
+            built.append(sum(figure_ms(json.loads(line)) for line in f if line.strip()))
+    return {"charts": len(at.get("plotly_chart")), "bytes": statistics.median(sent),
+            "figure_ms": statistics.median(built)}
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Plotly spec bytes and figure build time per rerun.")
+    ap.add_argument("--moves", type=int, default=10, help="slider moves per page")
+    ap.add_argument("--json", help="write results to this file")
+    args = ap.parse_args(argv)
+
+    results = {p: bench_page(p, args.moves) for p in INTERACTIONS}
+    print(f"{'page':<11} {'charts':>6} {'spec bytes':>11} {'figures':>10}")
+    for p, r in results.items():
+        print(f"{p:<11} {r['charts']:>6} {r['bytes']:>11,.0f} {r['figure_ms']:>7.2f} ms")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    os.unlink(_jsonl)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,125 @@
+"""
+ScoreIQ — startup import benchmark
+Replays app.py's module-level imports under `python -X importtime` and
+compares the cumulative cost against a stored baseline; then imports app.py
+itself, serving a fresh artifact, and fails if that loads a deferred package.
+
+Run:    python benchmarks/importtime.py            # report + regression check
+        python benchmarks/importtime.py --update   # re-record the baseline
+"""
+
+import argparse, ast, json, os, re, subprocess, sys, tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(ROOT, "app.py")
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "importtime_baseline.json")
+
+# Must never be loaded by importing app.py: only fallback paths / chart pages need them.
+DEFERRED = ("sklearn", "plotly", "joblib", "scipy", "pandas")
+
+# Root packages `import app` adds to sys.modules beyond streamlit's own (streamlit may load plotly itself).
+PROBE = """
+import json, sys
+import streamlit
+before = set(sys.modules)
+import app
+print(json.dumps(sorted({m.split(".")[0] for m in set(sys.modules) - before})))
+"""
+SAVE = ("import os; from scoreiq import artifact, loader, train; "
+        "artifact.save(train.RidgeStats.from_arrays(*loader.synthetic_training_set()).solve(), os.environ['SCOREIQ_MODEL'])")
+
+LINE = re.compile(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)")
+
+
+def toplevel_imports(path=APP):
+    """(statement source, imported root packages) for each module-level import of `path`."""
+    src = open(path, encoding="utf-8").read()
+    out = []
+    for n in ast.parse(src).body:
+        if isinstance(n, ast.Import):
+            roots = {a.name.split(".")[0] for a in n.names}
+        elif isinstance(n, ast.ImportFrom) and n.level == 0:
+            roots = {n.module.split(".")[0]}
+        else:
+            continue
+        out.append((ast.get_source_segment(src, n), roots))
+    return out
+
+
+def measure(stmts):
+    """Cumulative import time (µs) per top-level package for one fresh interpreter."""
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "\n".join(stmts)],
+        cwd=ROOT, capture_output=True, text=True,
+    )
+    if out.returncode != 0:
+        raise RuntimeError(out.stderr.strip().splitlines()[-1])
+    per_pkg = {}
+    for m in LINE.finditer(out.stderr):
+        _, cum, indent, mod = m.groups()
+        if len(indent) == 1:   # first-level imports only; nested ones are in `cum`
+            pkg = mod.split(".")[0]
+            per_pkg[pkg] = per_pkg.get(pkg, 0) + int(cum)
+    return per_pkg
+
+
+def loaded_by_app():
+    """Deferred packages in sys.modules after `import app` in a fresh interpreter, served from an
+    artifact as deployed (no retrain fallback)."""
+    with tempfile.TemporaryDirectory(prefix="scoreiq-importtime-") as tmp:
+        env = {k: v for k, v in os.environ.items() if k != "SCOREIQ_SHARED_DIR"}
+        env["SCOREIQ_MODEL"] = os.path.join(tmp, "student_model.npz")
+        for code in (SAVE, PROBE):
+            out = subprocess.run([sys.executable, "-c", code], cwd=ROOT, env=env, capture_output=True, text=True)
+            if out.returncode != 0:
+                raise RuntimeError(out.stderr.strip().splitlines()[-1])
+    return sorted(set(json.loads(out.stdout.strip().splitlines()[-1])) & set(DEFERRED))
+
+
+def run(repeat=5):
+    stmts = [s for s, _ in toplevel_imports()]
+    startup = measure(["pass"]).keys()   # interpreter bootstrap (site, encodings, ...)
+    runs = [{k: v for k, v in measure(stmts).items() if k not in startup} for _ in range(repeat)]
+    per_pkg = min(runs, key=lambda r: sum(r.values()))
+    return {
+        "statements": stmts,
+        "total_us": sum(per_pkg.values()),
+        "packages": dict(sorted(per_pkg.items(), key=lambda kv: -kv[1])),
+        "deferred_imported": loaded_by_app(),
+    }
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description=__doc__.strip().splitlines()[1])
+    ap.add_argument("--update", action="store_true", help="write the result as the new baseline")
+    ap.add_argument("--repeat", type=int, default=5, help="fresh interpreters to sample (best is kept)")
+    ap.add_argument("--threshold", type=float, default=1.25, help="allowed slowdown vs baseline")
+    args = ap.parse_args(argv)
+
+    res = run(args.repeat)
+    print(f"app.py module-level imports: {res['total_us']/1000:.1f} ms")
+    for pkg, us in list(res["packages"].items())[:10]:
+        print(f"  {pkg:<24} {us/1000:8.1f} ms")
+
+    if args.update:
+        with open(BASELINE, "w") as f:
+            json.dump(res, f, indent=2)
+            f.write("\n")
+        print(f"baseline written: {os.path.relpath(BASELINE, ROOT)}")
+        return 0
+
+    failed = False
+    if res["deferred_imported"]:
+        print(f"FAIL  import app loads deferred packages: {', '.join(res['deferred_imported'])}")
+        failed = True
+    if os.path.exists(BASELINE):
+        base = json.load(open(BASELINE))
+        ratio = res["total_us"] / max(base["total_us"], 1)
+        status = "FAIL" if ratio > args.threshold else "ok  "
+        print(f"{status}  {ratio:.2f}x baseline ({base['total_us']/1000:.1f} ms, threshold {args.threshold:.2f}x)")
+        failed |= ratio > args.threshold
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
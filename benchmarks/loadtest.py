@@ -0,0 +1,87 @@
+"""
+ScoreIQ — scoring service load test
+Hammers a running service with keep-alive connections and reports
+throughput and latency percentiles.
+
+Run:    uvicorn scoreiq.service:app --port 8000 --workers 4
+        python benchmarks/loadtest.py --concurrency 32 --duration 10
+        python benchmarks/loadtest.py --batch 500              # /score/batch
+"""
+
+import argparse, http.client, json, random, threading, time
+from urllib.parse import urlsplit
+
+import numpy as np
+
+LEVELS = ["Low", "Medium", "High"]
+
+
+def random_profile(rng):
+    return {
+        "Hours_Studied": rng.randint(1, 44), "Attendance": rng.randint(60, 100),
+        "Sleep_Hours": rng.randint(4, 10), "Previous_Scores": rng.randint(50, 100),
+        "Tutoring_Sessions": rng.randint(0, 8), "Physical_Activity": rng.randint(0, 6),
+        "Parental_Involvement": rng.choice(LEVELS), "Access_to_Resources": rng.choice(LEVELS),
+        "Motivation_Level": rng.choice(LEVELS), "Internet_Access": rng.choice(["Yes", "No"]),
+        "Family_Income": rng.choice(LEVELS), "Teacher_Quality": rng.choice(LEVELS),
+    }
+
+
+def worker(url, batch, deadline, seed, lat, errors):
+    rng = random.Random(seed)
+    u = urlsplit(url)
+    conn = http.client.HTTPConnection(u.hostname, u.port or 80, timeout=30)
+    path, headers = ("/score/batch" if batch else "/score"), {"Content-Type": "application/json"}
+    while time.perf_counter() < deadline:
+        body = ({"profiles": [random_profile(rng) for _ in range(batch)]} if batch
+                else random_profile(rng))
+        payload = json.dumps(body)
+        t = time.perf_counter()
+        try:
+            conn.request("POST", path, payload, headers)
+            resp = conn.getresponse(); resp.read()
+            ok = resp.status == 200
+        except (OSError, http.client.HTTPException):
+            ok = False
+            conn.close()
+            conn = http.client.HTTPConnection(u.hostname, u.port or 80, timeout=30)
+        if ok:
+            lat.append(time.perf_counter() - t)
+        else:
+            errors.append(1)
+    conn.close()
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Load-test the ScoreIQ scoring service.")
+    ap.add_argument("--url", default="http://127.0.0.1:8000")
+    ap.add_argument("--concurrency", type=int, default=16)
+    ap.add_argument("--duration", type=float, default=10.0, help="seconds")
+    ap.add_argument("--batch", type=int, default=0, help="profiles per /score/batch request (0 = /score)")
+    args = ap.parse_args(argv)
+
+    lat, errors = [], []
+    deadline = time.perf_counter() + args.duration
+    threads = [threading.Thread(target=worker, args=(args.url, args.batch, deadline, i, lat, errors))
+               for i in range(args.concurrency)]
+    t0 = time.perf_counter()
+    for t in threads: t.start()
+    for t in threads: t.join()
+    wall = time.perf_counter() - t0
+
+    if not lat:
+        print(f"no successful requests ({len(errors)} errors)")
+        return 1
+    ms = np.array(lat) * 1000
+    rows = len(lat) * max(args.batch, 1)
+    print(f"{args.url}  {'batch='+str(args.batch) if args.batch else 'single'}  "
+          f"concurrency={args.concurrency}  {wall:.1f}s")
+    print(f"  requests   {len(lat):>10,}   ({len(lat)/wall:,.0f} req/s, {len(errors)} errors)")
+    print(f"  students   {rows:>10,}   ({rows/wall:,.0f} rows/s, {rows/wall*60:,.0f} /min)")
+    p50, p90, p95, p99 = np.percentile(ms, [50, 90, 95, 99])
+    print(f"  latency    p50 {p50:.2f} ms · p90 {p90:.2f} ms · p95 {p95:.2f} ms · p99 {p99:.2f} ms · max {ms.max():.2f} ms")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,96 @@
+"""
+ScoreIQ — per-interaction rerun benchmark
+Drives each page headlessly with Streamlit's AppTest and, for every slider
+move, compares the full-script rerun (what every interaction cost before the
+pages were split into fragments) with the fragment-only rerun the server now
+executes.
+
+AppTest always re-executes the whole script, so fragment bodies are timed by
+wrapping st.fragment before the app is loaded.
+
+Run: python benchmarks/rerun.py [--moves 20] [--json out.json]
+"""
+
+import argparse, functools, json, os, statistics, time
+
+import streamlit as st
+from streamlit.testing.v1 import AppTest
+
+APP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+# page -> (slider key, values to cycle through); "<key>.<feature>" is an input of the
+# Predict page's client-scoring component (SCOREIQ_CLIENT_SCORING=1), moved by setting
+# the state a release sends
+INTERACTIONS = {
+    "predict":   ("pr_live.Hours_Studied" if os.environ.get("SCOREIQ_CLIENT_SCORING") == "1" else "pr_h",
+                  [12, 18, 24, 30, 36]),
+    "simulator": ("sim_a", [70, 78, 86, 94, 100]),
+    "analytics": ("aq1",   [8, 16, 24, 32, 40]),
+}
+
+_spans = []
+_fragment = st.fragment
+
+
+def _timed_fragment(func=None, **kwargs):
+    if func is None:
+        return lambda f: _timed_fragment(f, **kwargs)
+
+    @functools.wraps(func)
+    def timed(*a, **kw):
+        t = time.perf_counter()
+        try:
+            return func(*a, **kw)
+        finally:
+            _spans.append(time.perf_counter() - t)
+    return _fragment(timed, **kwargs)
+
+
+def move(at, key, value):
+    if "." in key:
+        key, feature = key.split(".")
+        at.session_state[key] = {"profile": {**at.session_state[key]["profile"], feature: value}}
+    else:
+        at.slider(key=key).set_value(value)
+
+
+def bench_page(page, moves):
+    key, values = INTERACTIONS[page]
+    at = AppTest.from_file(APP, default_timeout=120)
+    at.query_params["page"] = page
+    at.run()                       # warm: model load, imports, caches
+    full, frag = [], []
+    for i in range(moves):
+        _spans.clear()
+        move(at, key, values[i % len(values)])
+        t = time.perf_counter(); at.run(); full.append(time.perf_counter() - t)
+        frag.append(sum(_spans))
+        if at.exception:
+            raise RuntimeError(f"{page}: {at.exception[0].value}")
+    return {"full_ms": statistics.median(full) * 1000, "fragment_ms": statistics.median(frag) * 1000}
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Per-interaction rerun cost, full script vs fragment.")
+    ap.add_argument("--moves", type=int, default=20, help="slider moves per page")
+    ap.add_argument("--json", help="write results to this file")
+    args = ap.parse_args(argv)
+
+    st.fragment = _timed_fragment
+    try:
+        results = {p: bench_page(p, args.moves) for p in INTERACTIONS}
+    finally:
+        st.fragment = _fragment
+
+    print(f"{'page':<11} {'full rerun':>12} {'fragment':>10} {'saved':>7}")
+    for p, r in results.items():
+        saved = 1 - r["fragment_ms"] / r["full_ms"] if r["full_ms"] else 0
+        print(f"{p:<11} {r['full_ms']:>9.1f} ms {r['fragment_ms']:>7.1f} ms {saved:>6.0%}")
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,323 @@
+"""
+ScoreIQ — benchmark suite
+Times the hot paths (single and batch scoring, cohort percentile ranks,
+Analytics curves + heatmap, Simulator scenarios, a 1.3M-combination scenario
+search — for the linear and the folded degree-2 model), model cold starts
+(including attaching to a host's shared store), registry hot swaps, shadow and drift hand-off, synthetic-cohort generation
+feeding file-based batch scoring and training, headless page reruns, and
+compares each median against a stored JSON baseline. A case fails when it is
+over its ratio threshold (wider for µs-scale cases) and slower by more than an
+absolute noise floor.
+
+Run:    python benchmarks/suite.py                  # run + regression check
+        python benchmarks/suite.py --update         # re-record baseline.json
+        python benchmarks/suite.py -k batch -k load # subset by name
+"""
+
+import argparse, json, os, shutil, statistics, subprocess, sys, tempfile, time
+
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from scoreiq import artifact, batch, counterfactual, drift, loader, registry, scenarios, sensitivity, shared, synth, train   # noqa: E402
+from scoreiq.percentile import ScoreIndex   # noqa: E402
+from scoreiq.profile import DEFAULTS, LOWER, UPPER, encode   # noqa: E402
+
+BASELINE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+NOISE = 5e-6   # a slowdown smaller than this (seconds per call) is timer / scheduler jitter, never a regression
+MICRO = 1e-4   # cases faster than this are judged against --micro-threshold: cache and clock state swing them
+# Absolute ceilings in seconds, checked whatever the baseline holds.
+LIMITS = {"plan_quadratic_10000": 1.0, "plan_quadratic_10000_Aplus": 1.0, "plan_quadratic_10000_C": 1.0}
+PROFILE = encode(DEFAULTS)
+
+
+def timeit(fn, repeat=15, min_time=0.05):
+    """Median seconds per call, looping each sample until it lasts `min_time`."""
+    fn()
+    n = 1
+    while True:
+        t = time.perf_counter()
+        for _ in range(n): fn()
+        if time.perf_counter() - t >= min_time or n >= 1 << 20:
+            break
+        n *= 4
+    samples = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        for _ in range(n): fn()
+        samples.append((time.perf_counter() - t) / n)
+    return statistics.median(samples)
+
+
+def cold(code, cwd, repeat=3, **env):
+    """Median wall time of `code` in a fresh interpreter (imports included)."""
+    prog = ("import time; _t = time.perf_counter()\n" + code +
+            "\nprint(time.perf_counter() - _t)")
+    env = {**os.environ, "PYTHONPATH": ROOT, **env}
+    out = []
+    for _ in range(repeat):
+        r = subprocess.run([sys.executable, "-c", prog], cwd=cwd, env=env,
+                           capture_output=True, text=True, check=True)
+        out.append(float(r.stdout.strip().splitlines()[-1]))
+    return statistics.median(out)
+
+
+def random_rows(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return np.floor(rng.uniform(LOWER, UPPER + 1, size=(n, len(LOWER))))
+
+
+# ── CASES ──────────────────────────────────────────────────────
+def bench_scoring(scorer):
+    res = {"predict_single": {"s": timeit(lambda: scorer.predict_one(PROFILE))}}
+    for n in (1, 1_000, 100_000, 1_000_000):
+        X = random_rows(n)
+        s = timeit(lambda: scorer.predict(X), repeat=5)
+        res[f"batch_{n}"] = {"s": s, "rows_per_s": n / s}
+    return res
+
+
+def bench_percentile(scorer):
+    cohort = scorer.predict(random_rows(1_000_000, seed=1))
+    index = ScoreIndex.from_scores(cohort)
+    new = ScoreIndex.from_scores(cohort[:100_000] + 0.5)
+    scores = scorer.predict(random_rows(1_000_000))
+    s = timeit(lambda: index.rank(scores), repeat=5)
+    return {
+        "percentile_rank_single": {"s": timeit(lambda: index.rank(scores[0]))},
+        "percentile_rank_1000000": {"s": s, "rows_per_s": len(scores) / s},
+        "percentile_build_1000000": {"s": timeit(lambda: ScoreIndex.from_scores(cohort), repeat=5)},
+        "percentile_merge": {"s": timeit(lambda: index.merge(new))},
+    }
+
+
+def quadratic(scorer):
+    """Degree-2 polynomial Ridge on the synthetic set, folded like the notebook's export."""
+    from sklearn.linear_model import Ridge
+    from sklearn.preprocessing import PolynomialFeatures, StandardScaler
+    from scoreiq import QuadraticScorer
+    X, y = loader.synthetic_training_set()
+    sc = StandardScaler().fit(X)
+    poly = PolynomialFeatures(degree=2, include_bias=False).fit(sc.transform(X))
+    return QuadraticScorer.from_sklearn(Ridge(alpha=1.0).fit(poly.transform(sc.transform(X)), y), poly, sc)
+
+
+def bench_pages_math(scorer):
+    base = PROFILE
+    curves = [(0, np.arange(1, 45)), (1, np.arange(60, 101)), (2, np.arange(4, 11)), (4, np.arange(0, 9))]
+    h, a = np.linspace(1, 44, 40), np.linspace(60, 100, 40)
+
+    def analytics():
+        for idx, xs in curves:
+            sensitivity.curve(scorer, base, idx, xs)
+        sensitivity.grid(scorer, base, [(1, a), (0, h)])
+
+    hours, attend, sleep, prev, tutor, phys = base[:6]
+    scen = np.array([
+        [min(hours+5,44),  attend,sleep,prev,tutor,phys,1,1,1,1,1,1],
+        [min(hours+10,44), attend,sleep,prev,tutor,phys,1,1,1,1,1,1],
+        [hours,95,sleep,prev,tutor,phys,1,1,1,1,1,1],
+        [hours,attend,8,prev,tutor,phys,1,1,1,1,1,1],
+        [hours,attend,sleep,prev,4,phys,1,1,1,1,1,1],
+        [hours,attend,sleep,prev,tutor,phys,1,1,2,1,1,1],
+        [min(hours+10,44),min(attend+10,100),8,prev,max(tutor,4),phys,2,2,2,1,2,2],
+    ])
+    levers = [(0, np.arange(20, 36)), (1, np.arange(80, 101)), (4, np.arange(0, 9)),
+              (8, np.arange(0, 3)), (2, np.arange(4, 11)), (5, np.arange(0, 7)), (6, np.arange(0, 3))]
+    return {
+        "analytics_curves_heatmap": {"s": timeit(analytics)},
+        "simulator_scenarios": {"s": timeit(lambda: scorer.predict(scen))},
+        "scenario_explorer_1m": {"s": timeit(lambda: scenarios.run(scorer, base, levers), repeat=3)},
+    }
+
+
+def bench_quadratic(scorer):
+    q = quadratic(scorer)
+    X = random_rows(100_000)
+    res = bench_pages_math(q)
+    return {
+        "quadratic_batch_100000": {"s": timeit(lambda: q.predict(X), repeat=5)},
+        **{f"quadratic_{k}": v for k, v in res.items() if k != "simulator_scenarios"},
+    }
+
+
+def bench_plan(scorer):
+    """Least-effort plans for a 10k cohort: the exact linear path and the degree-2 one, to the
+    hardest grade (A+), the usual one (A) and a low one most rows already meet (C)."""
+    X = random_rows(10_000, seed=3)
+    q = quadratic(scorer)
+    res = {"plan_linear_10000": {"s": timeit(lambda: counterfactual.plan(scorer, X, "A"), repeat=3)}}
+    for target, name in (("A", "plan_quadratic_10000"), ("A+", "plan_quadratic_10000_Aplus"),
+                         ("C", "plan_quadratic_10000_C")):
+        res[name] = {"s": timeit(lambda: counterfactual.plan(q, X, target), repeat=3)}
+    return res
+
+
+def bench_load(scorer):
+    tmp = tempfile.mkdtemp(prefix="scoreiq-bench-")
+    artifact.save(scorer, os.path.join(tmp, artifact.DEFAULT_PATH))
+    pkl = tempfile.mkdtemp(prefix="scoreiq-bench-")
+    from sklearn.linear_model import Ridge
+    from sklearn.preprocessing import StandardScaler
+    import joblib
+    X, y = loader.synthetic_training_set()
+    sc = StandardScaler().fit(X)
+    joblib.dump(Ridge(alpha=1.0).fit(sc.transform(X), y), os.path.join(pkl, loader.MODEL_PKL))
+    joblib.dump(sc, os.path.join(pkl, loader.SCALER_PKL))
+    empty = tempfile.mkdtemp(prefix="scoreiq-bench-")
+    code = "from scoreiq import loader; loader.load_model()"
+    return {
+        "load_model_artifact": {"s": cold(code, tmp)},
+        "load_model_pickles": {"s": cold(code, pkl)},
+        "load_model_retrain": {"s": cold(code, empty)},
+    }
+
+
+def bench_shared(scorer):
+    """Publishing a version into the shared store, and what a new process on the host then pays:
+    a cold start that attaches instead of loading (no artifact on disk — it would retrain)."""
+    root = tempfile.mkdtemp(prefix="scoreiq-bench-")
+    empty = tempfile.mkdtemp(prefix="scoreiq-bench-")
+    def publish():
+        shutil.rmtree(os.path.join(root, "v"), ignore_errors=True)
+        shared.Store(os.path.join(root, "v")).publish(scorer)
+    publish()
+    store = os.path.join(root, "v")
+    return {
+        "shared_publish": {"s": timeit(publish, repeat=5)},
+        "shared_attach": {"s": timeit(lambda: shared.Store(store).attach(), repeat=5)},
+        "load_model_shared": {"s": cold("from scoreiq import loader; loader.load_model()", empty,
+                                        SCOREIQ_SHARED_DIR=store)},
+    }
+
+
+def bench_registry(scorer):
+    """Swap-in cost of a new version (activation and the live model's load + golden check, off
+    the request path) and the per-request cost of handing rows to a shadow candidate."""
+    reg = registry.Registry(tempfile.mkdtemp(prefix="scoreiq-bench-"))
+    X, y = loader.synthetic_training_set()
+    reg.set_golden(X[:1000], y[:1000])
+    src = os.path.join(reg.root, "src.npz")
+    artifact.save(scorer, src)
+    reg.publish(src, "v1")
+    reg.publish(src, "v2", shadow=1.0)
+    live = registry.LiveModel(reg)
+    flip = iter(["v2", "v1"] * (1 << 20))
+
+    def swap():
+        reg.activate(next(flip))
+        live.refresh()
+    offer = timeit(lambda: live.offer(PROFILE, [70.0]))
+    live.close()
+    return {"registry_swap": {"s": timeit(swap)}, "shadow_offer": {"s": offer}}
+
+
+def bench_drift(scorer):
+    """Per-request hand-off to the drift worker, its histogram update, and a full PSI / KS report."""
+    mon = drift.DriftMonitor()
+    X = random_rows(1_000_000)
+    hist = drift.Histograms()
+    for _ in range(1000):
+        mon.observe(PROFILE)
+    return {
+        "drift_observe": {"s": timeit(lambda: mon.observe(PROFILE))},
+        "drift_histogram_1000000": {"s": timeit(lambda: hist.add(X), repeat=5)},
+        "drift_report": {"s": timeit(lambda: mon.report(scorer))},
+    }
+
+
+def bench_synth(scorer):
+    """Synthetic cohort generation, and the file-based batch scoring and training it feeds."""
+    n = 1_000_000
+    res = {"synth_matrix_1000000": {"s": timeit(lambda: synth.matrix(0, n), repeat=3)}}
+    with tempfile.TemporaryDirectory() as d:
+        src = os.path.join(d, "cohort.parquet")
+        t = time.perf_counter(); synth.write(src, n, progress=None); s = time.perf_counter() - t
+        res["synth_parquet_1000000"] = {"s": s, "rows_per_s": n / s}
+        t = time.perf_counter()
+        batch.run(src, os.path.join(d, "scored.parquet"), scorer=scorer, progress=None)
+        s = time.perf_counter() - t
+        res["batch_parquet_1000000"] = {"s": s, "rows_per_s": n / s}
+        t = time.perf_counter(); train.accumulate(batch.read_chunks(src)); s = time.perf_counter() - t
+        res["train_parquet_1000000"] = {"s": s, "rows_per_s": n / s}
+    return res
+
+
+def bench_pages():
+    from streamlit.testing.v1 import AppTest
+    res = {}
+    for page in ("predict", "simulator", "analytics", "about"):
+        at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=120)
+        at.query_params["page"] = page
+        at.run()
+        samples = []
+        for _ in range(5):
+            t = time.perf_counter(); at.run(); samples.append(time.perf_counter() - t)
+        if at.exception:
+            raise RuntimeError(f"{page}: {at.exception[0].value}")
+        res[f"rerun_{page}"] = {"s": statistics.median(samples)}
+    return res
+
+
+def run(selected):
+    scorer = loader.load_model()
+    groups = [bench_scoring, bench_percentile, bench_pages_math, bench_quadratic, bench_plan, bench_load, bench_shared, bench_registry, bench_drift,
+              bench_synth, bench_pages]
+    results = {}
+    for g in groups:
+        name = g.__name__.removeprefix("bench_")
+        if selected and not any(k in name for k in selected):
+            continue
+        results.update(g(scorer) if g is not bench_pages else g())
+    return results
+
+
+def fmt(s):
+    return f"{s*1e6:9.1f} µs" if s < 1e-3 else f"{s*1e3:9.2f} ms" if s < 1 else f"{s:9.2f} s "
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="ScoreIQ benchmark suite")
+    ap.add_argument("-k", action="append", default=[], help="only groups whose name contains this "
+                    "(scoring, percentile, pages_math, quadratic, plan, load, shared, registry, drift, synth, pages)")
+    ap.add_argument("--update", action="store_true", help="merge results into the baseline")
+    ap.add_argument("--threshold", type=float, default=1.5, help="allowed slowdown vs baseline")
+    ap.add_argument("--micro-threshold", type=float, default=2.0, help=f"allowed slowdown for cases under {MICRO*1e6:.0f} µs")
+    ap.add_argument("--noise", type=float, default=NOISE, help="slowdowns under this many seconds always pass")
+    args = ap.parse_args(argv)
+
+    results = run(args.k)
+    base = json.load(open(BASELINE)) if os.path.exists(BASELINE) else {}
+    failed = []
+    for name, r in results.items():
+        extra = f"  {r['rows_per_s']:>14,.0f} rows/s" if "rows_per_s" in r else ""
+        line = f"{name:<36} {fmt(r['s'])}{extra}"
+        if name in base and not args.update:
+            ratio = r["s"] / base[name]["s"]
+            limit = args.micro_threshold if base[name]["s"] < MICRO else args.threshold
+            bad = ratio > limit and r["s"] - base[name]["s"] > args.noise
+            line += f"   {ratio:5.2f}x {'FAIL' if bad else 'ok'}"
+            if bad:
+                failed.append(name)
+        if name in LIMITS and r["s"] > LIMITS[name]:
+            line += f"   over the {fmt(LIMITS[name]).strip()} limit FAIL"
+            failed.append(name)
+        print(line)
+
+    if args.update:
+        base.update(results)
+        with open(BASELINE, "w") as f:
+            json.dump(base, f, indent=2, sort_keys=True)
+            f.write("\n")
+        print(f"baseline written: {os.path.relpath(BASELINE, ROOT)}")
+        return 1 if failed else 0
+    if failed:
+        print(f"{len(failed)} regression(s) over {args.threshold:.2f}x or their limit: {', '.join(failed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
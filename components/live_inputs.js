@@ -0,0 +1,138 @@
+// ScoreIQ — live inputs
+// The Predict page's profile form. Every input event re-scores the profile in
+// the browser with the model terms from scoreiq/client.py (same formula, clip
+// and grade bands as the server); the profile goes back to the server, which
+// reruns the page's fragment, only when a control is released.
+
+function raw(m, x) {
+  let s = m.intercept;
+  for (let i = 0; i < x.length; i++) s += m.coef[i] * x[i];
+  if (m.Q) {
+    for (let i = 0; i < x.length; i++) {
+      let r = 0;
+      for (let j = 0; j < x.length; j++) r += m.Q[i][j] * x[j];
+      s += x[i] * r;
+    }
+  }
+  return s;
+}
+
+function score(m, x) {
+  return Math.min(Math.max(raw(m, x), m.lo), m.hi);
+}
+
+// grade_info(): first band whose floor the score reaches, else the last band
+function band(bands, s) {
+  for (const b of bands) if (s >= b[0]) return b;
+  return bands[bands.length - 1];
+}
+
+function control(spec) {
+  const wrap = document.createElement("label");
+  wrap.className = "siq-field";
+  const head = document.createElement("div");
+  head.className = "siq-label";
+  head.innerHTML = `<span></span><span class="siq-val"></span>`;
+  head.firstChild.textContent = spec.label;
+  let el;
+  if (spec.options) {
+    el = document.createElement("select");
+    for (const [text, code] of spec.options) {
+      const o = document.createElement("option");
+      o.value = code;
+      o.textContent = text;
+      el.appendChild(o);
+    }
+  } else {
+    el = document.createElement("input");
+    el.type = "range";
+    el.min = spec.lo;
+    el.max = spec.hi;
+    el.step = 1;
+  }
+  el.dataset.feature = spec.name;
+  el.value = spec.value;
+  wrap.append(head, el);
+  return wrap;
+}
+
+function build(root, inputs, layout) {
+  const byName = Object.fromEntries(inputs.map((s) => [s.name, s]));
+  root.innerHTML = "";
+  for (const [title, names] of layout) {
+    const sec = document.createElement("div");
+    sec.className = "siq-sec";
+    sec.textContent = title;
+    const card = document.createElement("div");
+    card.className = "siq-card";
+    card.style.gridTemplateColumns = `repeat(${names.length}, minmax(0, 1fr))`;
+    for (const n of names) card.appendChild(control(byName[n]));
+    root.append(sec, card);
+  }
+  const live = document.createElement("div");
+  live.className = "siq-live";
+  live.innerHTML = `
+    <div class="siq-score"><span class="siq-num"></span><span class="siq-of">live estimate</span></div>
+    <span class="siq-badge"></span>
+    <svg class="siq-curve" viewBox="0 0 240 56" preserveAspectRatio="none">
+      <path class="siq-area"></path><path class="siq-line"></path><line class="siq-mark" y1="0" y2="56"></line>
+    </svg>
+    <div class="siq-hint">Full results update when you release a control.</div>`;
+  root.appendChild(live);
+}
+
+export default function (component) {
+  const { data, parentElement, setStateValue } = component;
+  const { model, bands, inputs, layout, values, curve } = data;
+  const root = parentElement.querySelector(".siq");
+  const shape = JSON.stringify(layout);
+  if (root.dataset.layout !== shape) {
+    build(root, inputs, layout);
+    root.dataset.layout = shape;
+  }
+  const els = inputs.map((s) => root.querySelector(`[data-feature="${s.name}"]`));
+
+  // apply the server's profile only when it changed there, never over a control in use
+  const sent = JSON.stringify(values);
+  if (root.dataset.values !== sent) {
+    const active = parentElement.activeElement || document.activeElement;
+    inputs.forEach((s, i) => { if (els[i] !== active) els[i].value = values[s.name]; });
+    root.dataset.values = sent;
+  }
+
+  const profile = () => Object.fromEntries(inputs.map((s, i) => [s.name, Number(els[i].value)]));
+
+  const update = () => {
+    const x = els.map((el) => Number(el.value));
+    const s = score(model, x);
+    const [, letter, colour, bg, border] = band(bands, s);
+    root.querySelector(".siq-num").textContent = s.toFixed(1);
+    const badge = root.querySelector(".siq-badge");
+    badge.textContent = `● Grade ${letter}`;
+    Object.assign(badge.style, { color: colour, background: bg, borderColor: border });
+    inputs.forEach((spec, i) => {
+      const v = els[i].parentElement.querySelector(".siq-val");
+      v.textContent = spec.options ? "" : els[i].value;
+    });
+
+    // study-hours curve over the same base profile as the server's chart
+    const base = x.slice();
+    for (const [j, v] of curve.fixed) base[j] = v;
+    const xs = curve.xs, x0 = xs[0], x1 = xs[xs.length - 1];
+    const px = (v) => (240 * (v - x0)) / (x1 - x0);
+    const py = (v) => 56 - (56 * (v - curve.range[0])) / (curve.range[1] - curve.range[0]);
+    const pts = xs.map((h) => { base[curve.index] = h; return `${px(h).toFixed(1)},${py(score(model, base)).toFixed(1)}`; });
+    root.querySelector(".siq-line").setAttribute("d", `M${pts.join("L")}`);
+    root.querySelector(".siq-area").setAttribute("d", `M${px(x0)},56L${pts.join("L")}L${px(x1)},56Z`);
+    const mark = root.querySelector(".siq-mark");
+    const h = px(x[curve.index]);
+    mark.setAttribute("x1", h);
+    mark.setAttribute("x2", h);
+  };
+
+  els.forEach((el) => {
+    el.oninput = update;
+    el.onchange = () => setStateValue("profile", profile());   // release: one server round-trip
+  });
+  update();
+}
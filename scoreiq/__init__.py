@@ -0,0 +1,12 @@
+"""
+ScoreIQ — Academic Performance Intelligence
+Model-side building blocks shared by the Streamlit app and offline tools.
+"""
+
+from .engine import (FEATURES, N_FEATURES, SCORE_MIN, SCORE_MAX, LinearScorer, QuadraticScorer,
+                     as_matrix, vary)
+
+__all__ = [
+    "FEATURES", "N_FEATURES", "SCORE_MIN", "SCORE_MAX",
+    "LinearScorer", "QuadraticScorer", "as_matrix", "vary",
+]
@@ -0,0 +1,21 @@
+"""
+ScoreIQ command line
+Run: python -m scoreiq <command> --help
+"""
+
+import argparse, sys
+
+from . import batch, compare, drift, registry, shared, synth, train, tuning
+
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(prog="scoreiq", description="ScoreIQ offline tools")
+    sub = ap.add_subparsers(dest="command", required=True)
+    for mod in (batch, train, tuning, compare, registry, shared, drift, synth):
+        mod.add_parser(sub)
+    args = ap.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""
+ScoreIQ — model artifact
+A small, versioned .npz holding the folded model: coefficients (plus the
+quadratic form Q for the degree-2 polynomial model), intercept, clip bounds,
+feature order, the training mean (when known) and a checksum. Optionally
+carries a percentile index of a reference cohort's scores and that cohort's
+input histograms (the drift reference), each checksummed on its own so
+updating them leaves the model checksum alone. Loads with NumPy alone —
+no sklearn import and no pickle execution.
+"""
+
+import hashlib, os, zipfile
+
+import numpy as np
+
+from .drift import Histograms
+from .engine import LinearScorer, QuadraticScorer
+from .percentile import ScoreIndex
+
+ARTIFACT_VERSION = 1
+DEFAULT_PATH = "student_model.npz"
+KINDS = {cls.kind: cls for cls in (LinearScorer, QuadraticScorer)}
+
+
+class ArtifactError(ValueError):
+    """Raised when an artifact is malformed, from an unknown version or fails its checksum."""
+
+
+def checksum(scorer):
+    """SHA-256 over everything that determines a scorer's output."""
+    h = hashlib.sha256()
+    h.update(f"v{ARTIFACT_VERSION}:{scorer.kind}:".encode())
+    h.update("\x1f".join(scorer.features).encode())
+    h.update(np.asarray(scorer.coef, dtype="<f8").tobytes())
+    if getattr(scorer, "Q", None) is not None:
+        h.update(b"Q:" + np.asarray(scorer.Q, dtype="<f8").tobytes())
+    h.update(np.asarray([scorer.intercept, scorer.lo, scorer.hi], dtype="<f8").tobytes())
+    if getattr(scorer, "mean", None) is not None:   # attribution reference
+        h.update(b"mean:" + np.asarray(scorer.mean, dtype="<f8").tobytes())
+    return h.hexdigest()
+
+
+def _digest(tag, *arrays):
+    h = hashlib.sha256(tag.encode())
+    for a in arrays:
+        h.update(np.asarray(a, dtype="<i8").tobytes())
+    return h.hexdigest()
+
+
+def cohort_checksum(index):
+    return _digest(f"cohort:{index.resolution!r}:", index.keys, index.counts)
+
+
+def inputs_checksum(hist):
+    return _digest("inputs:", hist.counts)
+
+
+def save(scorer, path=DEFAULT_PATH):
+    """Write `scorer` (and its cohort index, if any) to `path` atomically; returns its checksum."""
+    digest = checksum(scorer)
+    extra = {k: np.asarray(getattr(scorer, k), dtype=np.float64)
+             for k in ("Q", "mean") if getattr(scorer, k, None) is not None}
+    if scorer.cohort is not None:
+        extra.update({f"cohort_{k}": v for k, v in scorer.cohort.to_arrays().items()},
+                     cohort_checksum=np.str_(cohort_checksum(scorer.cohort)))
+    if scorer.inputs is not None:
+        extra.update(inputs_counts=scorer.inputs.counts, inputs_checksum=np.str_(inputs_checksum(scorer.inputs)))
+    tmp = f"{path}.tmp"
+    with open(tmp, "wb") as f:
+        np.savez(
+            f,
+            **extra,
+            version=np.int64(ARTIFACT_VERSION),
+            kind=np.str_(scorer.kind),
+            features=np.array(scorer.features),
+            coef=np.asarray(scorer.coef, dtype=np.float64),
+            intercept=np.float64(scorer.intercept),
+            bounds=np.array([scorer.lo, scorer.hi], dtype=np.float64),
+            checksum=np.str_(digest),
+        )
+    os.replace(tmp, path)
+    return digest
+
+
+def export(model, scaler, path=DEFAULT_PATH, lo=None, hi=None, poly=None, cohort=None):
+    """Fold a fitted sklearn scaler (+ PolynomialFeatures) + linear model and save it as an artifact.
+
+    `cohort` is an optional (N, 12) reference matrix whose scores become the percentile
+    index and whose inputs become the drift reference.
+    """
+    bounds = {k: v for k, v in (("lo", lo), ("hi", hi)) if v is not None}
+    if poly is not None:
+        scorer = QuadraticScorer.from_sklearn(model, poly, scaler, **bounds)
+    else:
+        scorer = LinearScorer.from_sklearn(model, scaler, **bounds)
+    if cohort is not None:
+        cohort = np.asarray(cohort, dtype=np.float64)
+        scorer.cohort = ScoreIndex.from_scores(scorer.predict(cohort))
+        scorer.inputs = Histograms.from_rows(cohort)
+    return save(scorer, path)
+
+
+def save_cohort(path, index):
+    """Replace the cohort index stored in the artifact at `path`; the model checksum is unchanged."""
+    scorer = load(path)
+    scorer.cohort = index
+    return save(scorer, path)
+
+
+def load(path=DEFAULT_PATH, features=None):
+    """Read and verify an artifact, optionally requiring a given feature order."""
+    try:
+        with np.load(path, allow_pickle=False) as z:
+            data = {k: z[k] for k in z.files}
+    except (OSError, ValueError, EOFError, zipfile.BadZipFile) as e:   # missing, truncated or not an npz
+        raise ArtifactError(f"{path}: unreadable model artifact ({e})") from e
+
+    missing = {"version", "kind", "features", "coef", "intercept", "bounds", "checksum"} - data.keys()
+    if missing:
+        raise ArtifactError(f"{path}: missing fields {sorted(missing)}")
+    version = int(data["version"])
+    if version != ARTIFACT_VERSION:
+        raise ArtifactError(f"{path}: artifact version {version}, expected {ARTIFACT_VERSION}")
+    kind = str(data["kind"])
+    if kind not in KINDS:
+        raise ArtifactError(f"{path}: unsupported model kind {kind!r}")
+    if kind == QuadraticScorer.kind and "Q" not in data:
+        raise ArtifactError(f"{path}: missing fields ['Q']")
+
+    lo, hi = data["bounds"].tolist()
+    terms = (data["coef"], data["Q"]) if kind == QuadraticScorer.kind else (data["coef"],)
+    try:
+        scorer = KINDS[kind](*terms, float(data["intercept"]), lo, hi,
+                             features=[str(f) for f in data["features"]], mean=data.get("mean"))
+    except ValueError as e:
+        raise ArtifactError(f"{path}: {e}") from e
+    digest = checksum(scorer)
+    if digest != str(data["checksum"]):
+        raise ArtifactError(f"{path}: checksum mismatch")
+    if features is not None and scorer.features != tuple(features):
+        raise ArtifactError(f"{path}: feature order {list(scorer.features)} does not match {list(features)}")
+    if "cohort_keys" in data:
+        try:
+            index = ScoreIndex(data["cohort_keys"], data["cohort_counts"], float(data["cohort_resolution"]))
+        except (KeyError, ValueError) as e:
+            raise ArtifactError(f"{path}: bad cohort index ({e})") from e
+        if cohort_checksum(index) != str(data.get("cohort_checksum")):
+            raise ArtifactError(f"{path}: cohort index checksum mismatch")
+        scorer.cohort = index
+    if "inputs_counts" in data:
+        try:
+            hist = Histograms(data["inputs_counts"])
+        except ValueError as e:
+            raise ArtifactError(f"{path}: bad input histograms ({e})") from e
+        if inputs_checksum(hist) != str(data.get("inputs_checksum")):
+            raise ArtifactError(f"{path}: input histogram checksum mismatch")
+        scorer.inputs = hist
+    return scorer
@@ -0,0 +1,258 @@
+"""
+ScoreIQ — cohort batch scoring
+Streams a CSV / Parquet roster in fixed-size chunks, encodes it with the
+notebook's category maps, scores every chunk in one pass and appends scores,
+grades, cohort percentiles and top drivers to the output as it goes. Memory
+is bounded by chunk size × in-flight chunks, whatever the file size. Each
+chunk also returns a percentile index of its scores; merged, they can fold
+the run into the model's reference cohort.
+
+Run: python -m scoreiq batch roster.csv -o scored.csv --chunk-size 100000 --workers 8
+"""
+
+import os, sys, time
+from collections import deque
+
+import numpy as np
+
+from . import artifact, attribution, counterfactual, loader
+from .engine import FEATURES
+from .percentile import ScoreIndex
+from .profile import CATEGORY_MAPS, GRADE_BANDS, grades
+
+CHUNK_SIZE = 100_000
+TOP_K = 3
+
+
+# ── I/O ────────────────────────────────────────────────────────
+def _is_parquet(path):
+    return os.path.splitext(path)[1].lower() in (".parquet", ".pq")
+
+
+def read_chunks(path, chunk_size=CHUNK_SIZE):
+    """Yield DataFrames of at most `chunk_size` rows from a CSV or Parquet file."""
+    if _is_parquet(path):
+        import pyarrow.parquet as pq
+        for rb in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield rb.to_pandas()
+    else:
+        import pandas as pd
+        yield from pd.read_csv(path, chunksize=chunk_size)
+
+
+def _arrow_type(name, col):
+    """Column type that does not depend on the chunk's values: appended columns are fixed,
+    input columns that hold text or are entirely empty are strings, the rest as inferred."""
+    import pyarrow as pa
+    if name in ("score", "percentile", "plan_effort", "plan_score") or name.endswith("_pts") \
+            or name[5:] in FEATURES and name.startswith("plan_"):
+        return pa.float64()
+    if name in ("grade", "plan", "plan_target") or name.startswith("driver_"):
+        return pa.string()
+    if name == "plan_feasible":
+        return pa.bool_()
+    if col.dtype == object or col.isna().all():
+        return pa.string()
+    return None
+
+
+def serialize(df, parquet):
+    """Encode a scored chunk for ChunkWriter; done in the workers, off the writer's thread."""
+    if parquet:
+        import pyarrow as pa
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        return table.cast(pa.schema([pa.field(f.name, _arrow_type(f.name, df[f.name]) or f.type)
+                                     for f in table.schema]))
+    return df.to_csv(index=False)
+
+
+class ChunkWriter:
+    """Appends serialized chunks to a CSV or Parquet file.
+
+    A Parquet file keeps the first chunk's schema; later chunks are cast to it.
+    """
+
+    def __init__(self, path):
+        self.path, self.parquet = path, _is_parquet(path)
+        self.writer = None if self.parquet else open(path, "w", newline="")
+        self.schema = None
+        self.first = True
+
+    def write(self, payload):
+        if self.parquet:
+            import pyarrow.parquet as pq
+            if self.writer is None:
+                self.schema = payload.schema
+                self.writer = pq.ParquetWriter(self.path, self.schema)
+            elif not payload.schema.equals(self.schema):
+                payload = payload.cast(self.schema)   # e.g. int in one chunk, float with NaN in the next
+            self.writer.write_table(payload)
+        else:
+            # every chunk carries its header line; keep only the first one
+            self.writer.write(payload if self.first else payload[payload.index("\n") + 1:])
+        self.first = False
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+
+
+# ── ENCODING / SCORING ─────────────────────────────────────────
+def encode_frame(df):
+    """(N, 12) float matrix for a roster frame; unknown or missing cells become NaN."""
+    missing = [f for f in FEATURES if f not in df.columns]
+    if missing:
+        raise ValueError(f"input is missing columns {missing}")
+    import pandas as pd
+    X = np.empty((len(df), len(FEATURES)), dtype=np.float64)
+    for j, f in enumerate(FEATURES):
+        col = df[f]
+        if f in CATEGORY_MAPS and not pd.api.types.is_numeric_dtype(col):
+            col = col.map(CATEGORY_MAPS[f])
+        X[:, j] = pd.to_numeric(col, errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+    return X
+
+
+def top_drivers(scorer, X, k=TOP_K):
+    """Indices and point effects of the k largest attributions vs the training mean."""
+    return attribution.top(attribution.attribute(scorer, X), k)
+
+
+def plan_columns(scorer, X, target):
+    """Least-effort plan to `target` per row: notches per actionable input, effort, score, ranked text."""
+    p = counterfactual.plan(scorer, X, target)
+    cols = {f"plan_{f}": p["delta"][:, j] for j, f in enumerate(p["features"])}
+    cols.update(plan_feasible=p["feasible"], plan_effort=np.round(p["effort"], 2),
+                plan_score=np.round(p["score"], 2))
+    cols["plan"] = ["; ".join(f"{f} {d:+d} ({g:+.1f})" for f, d, g in counterfactual.ranked(p, i))
+                    for i in range(len(X))]
+    return cols
+
+
+def score_frame(scorer, df, k=TOP_K, target=None):
+    """`df` with score, grade and top-k driver columns appended; invalid rows get no score.
+
+    With a `target` grade, also appends the least-effort plan to reach it.
+    """
+    X = encode_frame(df)
+    valid = ~np.isnan(X).any(axis=1)
+    out = df.copy()
+    scores = np.full(len(df), np.nan)
+    letters = np.full(len(df), "", dtype=object)
+    names = np.full((len(df), k), "", dtype=object)
+    effects = np.full((len(df), k), np.nan)
+    if valid.any():
+        Xv = X[valid]
+        scores[valid] = np.round(scorer.predict(Xv), 2)
+        letters[valid] = grades(scores[valid])
+        idx, eff = top_drivers(scorer, Xv, k)
+        names[valid] = np.asarray(FEATURES, dtype=object)[idx]
+        effects[valid] = np.round(eff, 2)
+    out["score"], out["grade"] = scores, letters
+    if scorer.cohort is not None:
+        out["percentile"] = np.round(scorer.cohort.rank(scores), 1)   # NaN stays NaN
+    for i in range(k):
+        out[f"driver_{i+1}"], out[f"driver_{i+1}_pts"] = names[:, i], effects[:, i]
+    if target is not None:
+        # typed even when no row is valid: nullable boolean, float notches / effort / score, string plan
+        import pandas as pd
+        out["plan_target"] = pd.array([target] * len(df), dtype="string")
+        for name, col in plan_columns(scorer, X[valid], target).items():
+            if name == "plan_feasible":
+                full = pd.array([pd.NA] * len(df), dtype="boolean")
+            elif name == "plan":
+                full = pd.array([""] * len(df), dtype="string")
+            else:
+                full = np.full(len(df), np.nan)
+            full[valid] = col
+            out[name] = full
+    return out
+
+
+# ── WORKERS ────────────────────────────────────────────────────
+_worker_scorer = None
+
+def _init_worker(scorer):
+    global _worker_scorer
+    _worker_scorer = scorer
+
+def _score_chunk(df, k, parquet, scorer=None, target=None):
+    out = score_frame(scorer or _worker_scorer, df, k, target)
+    return (serialize(out, parquet), len(out), int(out["score"].isna().sum()),
+            ScoreIndex.from_scores(out["score"].to_numpy()))
+
+
+def run(src, dst, chunk_size=CHUNK_SIZE, workers=1, k=TOP_K, scorer=None, progress=sys.stderr,
+        target=None):
+    """Score `src` into `dst`; returns (rows, invalid rows, seconds, ScoreIndex of the run's scores)."""
+    scorer = scorer or loader.load_model()
+    writer = ChunkWriter(dst)
+    rows = invalid = 0
+    index = ScoreIndex()
+    t0 = time.perf_counter()
+
+    def done(result):
+        nonlocal rows, invalid, index
+        payload, n, bad, part = result
+        writer.write(payload)
+        rows += n; invalid += bad
+        index = index.merge(part)
+        if progress:
+            dt = time.perf_counter() - t0
+            print(f"\r  {rows:>12,} rows · {rows/max(dt,1e-9):>10,.0f} rows/s · {invalid:,} invalid",
+                  end="", file=progress, flush=True)
+
+    try:
+        if workers <= 1:
+            for df in read_chunks(src, chunk_size):
+                done(_score_chunk(df, k, writer.parquet, scorer, target))
+        else:
+            import multiprocessing as mp
+            with mp.get_context("spawn").Pool(workers, _init_worker, (scorer,)) as pool:
+                pending = deque()   # ordered, at most 2 chunks in flight per worker
+                for df in read_chunks(src, chunk_size):
+                    pending.append(pool.apply_async(_score_chunk, (df, k, writer.parquet, None, target)))
+                    while len(pending) >= 2 * workers:
+                        done(pending.popleft().get())
+                while pending:
+                    done(pending.popleft().get())
+    finally:
+        writer.close()
+    if progress:
+        print(file=progress)
+    return rows, invalid, time.perf_counter() - t0, index
+
+
+# ── CLI ────────────────────────────────────────────────────────
+def add_parser(sub):
+    p = sub.add_parser("batch", help="score a CSV / Parquet roster in streaming chunks")
+    p.add_argument("src", help="input .csv or .parquet")
+    p.add_argument("-o", "--output", required=True, help="output .csv or .parquet")
+    p.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    p.add_argument("--workers", type=int, default=1, help="processes (0 = all cores)")
+    p.add_argument("--top", type=int, default=TOP_K, help="drivers reported per student")
+    p.add_argument("--target", choices=[b[1] for b in GRADE_BANDS[:-1]],
+                   help="grade to plan for: least-effort changes per student")
+    p.add_argument("--update-cohort", action="store_true",
+                   help="fold this run's scores into the model artifact's percentile index")
+    p.add_argument("--quiet", action="store_true")
+    p.set_defaults(func=main)
+
+
+def main(args):
+    workers = args.workers or os.cpu_count() or 1
+    rows, invalid, secs, index = run(args.src, args.output, args.chunk_size, workers, args.top,
+                                     progress=None if args.quiet else sys.stderr, target=args.target)
+    print(f"scored {rows:,} rows ({invalid:,} invalid) in {secs:.1f}s "
+          f"— {rows/max(secs,1e-9):,.0f} rows/s → {args.output}")
+    if args.update_cohort:
+        path = loader.model_path()
+        try:
+            old = artifact.load(path).cohort
+        except artifact.ArtifactError as e:
+            print(f"cannot update the cohort: {e}", file=sys.stderr)
+            return 1
+        merged = index if old is None else old.merge(index)
+        artifact.save_cohort(path, merged)
+        print(f"reference cohort: {merged.n:,} scores ({index.n:,} new) → {path}")
+    return 0
@@ -0,0 +1,96 @@
+"""
+ScoreIQ — prediction cache
+Bounded, thread-safe LRU for scores and derived results (scenario vectors,
+curves, grids), keyed on the encoded input profile. Bound to one model
+checksum: binding a different checksum empties it.
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+CACHE_SIZE = 4096
+
+
+def freeze(v):
+    """Hashable, canonical form of a profile / parameter structure."""
+    if isinstance(v, np.ndarray):
+        return tuple(v.tolist())
+    if isinstance(v, (list, tuple)):
+        return tuple(freeze(x) for x in v)
+    if isinstance(v, np.generic):
+        return v.item()
+    return v
+
+
+class PredictionCache:
+    """LRU mapping (namespace, frozen key) -> result, with hit / miss / eviction counters."""
+
+    def __init__(self, maxsize=CACHE_SIZE):
+        self.maxsize = maxsize
+        self.checksum = None
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def bind(self, checksum):
+        """Tie the cache to a model; a different checksum drops every entry."""
+        with self._lock:
+            if checksum != self.checksum:
+                if self.checksum is not None:
+                    self.invalidations += 1
+                self._data.clear()
+                self.checksum = checksum
+
+    def get(self, namespace, key, compute, checksum=None):
+        """Cached value for (namespace, key), computing and storing it on a miss.
+
+        `checksum` is the model the caller computes with (default: the bound one). When it is
+        not the bound model, the cache is bypassed: nothing is read from it or stored in it.
+        """
+        k = (namespace, freeze(key))
+        with self._lock:
+            if checksum is None:
+                checksum = self.checksum
+            if checksum == self.checksum and k in self._data:
+                self._data.move_to_end(k)
+                self.hits += 1
+                return self._data[k]
+            self.misses += 1
+        value = compute()
+        if isinstance(value, np.ndarray):
+            value.setflags(write=False)   # shared across sessions
+        if value is None:
+            return value   # nothing computed: never cached, so the next call tries again
+        with self._lock:
+            if checksum == self.checksum:   # computed with the bound model, which was not swapped meanwhile
+                self._data[k] = value
+                self._data.move_to_end(k)
+                while len(self._data) > self.maxsize:
+                    self._data.popitem(last=False)
+                    self.evictions += 1
+        return value
+
+    def preload(self, entries):
+        """Store precomputed (namespace, key, value) entries, as the least recently used ones."""
+        with self._lock:
+            for namespace, key, value in entries:
+                k = (namespace, freeze(key))
+                if k not in self._data and len(self._data) < self.maxsize:
+                    self._data[k] = value
+                    self._data.move_to_end(k, last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._data), "maxsize": self.maxsize,
+                "hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
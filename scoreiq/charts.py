@@ -0,0 +1,76 @@
+"""
+ScoreIQ — chart assembly
+Figures from a fixed layout per chart type plus the traces and the few
+layout fields that change on each rerun (titles, markers, ranges). Layout
+and traces are handed to Plotly as plain dicts without re-validation, and
+numeric series go out as float32 typed arrays: base64 in the spec instead of
+JSON number lists. Scatter traces switch to WebGL above WEBGL_POINTS points,
+and the active Plotly template is cut down to the trace types the app draws.
+Plotly is imported on first use.
+"""
+
+import functools
+
+import numpy as np
+
+WEBGL_POINTS = 1000
+TRACE_TYPES = ("bar", "heatmap", "scatter", "scattergl")
+
+
+@functools.lru_cache(maxsize=None)
+def template(name):
+    """Plotly template `name` with per-trace defaults only for TRACE_TYPES."""
+    import plotly.io as pio
+    t = pio.templates[name].to_plotly_json()
+    return {"layout": t.get("layout", {}),
+            "data": {k: v for k, v in t.get("data", {}).items() if k in TRACE_TYPES}}
+
+
+def merge(base, changes):
+    """`base` with `changes` applied recursively; `base` itself is never modified."""
+    out = dict(base)
+    for k, v in changes.items():
+        out[k] = merge(out[k], v) if isinstance(v, dict) and isinstance(out.get(k), dict) else v
+    return out
+
+
+def figure(layout, *traces, **changes):
+    """go.Figure of trace dicts over `layout` updated with `changes`, skipping validation."""
+    import plotly.graph_objects as go
+    import plotly.io as pio
+    lay = merge(layout, changes)
+    if "template" not in lay and pio.templates.default:
+        lay["template"] = template(pio.templates.default)
+    return go.Figure({"data": list(traces), "layout": lay}, _validate=False)
+
+
+def f32(a):
+    return np.asarray(a, dtype=np.float32)
+
+
+def _axis(a):
+    """Floats as float32; integers (Plotly already packs them small) and labels unchanged."""
+    arr = np.asarray(a)
+    return f32(arr) if arr.dtype.kind == "f" else a if arr.dtype.kind in "OUS" else arr
+
+
+def scatter(x, y, **kw):
+    """Scatter trace: typed-array x / y, drawn with WebGL when it has many points."""
+    x = _axis(x)
+    return dict(type="scattergl" if len(x) > WEBGL_POINTS else "scatter", x=x, y=_axis(y), **kw)
+
+
+def bar(x, y, **kw):
+    return dict(type="bar", x=_axis(x), y=_axis(y), **kw)
+
+
+def heatmap(x, y, z, **kw):
+    return dict(type="heatmap", x=_axis(x), y=_axis(y), z=f32(z), **kw)
+
+
+def vline(x, **line):
+    return dict(type="line", xref="x", yref="y domain", x0=x, x1=x, y0=0, y1=1, line=line)
+
+
+def hline(y, **line):
+    return dict(type="line", xref="x domain", yref="y", x0=0, x1=1, y0=y, y1=y, line=line)
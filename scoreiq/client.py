@@ -0,0 +1,50 @@
+"""
+ScoreIQ — client-side scoring
+The model and the input form as plain JSON for the browser component that
+scores on every slider event (components/live_inputs.js). The scorer is a few
+dozen numbers (linear) or under two hundred (folded degree-2), so the browser
+evaluates it exactly as engine does, and the server only sees the profile
+when a control is released.
+"""
+
+from .engine import FEATURES
+from .profile import BOUNDS, CATEGORY_MAPS, DEFAULTS, GRADE_BANDS, encode, encode_value
+
+
+def model(scorer):
+    """Scorer terms for the browser: clip(intercept + x·coef [+ xᵀQx], lo, hi)."""
+    out = {"kind": scorer.kind, "features": list(scorer.features), "coef": scorer.coef.tolist(),
+           "intercept": scorer.intercept, "lo": scorer.lo, "hi": scorer.hi}
+    if getattr(scorer, "Q", None) is not None:
+        out["Q"] = scorer.Q.tolist()
+    return out
+
+
+def grade_bands():
+    """GRADE_BANDS as JSON; the browser picks the first band whose floor the score reaches, like grade_info."""
+    return [list(b) for b in GRADE_BANDS]
+
+
+def inputs(labels):
+    """One control per feature in FEATURES order: a range (lo, hi) or the category options with their codes."""
+    out = []
+    for f in FEATURES:
+        spec = {"name": f, "label": labels[f], "lo": BOUNDS[f][0], "hi": BOUNDS[f][1],
+                "value": encode_value(f, DEFAULTS[f])}
+        if f in CATEGORY_MAPS:
+            spec["options"] = list(CATEGORY_MAPS[f].items())   # selectbox order: Low/Medium/High, Yes/No
+        out.append(spec)
+    return out
+
+
+def defaults():
+    """Encoded default profile, keyed by feature (the component's initial state)."""
+    return dict(zip(FEATURES, encode(DEFAULTS)))
+
+
+def decode(profile):
+    """Feature row for a profile the browser sent back; anything malformed falls back to the defaults."""
+    try:
+        return encode(profile or {})
+    except ValueError:
+        return encode(DEFAULTS)
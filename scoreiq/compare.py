@@ -0,0 +1,282 @@
+"""
+ScoreIQ — model comparison
+The notebook's "Train Multiple Models" step as a pipeline: every model × CV
+fold (plus the train → test fit) is one job on a process pool. Workers
+memory-map a single read-only copy of the prepared data, and finished jobs
+are cached by data hash, so a re-run only fits what changed. Emits the
+notebook's results_df metrics as JSON.
+
+Run: python -m scoreiq compare StudentPerformanceFactors.csv --workers 0 --json results.json
+"""
+
+import hashlib, json, os, sys, tempfile, time
+
+import numpy as np
+
+from .profile import BINARY_MAPS, ORDINAL_MAPS, YES_NO
+from .train import TARGET
+
+CV_FOLDS = 5
+CACHE_DIR = ".scoreiq-cache"
+
+# The notebook's full encodings (the app only serves the first twelve inputs).
+NB_ORDINAL_MAPS = {
+    **ORDINAL_MAPS,
+    "Distance_from_Home":       {"Near": 0, "Moderate": 1, "Far": 2},
+    "Peer_Influence":           {"Negative": 0, "Neutral": 1, "Positive": 2},
+    "Parental_Education_Level": {"High School": 0, "College": 1, "Postgraduate": 2},
+}
+NB_BINARY_MAPS = {
+    **BINARY_MAPS,
+    "Extracurricular_Activities": YES_NO,
+    "Learning_Disabilities":      YES_NO,
+    "Gender":                     {"Male": 1, "Female": 0},
+    "School_Type":                {"Private": 1, "Public": 0},
+}
+
+# (name, kind, params) — the notebook's `models` dict plus its polynomial pass
+CANDIDATES = [
+    ("Linear Regression",  "linear", {}),
+    ("Ridge Regression",   "ridge",  {"alpha": 1.0}),
+    ("Lasso Regression",   "lasso",  {"alpha": 0.1}),
+    ("Polynomial (deg=2)", "poly",   {"degree": 2, "alpha": 1.0}),
+]
+METRICS = ("R² Train", "R² Test", "MAE", "RMSE", "CV R² Mean", "CV R² Std")
+
+
+# ── DATA ───────────────────────────────────────────────────────
+def prepare(df, target=TARGET):
+    """The notebook's cleaning, encoding and feature engineering; returns (X, y) frames."""
+    df = df.copy()
+    for col in df.select_dtypes(include=np.number).columns:
+        df[col] = df[col].fillna(df[col].median())
+    for col in df.select_dtypes(include="object").columns:
+        df[col] = df[col].fillna(df[col].mode()[0])
+    df = df.drop_duplicates()
+    for col, mapping in {**NB_ORDINAL_MAPS, **NB_BINARY_MAPS}.items():
+        if col in df.columns:
+            df[col] = df[col].map(mapping)
+    df["Study_Efficiency"] = df["Hours_Studied"] * df["Attendance"] / 100
+    df["Wellbeing_Score"] = df["Sleep_Hours"] + df["Physical_Activity"]
+    df["Resource_Score"] = df["Access_to_Resources"] + df["Internet_Access"]
+    df["Support_Score"] = df["Parental_Involvement"] + df["Teacher_Quality"] + df["Tutoring_Sessions"]
+    features = [c for c in df.columns if c != target]
+    return df[features], df[target]
+
+
+def split(X, y, test_size=0.2, seed=42):
+    """Train/test split and train-fitted scaling, exactly as the notebook does it."""
+    from sklearn.model_selection import train_test_split
+    from sklearn.preprocessing import StandardScaler
+    X_tr, X_te, y_tr, y_te = train_test_split(X, y, test_size=test_size, random_state=seed)
+    sc = StandardScaler()
+    return {"X_train": sc.fit_transform(X_tr), "X_test": sc.transform(X_te),
+            "y_train": np.asarray(y_tr, dtype=np.float64), "y_test": np.asarray(y_te, dtype=np.float64)}
+
+
+def data_hash(data, folds=CV_FOLDS):
+    h = hashlib.sha256(f"folds={folds}".encode())
+    for k in sorted(data):
+        a = np.ascontiguousarray(data[k], dtype=np.float64)
+        h.update(k.encode()); h.update(str(a.shape).encode()); h.update(a.tobytes())
+    return h.hexdigest()
+
+
+def share(data, root):
+    """Write each array once as .npy under `root`; workers open them with mmap_mode='r'."""
+    os.makedirs(root, exist_ok=True)
+    for k, a in data.items():
+        path = os.path.join(root, k + ".npy")
+        if not os.path.exists(path):
+            tmp = path + f".{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                np.save(f, np.ascontiguousarray(a, dtype=np.float64))
+            os.replace(tmp, path)
+    return root
+
+
+# ── JOBS ───────────────────────────────────────────────────────
+def build(kind, params):
+    from sklearn.linear_model import Lasso, LinearRegression, Ridge
+    if kind == "linear":
+        return LinearRegression(**params)
+    if kind == "ridge":
+        return Ridge(**params)
+    if kind == "lasso":
+        return Lasso(**params)
+    if kind == "poly":
+        from sklearn.pipeline import make_pipeline
+        from sklearn.preprocessing import PolynomialFeatures
+        params = dict(params)
+        poly = PolynomialFeatures(degree=params.pop("degree", 2), include_bias=False)
+        return make_pipeline(poly, Ridge(**params))
+    raise ValueError(f"unknown model kind {kind!r} (linear, ridge, lasso, poly)")
+
+
+def spec_key(kind, params):
+    return hashlib.sha1(json.dumps([kind, params], sort_keys=True).encode()).hexdigest()[:12]
+
+
+_shared = None
+
+def _init_worker(root):
+    global _shared
+    _shared = {k: np.load(os.path.join(root, k + ".npy"), mmap_mode="r")
+               for k in ("X_train", "X_test", "y_train", "y_test")}
+
+
+def _fit_job(job):
+    """One fit: CV fold `fold` of the training rows, or fold None = train → test."""
+    kind, params, fold, folds = job
+    d = _shared
+    model = build(kind, params)
+    if fold is None:
+        model.fit(d["X_train"], d["y_train"])
+        return job, {"r2_train": model.score(d["X_train"], d["y_train"]),
+                     "pred": model.predict(d["X_test"])}
+    # KFold(n_splits=folds) without shuffling, as cross_val_score(cv=5) uses for regressors
+    held = np.array_split(np.arange(len(d["y_train"])), folds)[fold]
+    train = np.setdiff1d(np.arange(len(d["y_train"])), held, assume_unique=True)
+    model.fit(d["X_train"][train], d["y_train"][train])
+    return job, {"r2": model.score(d["X_train"][held], d["y_train"][held])}
+
+
+# ── FOLD CACHE ─────────────────────────────────────────────────
+def _cache_path(root, job):
+    kind, params, fold, _ = job
+    return os.path.join(root, f"{kind}-{spec_key(kind, params)}-{'test' if fold is None else fold}.npz")
+
+
+def _cache_get(root, job):
+    path = _cache_path(root, job)
+    if not os.path.exists(path):
+        return None
+    with np.load(path, allow_pickle=False) as z:
+        return {k: z[k] if z[k].ndim else float(z[k]) for k in z.files}
+
+
+def _cache_put(root, job, out):
+    path = _cache_path(root, job)
+    tmp = path + f".{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        np.savez(f, **out)
+    os.replace(tmp, path)
+
+
+# ── PIPELINE ───────────────────────────────────────────────────
+def _single_threaded_blas():
+    """Env for pool workers: one BLAS thread each, so N workers use N cores, not N²."""
+    return {k: "1" for k in ("OMP_NUM_THREADS", "OPENBLAS_NUM_THREADS", "MKL_NUM_THREADS")}
+
+
+def run(data, candidates=CANDIDATES, workers=1, folds=CV_FOLDS, cache_dir=CACHE_DIR):
+    """Fit every candidate × fold; returns (results rows, info dict)."""
+    from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score
+    t0 = time.perf_counter()
+    digest = data_hash(data, folds)
+    tmp = None
+    if cache_dir:
+        root = os.path.join(cache_dir, "compare", digest[:16])
+    else:
+        tmp = tempfile.TemporaryDirectory(prefix="scoreiq-compare-")
+        root = tmp.name
+    share(data, root)
+
+    jobs = [(kind, params, fold, folds) for _, kind, params in candidates
+            for fold in (None, *range(folds))]
+    done, todo = {}, []
+    for job in jobs:
+        hit = _cache_get(root, job) if cache_dir else None
+        if hit is None:
+            todo.append(job)
+        else:
+            done[_cache_path(root, job)] = hit
+
+    def collect(job, out):
+        if cache_dir:
+            _cache_put(root, job, out)
+        done[_cache_path(root, job)] = out
+
+    try:
+        if workers <= 1 or len(todo) <= 1:
+            _init_worker(root)
+            for job in todo:
+                collect(*_fit_job(job))
+        else:
+            import multiprocessing as mp
+            saved = {k: os.environ.get(k) for k in _single_threaded_blas()}
+            os.environ.update(_single_threaded_blas())
+            try:
+                pool = mp.get_context("spawn").Pool(min(workers, len(todo)), _init_worker, (root,))
+            finally:
+                for k, v in saved.items():
+                    os.environ.pop(k) if v is None else os.environ.__setitem__(k, v)
+            with pool:
+                for job, out in pool.imap_unordered(_fit_job, todo):
+                    collect(job, out)
+    finally:
+        if tmp:
+            tmp.cleanup()
+
+    y_te = np.asarray(data["y_test"], dtype=np.float64)
+    rows = []
+    for name, kind, params in candidates:
+        test = done[_cache_path(root, (kind, params, None, folds))]
+        cv = np.array([done[_cache_path(root, (kind, params, i, folds))]["r2"] for i in range(folds)])
+        pred = np.asarray(test["pred"])
+        rows.append({"Model": name, "R² Train": float(test["r2_train"]),
+                     "R² Test": r2_score(y_te, pred), "MAE": mean_absolute_error(y_te, pred),
+                     "RMSE": float(np.sqrt(mean_squared_error(y_te, pred))),
+                     "CV R² Mean": float(cv.mean()), "CV R² Std": float(cv.std()),
+                     "Predictions": pred})
+    info = {"data_sha256": digest, "jobs": len(jobs), "fitted": len(todo),
+            "cached": len(jobs) - len(todo), "workers": workers,
+            "seconds": time.perf_counter() - t0}
+    return rows, info
+
+
+# ── CLI ────────────────────────────────────────────────────────
+def parse_candidate(text):
+    """'ridge:alpha=10' / 'poly:degree=3,alpha=5' → (name, kind, params)."""
+    kind, _, rest = text.partition(":")
+    params = {}
+    for kv in filter(None, rest.split(",")):
+        k, _, v = kv.partition("=")
+        params[k.strip()] = int(v) if k.strip() == "degree" else float(v)
+    build(kind, params)   # fail fast on unknown kinds / parameters
+    label = ", ".join(f"{k}={v:g}" for k, v in params.items())
+    return (f"{kind}({label})" if label else kind), kind, params
+
+
+def add_parser(sub):
+    p = sub.add_parser("compare", help="cross-validate the candidate models in parallel")
+    p.add_argument("src", help=".csv / .parquet dataset with the notebook's columns")
+    p.add_argument("--candidate", action="append", type=parse_candidate, metavar="KIND[:K=V,...]",
+                   help="model to compare instead of the notebook's four (repeatable)")
+    p.add_argument("--folds", type=int, default=CV_FOLDS)
+    p.add_argument("--workers", type=int, default=1, help="processes (0 = all cores)")
+    p.add_argument("--cache-dir", default=CACHE_DIR)
+    p.add_argument("--no-cache", action="store_true")
+    p.add_argument("--target", default=TARGET)
+    p.add_argument("--json", help="write results_df metrics here")
+    p.set_defaults(func=main)
+
+
+def main(args):
+    from .batch import read_chunks
+    import pandas as pd
+    df = pd.concat(read_chunks(args.src), ignore_index=True)
+    data = split(*prepare(df, args.target))
+    workers = args.workers or os.cpu_count() or 1
+    rows, info = run(data, args.candidate or CANDIDATES, workers, args.folds,
+                     None if args.no_cache else args.cache_dir)
+    print(f"{'Model':<28}" + "".join(f"{m:>12}" for m in METRICS))
+    for r in rows:
+        print(f"{r['Model']:<28}" + "".join(f"{r[m]:>12.4f}" for m in METRICS))
+    print(f"{info['jobs']} jobs ({info['cached']} cached) on {workers} worker(s) in {info['seconds']:.2f}s",
+          file=sys.stderr)
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({**info, "results": [{k: v for k, v in r.items() if k != "Predictions"} for r in rows]},
+                      f, indent=2, ensure_ascii=False)
+    return 0
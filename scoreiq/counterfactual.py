@@ -0,0 +1,337 @@
+"""
+ScoreIQ — path to a target grade
+The least-effort change to the actionable inputs (study hours, attendance,
+sleep, tutoring) that lifts a profile into a target grade band. Steps are
+whole slider notches inside the slider bounds; fixed inputs never move.
+Linear scorers are solved exactly and vectorized over a whole cohort, and
+so are degree-2 ones, one actionable input in closed form; anything else is
+searched over the full actionable grid.
+"""
+
+import numpy as np
+
+from .engine import FEATURES, as_matrix
+from .profile import GRADE_BANDS, LOWER, UPPER
+from .sensitivity import GRID_CHUNK, is_linear, is_quadratic
+
+ACTIONABLE = ("Hours_Studied", "Attendance", "Sleep_Hours", "Tutoring_Sessions")
+# Effort of one slider notch, in rough hours-per-week equivalents: an hour of
+# study, 1% of ~35 class hours, an hour more sleep every night, one monthly session.
+EFFORT = {"Hours_Studied": 1.0, "Attendance": 0.35, "Sleep_Hours": 7.0, "Tutoring_Sessions": 0.5}
+PLAN_CHUNK = 512   # students per block on the linear path
+QUAD_CHUNK = 1024  # students per block on the quadratic path (× every combination of the other inputs)
+PLAN_BANDS = (1, 8, 64, 512, 4096)   # offsets per student searched before the quadratic path re-cuts, cheapest first
+_EPS = 1e-9
+
+
+def grade_floor(target):
+    """Minimum score of a grade letter ('A+', 'A', ...); numbers pass through."""
+    if not isinstance(target, str):
+        return float(target)
+    for floor, letter, *_ in GRADE_BANDS:
+        if letter == target:
+            return float(floor)
+    raise ValueError(f"unknown grade {target!r} (one of {', '.join(b[1] for b in GRADE_BANDS)})")
+
+
+def next_grade(score):
+    """Letter of the band above `score`, or None at the top band."""
+    above = [letter for floor, letter, *_ in GRADE_BANDS if floor > score]
+    return above[-1] if above else None
+
+
+def _steps(sizes):
+    """Every combination of 0..sizes[j] notches, as an (G, len(sizes)) int matrix."""
+    return np.indices([s + 1 for s in sizes]).reshape(len(sizes), -1).T
+
+
+# ── LINEAR: EXACT ──────────────────────────────────────────────
+def _plan_linear(scorer, X, floor, idx, cost):
+    c = scorer.coef[idx]
+    gain = np.abs(c)
+    up = c > 0
+    cap = np.where(up, UPPER[idx] - X[:, idx], X[:, idx] - LOWER[idx])
+    cap = np.where(gain > 0, np.floor(np.maximum(cap, 0)), 0)
+    need = floor - scorer.raw(X)
+    if floor - _EPS > scorer.hi:   # above the clipped range: no change reaches it
+        need[:] = np.inf
+
+    # Enumerate notches on every actionable input but one; the remaining one
+    # (widest range, cheapest per point on ties) takes exactly the notches still
+    # needed, so each block is a dense (students × combinations) argmin.
+    span = np.where(gain > 0, UPPER[idx] - LOWER[idx], -1)
+    free = int(np.lexsort((cost / np.maximum(gain, _EPS), -span))[0])
+    rest = [j for j in range(len(idx)) if j != free]
+    G = _steps(span[rest].clip(0).astype(int))
+    g_rest, c_rest = G @ gain[rest], G @ cost[rest] + _EPS * (G > 0).sum(axis=1)
+
+    steps = np.zeros((len(X), len(idx)))
+    ok = need <= _EPS                       # already there: no change
+    todo = np.flatnonzero(~ok)
+    for s in range(0, len(todo), PLAN_CHUNK):
+        rows = todo[s:s + PLAN_CHUNK]
+        # k = notches still needed on the free input after each combination
+        k = need[rows, None] - g_rest[None] - _EPS
+        np.maximum(k, 0, out=k)
+        if gain[free] > 0:
+            k /= gain[free]
+            np.ceil(k, out=k)
+        else:
+            k[k > 0] = np.inf
+        fits = k <= cap[rows, free, None]
+        for r, j in enumerate(rest):
+            fits &= G[:, r] <= cap[rows, j, None]
+        k *= cost[free]
+        k += c_rest[None]
+        np.copyto(k, np.inf, where=~fits)
+        best = k.argmin(axis=1)
+        hit = np.isfinite(k[np.arange(len(rows)), best])
+        ok[rows] = hit
+        steps[rows[:, None], rest] = G[best]
+        if gain[free] > 0:
+            left = np.maximum(need[rows] - g_rest[best] - _EPS, 0)
+            steps[rows, free] = np.where(hit, np.ceil(left / gain[free]), 0)
+    # out of reach: report the closest the actionable inputs can get
+    miss = ~ok
+    steps[miss] = cap[miss]
+    return np.where(up, steps, -steps), ok
+
+
+# ── QUADRATIC: ONE INPUT IN CLOSED FORM ───────────────────────
+def _nearest(a, b, c, x, lo, hi):
+    """Integer h in [lo, hi] nearest x with a·h² + b·h + c ≥ 0 (NaN where there is none)."""
+    h0 = np.clip(x, lo, hi)
+    sq = np.sqrt(np.maximum(b * b - 4 * a * c, 0))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        if a > _EPS:     # feasible outside the roots: the integers just past them
+            cands = [h0, np.floor((-b - sq) / (2 * a)), np.ceil((-b + sq) / (2 * a))]
+        elif a < -_EPS:  # feasible between the roots: the integers just inside them
+            cands = [h0, np.ceil((-b + sq) / (2 * a)), np.floor((-b - sq) / (2 * a))]
+        else:
+            cands = [h0, np.ceil(-c / b), np.floor(-c / b)]
+    best, dist = np.full(np.shape(c), np.nan), np.full(np.shape(c), np.inf)
+    for h in cands:
+        d = np.abs(h - x)
+        fits = (h >= lo) & (h <= hi) & ((a * h + b) * h + c >= 0) & (d < dist)
+        best[fits], dist[fits] = h[fits], d[fits]
+    return best
+
+
+def _offsets(cost, spans):
+    """Every offset of the enumerated inputs within ±span, cheapest first, with its effort."""
+    D = np.stack(np.meshgrid(*[np.arange(-s, s + 1) for s in spans], indexing="ij"), axis=-1)
+    D = D.reshape(-1, len(spans))
+    e = np.abs(D) @ cost
+    order = np.argsort(e, kind="stable")
+    return D[order], e[order]
+
+
+def _ceiling(scorer, u, idx):
+    """Upper bound on the raw score over every setting of the actionable inputs, per profile.
+
+    raw(u + y) = raw(u) + Σ_j (w_j + 2(Qu)_j) y_j + Q_jj y_j² + Σ_{j<l} 2 Q_jl y_j y_l, bounded
+    term by term: each 1-D part at its range ends or vertex, each cross term at a box corner.
+    """
+    Q, lo, hi = scorer.Q, LOWER[idx], UPPER[idx]
+    p = scorer.coef[idx] + 2 * (u @ Q)[:, idx]
+    q = np.diag(Q)[idx]
+    top = np.clip(-p / (2 * np.where(q < 0, q, -1)), lo, hi)   # vertex of the concave ones, else an end
+    ub = scorer.raw(u) + sum(np.maximum.reduce([p[:, j] * y + q[j] * y * y for y in (lo[j], hi[j], top[:, j])])
+                             for j in range(len(idx)))
+    for j in range(len(idx)):
+        for l in range(j + 1, len(idx)):
+            ub += max(2 * Q[idx[j], idx[l]] * y * z for y in (lo[j], hi[j]) for z in (lo[l], hi[l]))
+    return ub
+
+
+def _plan_quadratic(scorer, X, floor, idx, cost):
+    # The input with the most notches per unit of effort is left free (h); for every
+    # combination v of the others the raw score is a·h² + b·h + c, with (u: the profile, actionable inputs zeroed)
+    #   c = raw(u) + w_R·v + vᵀQ_RR v + 2 v·(Qu)_R,   b = w_f + 2(Qu)_f + 2 Q_fR·v,   a = Q_ff
+    # so the nearest notch of h reaching `floor` is a rounded root. Each student walks the
+    # offsets of v cheapest first, in bands, and stops at the first offset that already
+    # costs more than the best plan found; inputs that can only help one way are searched
+    # that way only, and students whose score ceiling misses the target never search.
+    goal = floor - _EPS
+    delta = np.zeros((len(X), len(idx)))
+    if goal <= scorer.lo:
+        return delta, np.ones(len(X), dtype=bool)
+    free = int(np.argmax((UPPER[idx] - LOWER[idx]) / cost))
+    rest = [j for j in range(len(idx)) if j != free]
+    f, R = idx[free], idx[rest]
+    lo_R, hi_R = LOWER[R], UPPER[R]
+    sizes = (hi_R - lo_R + 1).astype(int)
+    V = np.stack(np.meshgrid(*[np.arange(a, b + 1) for a, b in zip(lo_R, hi_R)], indexing="ij"), axis=-1)
+    V = V.reshape(-1, len(R))
+    w, Q = scorer.coef, scorer.Q
+    S = V @ w[R] + np.einsum("ci,ij,cj->c", V, Q[np.ix_(R, R)], V)   # shared by every student
+    T = 2 * V @ Q[R, f]
+    a, lo, hi = Q[f, f], LOWER[f], UPPER[f]
+    D, De = _offsets(cost[rest], sizes - 1)
+    De = De + _EPS * (D != 0).sum(axis=1)   # effort of the offset from a profile already on its notches
+    stride = np.r_[np.cumprod(sizes[::-1])[::-1][1:], 1]
+    Dk = D @ stride                          # offset in the flattened grid V
+    ways = {}   # offsets kept for each rounded room below / above the base notch
+    far = 2 * (De[-1] + cost.sum()) + 1   # more than any offset's effort plus slack
+    # one notch up on input j changes the raw score by step_j + Q_jj(2y_j + 1) + 2 Σ_l≠j Q_jl y_l, with
+    # step_j = w_j + 2(Qu)_j per student; rise holds the rest's box-wide min and max of everything else
+    Qa, lo_a, hi_a = Q[np.ix_(idx, idx)], LOWER[idx], UPPER[idx]
+    rise = np.zeros((2, len(rest)))
+    for r, j in enumerate(rest):
+        own = (Qa[j, j] * (2 * lo_a[j] + 1), Qa[j, j] * (2 * hi_a[j] - 1))
+        cross = [(2 * Qa[j, l] * lo_a[l], 2 * Qa[j, l] * hi_a[l]) for l in range(len(idx)) if l != j]
+        rise[:, r] = [min(own) + sum(map(min, cross)), max(own) + sum(map(max, cross))]
+    ok = np.zeros(len(X), dtype=bool)
+    for s in range(0, len(X), QUAD_CHUNK):
+        x = X[s:s + QUAD_CHUNK]
+        u = x.copy()
+        u[:, idx] = 0
+        Qu2 = 2 * u @ Q
+        c0 = scorer.raw(u) - goal
+        QuR = Qu2[:, R]
+        coefs = lambda i, k: (w[f] + Qu2[i, f] + T[k], c0[i] + S[k] + np.einsum("pj,pj->p", QuR[i], V[k]))
+        best = np.full(len(x), np.inf)
+        combo, h = np.zeros(len(x), dtype=int), np.full(len(x), np.nan)
+        # Where one more notch of an input never lowers the score anywhere in the box, a plan
+        # below the profile's notch is beaten by moving back up (cheaper, no lower): search
+        # upward only, from the notch below the profile; the same downward. Else both ways.
+        step = w[idx] + Qu2[:, idx]
+        up = step[:, rest] + rise[0] >= 0
+        down = step[:, rest] + rise[1] <= 0
+        xr = x[:, R]
+        base = np.clip(np.where(up, np.floor(xr), np.where(down, np.ceil(xr), np.rint(xr))), lo_R, hi_R)
+        slack = np.abs(base - xr) @ cost[rest] + 1e-6   # keeps the effort cut exact between notches
+        whole = (base == xr).all(axis=1)
+        kb = (base - lo_R).astype(int) @ stride
+        # room below / above the base notch on each input, rounded up to a power of four: students
+        # sharing a rounding walk the same offsets, and few of them fall outside the sliders
+        room = np.stack([np.where(up, 0, base - lo_R), np.where(down, 0, hi_R - base)], axis=1)
+        room = np.where(room > 0, 4 ** np.ceil(np.log(np.maximum(room, 1)) / np.log(4)), 0).astype(int)
+
+        def solve(i, o):
+            # keep each student's cheapest plan among pairs (i, offset o), i ascending, when it beats the one so far
+            e = De[o]
+            part = np.flatnonzero(~whole[i])   # off their notches: effort from the profile itself
+            if len(part):
+                dv = base[i[part]] + D[o[part]] - xr[i[part]]
+                e[part] = np.abs(dv) @ cost[rest] + _EPS * (dv != 0).sum(axis=1)
+            keep = e < best[i]
+            i, k, e = i[keep], kb[i[keep]] + Dk[o[keep]], e[keep]
+            if not len(i):
+                return
+            hk = _nearest(a, *coefs(i, k), x[i, f], lo, hi)
+            d = hk - x[i, f]
+            e += cost[free] * np.abs(d) + _EPS * (d != 0)
+            e[np.isnan(hk)] = np.inf
+            starts = np.flatnonzero(np.r_[True, i[1:] != i[:-1]])   # i arrives grouped by student
+            low = np.minimum.reduceat(e, starts)
+            at = np.flatnonzero(e == np.repeat(low, np.diff(np.r_[starts, len(i)])))
+            first = at[np.r_[True, i[at][1:] != i[at][:-1]]]           # cheapest pair per student
+            first = first[e[first] < best[i[first]]]
+            rows = i[first]
+            best[rows], combo[rows], h[rows] = e[first], k[first], hk[first]
+
+        reach = _ceiling(scorer, u, idx) >= goal if goal <= scorer.hi else np.zeros(len(x), dtype=bool)
+        live = np.flatnonzero(reach)
+        if len(live):
+            # every room's offsets, cheapest first, in one array; shifting each list by `far` times its
+            # number keeps the whole array sorted, so one searchsorted cuts every student's own list
+            keys, kl = np.unique(room[live].reshape(len(live), -1), axis=0, return_inverse=True)
+            kl = kl.ravel()
+            for key in map(tuple, keys):
+                if key not in ways:
+                    below, above = np.reshape(key, (2, -1))
+                    ways[key] = np.flatnonzero(((D >= -below) & (D <= above)).all(axis=1))
+            lists = [ways[key] for key in map(tuple, keys)]
+            lens = np.array([len(o) for o in lists])
+            starts = np.cumsum(lens) - lens
+            order = np.concatenate(lists)
+            Ek = De[order] + np.repeat(np.arange(len(keys)) * far, lens)
+            edges = np.r_[0, [n for n in PLAN_BANDS if n < lens.max()], lens.max()]
+            for o_lo, o_hi in zip(edges[:-1], edges[1:]):
+                # offsets [o_lo, o_hi) of each student's list that are still cheaper than its best plan
+                cut = np.minimum(best[live] + slack[live], far / 2) + kl * far
+                n = np.minimum(np.searchsorted(Ek, cut) - starts[kl], o_hi) - o_lo
+                keep = n > 0
+                live, kl, n = live[keep], kl[keep], n[keep]
+                if not len(live):
+                    break
+                i = np.repeat(live, n)
+                o = np.repeat(starts[kl] + o_lo - (np.cumsum(n) - n), n) + np.arange(n.sum())
+                o = order[o]
+                v = base[i] + D[o]
+                inside = ((v >= lo_R) & (v <= hi_R)).all(axis=1)
+                solve(i[inside], o[inside])
+        miss = np.flatnonzero(np.isnan(h))
+        if len(miss):   # out of reach: the highest score any notch gets (a bound, or the vertex)
+            mi, mk = np.repeat(miss, len(V)), np.tile(np.arange(len(V)), len(miss))
+            Bm, Cm = (v.reshape(len(miss), len(V), 1) for v in coefs(mi, mk))
+            H = np.broadcast_to(np.array([lo, hi], dtype=np.float64), Bm.shape[:2] + (2,))
+            if a < 0:
+                top = np.clip(-Bm / (2 * a), lo, hi)
+                H = np.concatenate([H, np.floor(top), np.ceil(top)], axis=-1)
+            y = ((a * H + Bm) * H + Cm).reshape(len(miss), -1)
+            combo[miss], j = np.divmod(y.argmax(axis=1), H.shape[-1])
+            h[miss] = H[np.arange(len(miss)), combo[miss], j]
+        ok[s:s + len(x)] = np.isfinite(best)
+        delta[s:s + len(x), free] = h - x[:, f]
+        delta[s:s + len(x), rest] = V[combo] - x[:, R]
+    return delta, ok
+
+
+# ── GENERAL: GRID SEARCH ───────────────────────────────────────
+def _plan_search(scorer, X, floor, idx, cost):
+    values = [np.arange(LOWER[j], UPPER[j] + 1) for j in idx]
+    grid = np.stack(np.meshgrid(*values, indexing="ij"), axis=-1).reshape(-1, len(idx))
+    delta = np.zeros((len(X), len(idx)))
+    ok = np.zeros(len(X), dtype=bool)
+    for i, x in enumerate(X):
+        d = grid - x[idx]
+        effort = np.abs(d) @ cost + _EPS * (d != 0).sum(axis=1)
+        best = (np.inf, -np.inf, None)   # (effort, score, row) — reachable first, else highest score
+        for s in range(0, len(grid), GRID_CHUNK):
+            cand = np.repeat(x[None], len(grid[s:s + GRID_CHUNK]), axis=0)
+            cand[:, idx] = grid[s:s + GRID_CHUNK]
+            y = scorer.predict(cand)
+            e = np.where(y >= floor - _EPS, effort[s:s + GRID_CHUNK], np.inf)
+            j = int(e.argmin())
+            if e[j] < best[0]:
+                best = (e[j], y[j], s + j)
+            elif not np.isfinite(best[0]) and y.max() > best[1]:
+                best = (np.inf, y.max(), s + int(y.argmax()))
+        ok[i] = np.isfinite(best[0])
+        delta[i] = d[best[2]]
+    return delta, ok
+
+
+def plan(scorer, X, target, actionable=ACTIONABLE, effort=EFFORT):
+    """Least-effort integer changes that bring each profile in `X` to `target`.
+
+    `target` is a grade letter or a score. Returns a dict of arrays over
+    the rows: ``delta`` (signed notches per actionable input), ``effort``,
+    ``score`` after the change, ``pts`` (points from each input on its own)
+    and ``feasible`` (False where even the best reachable profile misses the
+    target; ``delta`` is then that best profile).
+    """
+    X = as_matrix(X)
+    floor = grade_floor(target)
+    idx = np.array([FEATURES.index(f) for f in actionable])
+    cost = np.array([effort[f] for f in actionable], dtype=np.float64)
+    solve = _plan_linear if is_linear(scorer) else _plan_quadratic if is_quadratic(scorer) else _plan_search
+    delta, ok = solve(scorer, X, floor, idx, cost)
+    after = X.copy()
+    after[:, idx] += delta
+    if is_linear(scorer):
+        pts = delta * scorer.coef[idx]
+    else:
+        one = np.repeat(X[:, None], len(idx), axis=1)
+        one[:, np.arange(len(idx)), idx] += delta
+        pts = scorer.predict(one.reshape(-1, X.shape[1])).reshape(len(X), -1) - scorer.predict(X)[:, None]
+    return {"features": tuple(actionable), "delta": delta.astype(int), "effort": np.abs(delta) @ cost,
+            "score": scorer.predict(after), "pts": pts, "feasible": ok}
+
+
+def ranked(p, i):
+    """[(feature, notches, points)] of row `i` of a plan, largest contribution first."""
+    steps = [(f, int(d), float(g)) for f, d, g in zip(p["features"], p["delta"][i], p["pts"][i]) if d]
+    return sorted(steps, key=lambda s: -abs(s[2]))
@@ -0,0 +1,234 @@
+"""
+ScoreIQ — input drift
+Per-feature histograms of the profiles the app and API score, compared with
+the training inputs by PSI and KS. Every input is an integer on a bounded
+slider range, so one bin per value (plus an underflow and an overflow bin)
+is exact and fixed-size: all 12 features fit in 200 counters. Counts
+from any number of processes merge by addition. Profiles reach the counters
+through a bounded queue drained by a worker thread, so scoring never waits
+on monitoring.
+
+Run: python -m scoreiq drift .scoreiq-drift
+"""
+
+import functools, glob, os, queue, socket, threading, time
+
+import numpy as np
+
+from .engine import FEATURES, as_matrix
+from .profile import LOWER, UPPER
+
+WIDTHS = (UPPER - LOWER + 3).astype(np.int64)          # values + underflow + overflow
+OFFSETS = np.concatenate(([0], np.cumsum(WIDTHS)[:-1]))
+SIZE = int(WIDTHS.sum())
+PSI_WARN, PSI_ALERT = 0.1, 0.25   # conventional "moderate" / "significant" shift
+MIN_PROFILES = 100                # fewer live profiles than this: statistics shown, no status
+QUEUE_SIZE = 4096                 # pending profiles; beyond this they are dropped, never waited on
+FLUSH_SECONDS = 10.0
+CLOSE_SECONDS = 5.0               # how long close() waits for the worker to count what is queued
+_STOP = object()                  # queued by close(): the worker counts everything ahead of it, then exits
+_EPS = 1e-4
+
+
+class Histograms:
+    """Fixed-size per-feature value counts over the slider ranges."""
+
+    def __init__(self, counts=None):
+        self.counts = np.zeros(SIZE, dtype=np.int64) if counts is None else np.asarray(counts, dtype=np.int64)
+        if self.counts.shape != (SIZE,):
+            raise ValueError(f"expected {SIZE} counters, got {self.counts.shape}")
+
+    @classmethod
+    def from_rows(cls, X):
+        h = cls()
+        h.add(X)
+        return h
+
+    def add(self, X):
+        """Count every row of an (N, 12) matrix; rows with missing values are skipped."""
+        X = as_matrix(X)
+        X = X[np.isfinite(X).all(axis=1)]
+        b = np.rint(X - (LOWER - 1)).astype(np.int64)   # bin 0 = underflow
+        np.clip(b, 0, WIDTHS - 1, out=b)
+        b += OFFSETS
+        self.counts += np.bincount(b.ravel(), minlength=SIZE)
+        return self
+
+    def merge(self, other):
+        return Histograms(self.counts + other.counts)
+
+    @property
+    def n(self):
+        return int(self.counts[:WIDTHS[0]].sum())
+
+    def feature(self, j):
+        return self.counts[OFFSETS[j]:OFFSETS[j] + WIDTHS[j]]
+
+
+def compare(ref, live):
+    """Per-feature PSI and KS statistic of `live` against `ref`, worst PSI first."""
+    rows = []
+    for j, name in enumerate(FEATURES):
+        r, c = ref.feature(j), live.feature(j)
+        p = np.maximum(r / max(r.sum(), 1), _EPS)
+        q = np.maximum(c / max(c.sum(), 1), _EPS)
+        psi = float(((q - p) * np.log(q / p)).sum())
+        ks = float(np.abs(np.cumsum(r) / max(r.sum(), 1) - np.cumsum(c) / max(c.sum(), 1)).max())
+        status = ("low-n" if live.n < MIN_PROFILES else
+                  "alert" if psi >= PSI_ALERT else "warn" if psi >= PSI_WARN else "ok")
+        rows.append({"feature": name, "psi": psi, "ks": ks, "status": status})
+    return sorted(rows, key=lambda r: -r["psi"])
+
+
+def reference(scorer):
+    """Training-input histograms: stored with the model, else the synthetic training set."""
+    if getattr(scorer, "inputs", None) is not None:
+        return scorer.inputs
+    return _synthetic()
+
+
+@functools.lru_cache(maxsize=1)
+def _synthetic():
+    from .loader import synthetic_training_set
+    return Histograms.from_rows(synthetic_training_set()[0])
+
+
+def load_dir(directory, skip=None):
+    """Sum of the histogram snapshots every process flushed to `directory`."""
+    total = Histograms()
+    for path in glob.glob(os.path.join(directory, "*.npy")):
+        if path != skip:
+            try:
+                total.counts += Histograms(np.load(path)).counts
+            except (OSError, ValueError):
+                pass   # partially written by another version; skip it
+    return total
+
+
+# ── MONITOR ────────────────────────────────────────────────────
+class DriftMonitor:
+    """Counts observed profiles on a worker thread; optionally flushes them for other processes."""
+
+    def __init__(self, directory=None, flush_every=FLUSH_SECONDS, maxsize=QUEUE_SIZE):
+        self.directory, self.flush_every = directory, flush_every
+        self.path = (os.path.join(directory, f"{socket.gethostname()}-{os.getpid()}.npy")
+                     if directory else None)
+        self.live = Histograms()
+        self.dropped = self.flush_errors = 0
+        self.queue = queue.Queue(maxsize)
+        self._lock = threading.Lock()
+        self.thread = threading.Thread(target=self._run, name="scoreiq-drift", daemon=True)
+        self.thread.start()
+
+    def observe(self, X):
+        """Queue one profile or a stack of them; never blocks."""
+        try:
+            self.queue.put_nowait(X)
+        except queue.Full:
+            self.dropped += 1
+
+    def _run(self):
+        due = time.monotonic() + self.flush_every
+        stop = False
+        while not stop:
+            try:
+                batch = [self.queue.get(timeout=self.flush_every)]
+            except queue.Empty:
+                batch = []
+            while len(batch) < QUEUE_SIZE:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            rows = []
+            for x in batch:
+                if x is _STOP:
+                    stop = True
+                    continue
+                try:
+                    rows.append(as_matrix(x))
+                except ValueError:
+                    self.dropped += 1   # malformed profile: never take the worker down
+            if rows:
+                X = np.concatenate(rows)
+                with self._lock:
+                    self.live.add(X)
+            if self.path and time.monotonic() >= due and not stop:
+                try:
+                    self.flush()
+                except OSError:
+                    self.flush_errors += 1   # full or unmounted drift dir: keep counting, retry next time
+                due = time.monotonic() + self.flush_every
+
+    def flush(self):
+        """Write this process's counts to the shared directory (atomic rename)."""
+        with self._lock:
+            counts = self.live.counts.copy()
+        os.makedirs(self.directory, exist_ok=True)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "wb") as f:
+            np.save(f, counts)
+        os.replace(tmp, self.path)
+
+    def close(self, timeout=CLOSE_SECONDS):
+        """Count what is still queued, stop the worker and flush."""
+        if self.thread.is_alive():
+            try:
+                self.queue.put(_STOP, timeout=timeout)
+            except queue.Full:
+                pass
+            self.thread.join(timeout)
+        if self.path:
+            self.flush()
+
+    def histograms(self):
+        """Live counts of this process plus every other process's last flush."""
+        with self._lock:
+            own = Histograms(self.live.counts.copy())
+        return own.merge(load_dir(self.directory, skip=self.path)) if self.directory else own
+
+    def report(self, scorer):
+        live = self.histograms()
+        return {"profiles": live.n, "dropped": self.dropped, "flush_errors": self.flush_errors,
+                "features": compare(reference(scorer), live) if live.n else []}
+
+
+def monitor():
+    """Process-wide monitor; SCOREIQ_DRIFT_DIR shares counts across processes."""
+    return DriftMonitor(os.environ.get("SCOREIQ_DRIFT_DIR"))
+
+
+def prometheus(report):
+    out = ["# TYPE scoreiq_drift_profiles_total counter", f"scoreiq_drift_profiles_total {report['profiles']}",
+           "# TYPE scoreiq_drift_flush_errors_total counter", f"scoreiq_drift_flush_errors_total {report['flush_errors']}",
+           "# TYPE scoreiq_drift_psi gauge"]
+    out += [f'scoreiq_drift_psi{{feature="{r["feature"]}"}} {r["psi"]:.6f}' for r in report["features"]]
+    out.append("# TYPE scoreiq_drift_ks gauge")
+    out += [f'scoreiq_drift_ks{{feature="{r["feature"]}"}} {r["ks"]:.6f}' for r in report["features"]]
+    return "\n".join(out) + "\n"
+
+
+def table(report):
+    """Fixed-width text summary for the debug panel / CLI."""
+    lines = [f"{report['profiles']:,} profiles · {report['dropped']:,} dropped"
+             + (f" · {report['flush_errors']:,} failed flushes" if report["flush_errors"] else ""), ""]
+    lines += [f"{r['feature']:<22} PSI {r['psi']:>7.3f}   KS {r['ks']:>6.3f}   {r['status']}"
+              for r in report["features"]]
+    return "\n".join(lines)
+
+
+# ── CLI ────────────────────────────────────────────────────────
+def add_parser(sub):
+    p = sub.add_parser("drift", help="input drift of flushed live traffic vs the training inputs")
+    p.add_argument("directory", nargs="?", default=os.environ.get("SCOREIQ_DRIFT_DIR", ".scoreiq-drift"))
+    p.add_argument("--prom", action="store_true", help="Prometheus text instead of a table")
+    p.set_defaults(func=main)
+
+
+def main(args):
+    from .loader import load_model
+    live = load_dir(args.directory)
+    report = {"profiles": live.n, "dropped": 0, "flush_errors": 0,
+              "features": compare(reference(load_model()), live) if live.n else []}
+    print(prometheus(report) if args.prom else table(report), end="" if args.prom else "\n")
+    return 1 if any(r["status"] == "alert" for r in report["features"]) else 0
@@ -0,0 +1,173 @@
+"""
+ScoreIQ — scoring engine
+StandardScaler + Ridge folded into a single affine map (or, for the degree-2
+polynomial model, an affine map plus one quadratic form), scored in one NumPy pass.
+"""
+
+import numpy as np
+
+# ── FEATURE ORDER ──────────────────────────────────────────────
+# Column order of every feature row / matrix handled by the app.
+FEATURES = (
+    "Hours_Studied", "Attendance", "Sleep_Hours", "Previous_Scores",
+    "Tutoring_Sessions", "Physical_Activity", "Parental_Involvement",
+    "Access_to_Resources", "Motivation_Level", "Internet_Access",
+    "Family_Income", "Teacher_Quality",
+)
+N_FEATURES = len(FEATURES)
+
+SCORE_MIN, SCORE_MAX = 40.0, 100.0
+
+
+def as_matrix(X):
+    """Coerce one profile or a stack of profiles into a float (N, 12) array."""
+    X = np.asarray(X, dtype=np.float64)
+    if X.ndim == 1:
+        X = X[None, :]
+    if X.ndim != 2 or X.shape[1] != N_FEATURES:
+        raise ValueError(f"expected (N, {N_FEATURES}) feature matrix, got shape {X.shape}")
+    return X
+
+
+def vary(base, idx, values):
+    """Rows of `base` with feature `idx` replaced by each of `values`."""
+    values = np.asarray(values, dtype=np.float64)
+    X = np.repeat(as_matrix(base), len(values), axis=0)
+    X[:, idx] = values
+    return X
+
+
+# ── LINEAR SCORER ──────────────────────────────────────────────
+class LinearScorer:
+    """Affine score model in raw feature space: clip(X @ coef + intercept, lo, hi).
+
+    `mean` is the training-set feature mean, kept as the default attribution
+    reference; it does not affect scores.
+    """
+
+    kind = "linear"
+    cohort = None   # percentile.ScoreIndex of a reference cohort, attached by artifact.load
+    inputs = None   # drift.Histograms of the training inputs, likewise
+
+    def __init__(self, coef, intercept, lo=SCORE_MIN, hi=SCORE_MAX, features=FEATURES, mean=None):
+        self.coef = np.ascontiguousarray(coef, dtype=np.float64).reshape(-1)
+        self.intercept = float(intercept)
+        self.lo, self.hi = float(lo), float(hi)
+        self.features = tuple(features)
+        if self.coef.shape[0] != len(self.features):
+            raise ValueError(f"{self.coef.shape[0]} coefficients for {len(self.features)} features")
+        self.mean = None if mean is None else np.asarray(mean, dtype=np.float64).reshape(-1)
+        if self.mean is not None and self.mean.shape != self.coef.shape:
+            raise ValueError(f"{self.mean.shape[0]} means for {len(self.features)} features")
+
+    @classmethod
+    def from_sklearn(cls, model, scaler=None, lo=SCORE_MIN, hi=SCORE_MAX):
+        """Fold a fitted StandardScaler into a fitted linear model's coefficients."""
+        coef = np.asarray(model.coef_, dtype=np.float64).reshape(-1)
+        intercept = float(np.ravel(model.intercept_)[0])
+        mean = None
+        if scaler is not None:
+            mean = getattr(scaler, "mean_", None)
+            scale = getattr(scaler, "scale_", None)
+            if scale is not None:
+                coef = coef / scale
+            if mean is not None:
+                intercept -= float(coef @ mean)
+        return cls(coef, intercept, lo, hi, mean=mean)
+
+    def raw(self, X):
+        """Unclipped scores for an (N, 12) matrix."""
+        return as_matrix(X) @ self.coef + self.intercept
+
+    def predict(self, X):
+        """Clipped scores for an (N, 12) matrix, as a length-N array."""
+        return np.clip(self.raw(X), self.lo, self.hi)
+
+    def predict_one(self, f):
+        return float(self.predict(f)[0])
+
+    def contributions(self, X, ref=None):
+        """Per-feature terms coef * (x - ref); each row sums with raw(ref) to the unclipped score.
+
+        Without `ref` the terms are coef * x and sum with `intercept` instead.
+        """
+        X = as_matrix(X)
+        return (X if ref is None else X - ref) * self.coef
+
+
+# ── QUADRATIC SCORER ───────────────────────────────────────────
+class QuadraticScorer:
+    """Degree-2 score model in raw feature space: clip(intercept + x·coef + xᵀQx, lo, hi).
+
+    The StandardScaler → PolynomialFeatures(degree=2) → Ridge pipeline folded
+    into a symmetric 12×12 Q, so nothing is expanded to 90 columns at score time.
+    """
+
+    kind = "quadratic"
+    cohort = inputs = None
+
+    def __init__(self, coef, Q, intercept, lo=SCORE_MIN, hi=SCORE_MAX, features=FEATURES, mean=None):
+        self.coef = np.ascontiguousarray(coef, dtype=np.float64).reshape(-1)
+        Q = np.asarray(Q, dtype=np.float64)
+        self.Q = np.ascontiguousarray((Q + Q.T) / 2)
+        self.intercept = float(intercept)
+        self.lo, self.hi = float(lo), float(hi)
+        self.features = tuple(features)
+        p = len(self.features)
+        if self.coef.shape[0] != p or self.Q.shape != (p, p):
+            raise ValueError(f"coef {self.coef.shape} / Q {self.Q.shape} do not match {p} features")
+        self.mean = None if mean is None else np.asarray(mean, dtype=np.float64).reshape(-1)
+
+    @classmethod
+    def from_sklearn(cls, model, poly, scaler=None, lo=SCORE_MIN, hi=SCORE_MAX):
+        """Fold a fitted scaler, degree-≤2 PolynomialFeatures and linear model into (coef, Q, intercept)."""
+        beta = np.asarray(model.coef_, dtype=np.float64).reshape(-1)
+        b = float(np.ravel(model.intercept_)[0])
+        p = int(poly.n_features_in_)
+        a, Qz = np.zeros(p), np.zeros((p, p))
+        for powers, w in zip(np.asarray(poly.powers_), beta):
+            nz = np.flatnonzero(powers)
+            deg = int(powers.sum())
+            if deg == 0:
+                b += w
+            elif deg == 1:
+                a[nz[0]] += w
+            elif deg == 2 and len(nz) == 1:
+                Qz[nz[0], nz[0]] += w
+            elif deg == 2:
+                Qz[nz[0], nz[1]] += w / 2; Qz[nz[1], nz[0]] += w / 2
+            else:
+                raise ValueError("only polynomial features of degree <= 2 can be folded")
+        mean = getattr(scaler, "mean_", None)
+        scale = getattr(scaler, "scale_", None)
+        mu = np.zeros(p) if mean is None else np.asarray(mean, dtype=np.float64)
+        d = np.ones(p) if scale is None else 1.0 / np.asarray(scale, dtype=np.float64)
+        # z = d·(x − μ):  a·z + zᵀQ_z z  =  (a·d − 2Qμ)·x + xᵀQx + μᵀQμ − (a·d)·μ,  Q = d Q_z d
+        Q = Qz * np.outer(d, d)
+        coef = a * d - 2 * Q @ mu
+        return cls(coef, Q, b - (a * d) @ mu + mu @ Q @ mu, lo, hi, mean=mean)
+
+    def raw(self, X):
+        """Unclipped scores for an (N, 12) matrix."""
+        X = as_matrix(X)
+        return X @ self.coef + np.einsum("ni,ni->n", X @ self.Q, X) + self.intercept
+
+    def predict(self, X):
+        """Clipped scores for an (N, 12) matrix, as a length-N array."""
+        return np.clip(self.raw(X), self.lo, self.hi)
+
+    def predict_one(self, f):
+        return float(self.predict(f)[0])
+
+    def gradient(self, x):
+        """∂raw/∂x at one profile: coef + 2Qx."""
+        return self.coef + 2 * self.Q @ as_matrix(x)[0]
+
+    def contributions(self, X, ref=None):
+        """Exact Shapley values vs `ref` (the origin if None): (x − r) ⊙ (coef + Q(x + r)).
+
+        Each row sums with raw(ref) to the unclipped score.
+        """
+        X = as_matrix(X)
+        r = np.zeros(X.shape[1]) if ref is None else np.asarray(ref, dtype=np.float64)
+        return (X - r) * (self.coef + (X + r) @ self.Q)
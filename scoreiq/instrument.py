@@ -0,0 +1,135 @@
+"""
+ScoreIQ — rerun instrumentation
+Opt-in timing of named spans and counters per Streamlit rerun, with a
+process-wide aggregate for export as JSON lines or Prometheus text.
+Disabled recorders hand out a shared no-op span, so the hot path pays
+one attribute check.
+"""
+
+import json, os, threading, time
+from collections import Counter
+from contextlib import contextmanager, nullcontext
+
+_NOOP = nullcontext()
+
+
+class Recorder:
+    """Spans and counters for one session's current rerun (full script or fragment)."""
+
+    def __init__(self, enabled=False):
+        self.enabled = enabled
+        self.label, self.open = None, False
+        self.t0 = time.perf_counter()
+        self.spans, self.counters = [], Counter()
+
+    def begin(self, label):
+        self.label, self.open = label, True
+        self.t0 = time.perf_counter()
+        self.spans, self.counters = [], Counter()
+
+    def finish(self):
+        """Close the rerun and fold it into the process-wide totals; returns its record."""
+        self.open = False
+        rec = self.record()
+        if self.enabled:
+            TOTALS.add(rec)
+            export(rec)
+        return rec
+
+    def span(self, name):
+        return self._span(name) if self.enabled else _NOOP
+
+    @contextmanager
+    def _span(self, name):
+        t = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.spans.append((name, t - self.t0, time.perf_counter() - t))
+
+    def count(self, name, n=1):
+        if self.enabled:
+            self.counters[name] += n
+
+    def record(self):
+        return {
+            "ts": time.time(), "run": self.label,
+            "wall_ms": round((time.perf_counter() - self.t0) * 1000, 3),
+            "spans": [{"name": n, "start_ms": round(s * 1000, 3), "ms": round(d * 1000, 3)}
+                      for n, s, d in self.spans],
+            "counters": dict(self.counters),
+        }
+
+    def table(self):
+        """Fixed-width text summary of the current rerun for the debug panel."""
+        rec = self.record()
+        agg = {}
+        for s in rec["spans"]:
+            n, ms = agg.get(s["name"], (0, 0.0))
+            agg[s["name"]] = (n + 1, ms + s["ms"])
+        lines = [f"{rec['run']}  ·  {rec['wall_ms']:.1f} ms wall", ""]
+        lines += [f"{name:<34} {n:>3}×  {ms:>9.2f} ms"
+                  for name, (n, ms) in sorted(agg.items(), key=lambda kv: -kv[1][1])]
+        if rec["counters"]:
+            lines.append("")
+            lines += [f"{k:<34} {v:>15,}" for k, v in sorted(rec["counters"].items())]
+        return "\n".join(lines)
+
+
+# ── PROCESS TOTALS ─────────────────────────────────────────────
+class Totals:
+    """Thread-safe aggregate of every finished rerun in this process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reruns = Counter()
+        self.span_count, self.span_seconds = Counter(), Counter()
+        self.counters = Counter()
+
+    def add(self, rec):
+        with self._lock:
+            self.reruns[rec["run"].split(":")[0]] += 1
+            for s in rec["spans"]:
+                self.span_count[s["name"]] += 1
+                self.span_seconds[s["name"]] += s["ms"] / 1000
+            self.counters.update(rec["counters"])
+
+    def prometheus(self):
+        """Prometheus text exposition of the totals."""
+        with self._lock:
+            out = ["# TYPE scoreiq_reruns_total counter"]
+            out += [f'scoreiq_reruns_total{{kind="{k}"}} {v}' for k, v in sorted(self.reruns.items())]
+            out.append("# TYPE scoreiq_span_seconds summary")
+            for name in sorted(self.span_count):
+                out.append(f'scoreiq_span_seconds_sum{{span="{name}"}} {self.span_seconds[name]:.6f}')
+                out.append(f'scoreiq_span_seconds_count{{span="{name}"}} {self.span_count[name]}')
+            for k in sorted(self.counters):
+                out.append(f"# TYPE scoreiq_{k}_total counter")
+                out.append(f"scoreiq_{k}_total {self.counters[k]}")
+            return "\n".join(out) + "\n"
+
+TOTALS = Totals()
+
+
+# ── EXPORT ─────────────────────────────────────────────────────
+JSONL_PATH = os.environ.get("SCOREIQ_PROFILE_JSONL")   # one JSON line per rerun
+PROM_PATH = os.environ.get("SCOREIQ_PROFILE_PROM")     # textfile-collector snapshot
+_export_lock = threading.Lock()
+
+
+def export(rec):
+    if not (JSONL_PATH or PROM_PATH):
+        return
+    with _export_lock:
+        if JSONL_PATH:
+            with open(JSONL_PATH, "a") as f:
+                f.write(json.dumps(rec) + "\n")
+        if PROM_PATH:
+            tmp = PROM_PATH + ".tmp"
+            with open(tmp, "w") as f:
+                f.write(TOTALS.prometheus())
+            os.replace(tmp, PROM_PATH)
+
+
+def enabled_by_env():
+    return os.environ.get("SCOREIQ_PROFILE", "").lower() in ("1", "true", "yes", "on")
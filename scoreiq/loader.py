@@ -0,0 +1,81 @@
+"""
+ScoreIQ — model loading
+Artifact first (SCOREIQ_MODEL, default student_model.npz — linear or degree-2
+polynomial), then the notebook's pickles, then a deterministic retrain on
+synthetic data. sklearn / joblib are only imported on the fallback paths.
+With SCOREIQ_SHARED_DIR, the host's shared store comes before all of them and
+only the first process on the host goes down that chain.
+"""
+
+import os
+
+import numpy as np
+
+from . import artifact, shared
+from .drift import Histograms
+from .engine import FEATURES, LinearScorer
+from .percentile import ScoreIndex
+
+MODEL_PKL, SCALER_PKL = "student_model.pkl", "student_scaler.pkl"
+
+
+def synthetic_training_set(n=5000, seed=42):
+    """The app's 5,000-row synthetic training set.
+
+    Drawn from its own RandomState(seed) — the same stream the original global
+    np.random.seed(42) produced, without touching global state. Larger cohorts
+    come from synth, which streams in independent blocks.
+    """
+    rs = np.random.RandomState(seed)
+    X = np.column_stack([
+        rs.randint(1,44,n), rs.randint(60,100,n),
+        rs.randint(4,10,n), rs.randint(50,100,n),
+        rs.randint(0,8,n),  rs.randint(0,6,n),
+        rs.randint(0,3,n),  rs.randint(0,3,n),
+        rs.randint(0,3,n),  rs.randint(0,2,n),
+        rs.randint(0,3,n),  rs.randint(0,3,n),
+    ])
+    y = (40 + X[:,0]*0.85 + (X[:,1]-75)*0.3 + X[:,3]*0.25 + X[:,4]*1.2
+           + X[:,5]*0.4 + rs.normal(0,3,n)).clip(40,100)
+    return X, y
+
+
+def retrain():
+    from sklearn.linear_model import Ridge
+    from sklearn.preprocessing import StandardScaler
+    X, y = synthetic_training_set()
+    sc = StandardScaler(); Xs = sc.fit_transform(X)
+    m  = Ridge(alpha=1.0); m.fit(Xs, y)
+    scorer = LinearScorer.from_sklearn(m, sc)
+    scorer.cohort = ScoreIndex.from_scores(scorer.predict(X))   # percentiles vs the training set
+    scorer.inputs = Histograms.from_rows(X)                      # drift reference
+    return scorer
+
+
+def model_path():
+    """Artifact path the loader tries first."""
+    return os.environ.get("SCOREIQ_MODEL", artifact.DEFAULT_PATH)
+
+
+def load_model(path=None, model_pkl=MODEL_PKL, scaler_pkl=SCALER_PKL):
+    """Best available scorer for the app's 12 features.
+
+    Without an explicit `path`, a shared store (SCOREIQ_SHARED_DIR) is attached
+    to, or bootstrapped with the model found below.
+    """
+    store = shared.store() if path is None else None
+    if store is not None:
+        return store.bootstrap(lambda: _load(model_path(), model_pkl, scaler_pkl))
+    return _load(path or model_path(), model_pkl, scaler_pkl)
+
+
+def _load(path, model_pkl, scaler_pkl):
+    if os.path.exists(path):
+        try:
+            return artifact.load(path, FEATURES)
+        except artifact.ArtifactError:
+            pass
+    if os.path.exists(model_pkl) and os.path.exists(scaler_pkl):
+        import joblib
+        return LinearScorer.from_sklearn(joblib.load(model_pkl), joblib.load(scaler_pkl))
+    return retrain()
@@ -0,0 +1,88 @@
+"""
+ScoreIQ — percentile rank
+Where a score falls in a reference cohort ("73rd percentile of the district").
+The cohort is kept as a sorted array of distinct scores on a fixed 0.01-point
+grid with their counts — at most 6,001 entries on the 40–100 scale, whatever
+the cohort size. Ranking any number of scores is one vectorized searchsorted;
+two indexes merge by adding counts, so new cohorts fold in without re-sorting
+the history and batch workers can build partial indexes in parallel.
+"""
+
+import numpy as np
+
+RESOLUTION = 0.01   # score grid, in points (scores are reported to 2 decimals)
+
+
+class ScoreIndex:
+    """Mergeable sorted (score key, count) index with mid-rank percentiles."""
+
+    def __init__(self, keys=(), counts=(), resolution=RESOLUTION):
+        self.resolution = float(resolution)
+        self.keys = np.asarray(keys, dtype=np.int64).reshape(-1)
+        self.counts = np.asarray(counts, dtype=np.int64).reshape(-1)
+        if self.keys.shape != self.counts.shape:
+            raise ValueError(f"{len(self.keys)} keys for {len(self.counts)} counts")
+        if len(self.keys) > 1 and (np.diff(self.keys) <= 0).any():
+            raise ValueError("keys must be strictly increasing")
+        self._cum = np.concatenate(([0], np.cumsum(self.counts)))
+
+    @classmethod
+    def from_scores(cls, scores, resolution=RESOLUTION):
+        k = cls._key(scores, resolution)
+        if not len(k):
+            return cls(resolution=resolution)
+        lo = int(k.min())
+        if int(k.max()) - lo > max(4 * len(k), 1 << 16):   # unclipped outliers: sparse keys
+            return cls(*np.unique(k, return_counts=True), resolution)
+        counts = np.bincount(k - lo)   # O(n), no sort: the grid is bounded
+        keys = np.flatnonzero(counts)
+        return cls(keys + lo, counts[keys], resolution)
+
+    @staticmethod
+    def _key(scores, resolution):
+        s = np.asarray(scores, dtype=np.float64).reshape(-1)
+        return np.rint(s[np.isfinite(s)] / resolution).astype(np.int64)
+
+    @property
+    def n(self):
+        return int(self._cum[-1])
+
+    def merge(self, other):
+        """New index over both cohorts; the inputs are left unchanged."""
+        if other.resolution != self.resolution:
+            raise ValueError(f"cannot merge resolutions {self.resolution} and {other.resolution}")
+        keys, inv = np.unique(np.concatenate((self.keys, other.keys)), return_inverse=True)
+        counts = np.bincount(inv, weights=np.concatenate((self.counts, other.counts)), minlength=len(keys))
+        return ScoreIndex(keys, counts.astype(np.int64), self.resolution)
+
+    def add(self, scores):
+        """Index with `scores` folded in."""
+        return self.merge(ScoreIndex.from_scores(scores, self.resolution))
+
+    def rank(self, scores):
+        """Percentile (0–100) of each score: cohort share below it plus half the share tied with it."""
+        if not self.n:
+            raise ValueError("empty reference cohort")
+        s = np.asarray(scores, dtype=np.float64)
+        ok = np.isfinite(s)
+        k = np.rint(np.where(ok, s, 0) / self.resolution).astype(np.int64)
+        i = np.searchsorted(self.keys, k)
+        j = np.minimum(i, len(self.keys) - 1)
+        tied = np.where(self.keys[j] == k, self.counts[j], 0)
+        return np.where(ok, 100.0 * (self._cum[i] + 0.5 * tied) / self.n, np.nan)
+
+    def quantile(self, q):
+        """Score at cohort quantile(s) `q` in [0, 1] (lower value on ties)."""
+        q = np.asarray(q, dtype=np.float64)
+        i = np.searchsorted(self._cum[1:], np.clip(q, 0, 1) * self.n, side="left")
+        return self.keys[np.minimum(i, len(self.keys) - 1)] * self.resolution
+
+    def to_arrays(self):
+        return {"keys": self.keys, "counts": self.counts, "resolution": np.float64(self.resolution)}
+
+
+def ordinal(p):
+    """73.4 → '73rd'."""
+    n = int(np.clip(np.floor(p), 0, 99))
+    suffix = "th" if 10 <= n % 100 <= 20 else {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    return f"{n}{suffix}"
@@ -0,0 +1,111 @@
+"""
+ScoreIQ — student profiles
+Category encodings, input bounds and the grade scale shared by the app,
+the scoring service and the batch tools.
+"""
+
+import numpy as np
+
+from .engine import FEATURES
+
+# ── ENCODINGS ──────────────────────────────────────────────────
+# Same codes as the notebook's ordinal_maps / binary_maps.
+LEVELS = {"Low": 0, "Medium": 1, "High": 2}
+YES_NO = {"Yes": 1, "No": 0}
+
+ORDINAL_MAPS = {
+    "Parental_Involvement": LEVELS,
+    "Access_to_Resources":  LEVELS,
+    "Motivation_Level":     LEVELS,
+    "Family_Income":        LEVELS,
+    "Teacher_Quality":      LEVELS,
+}
+BINARY_MAPS = {"Internet_Access": YES_NO}
+CATEGORY_MAPS = {**ORDINAL_MAPS, **BINARY_MAPS}
+
+
+def enc(v):  return LEVELS.get(v, 1)
+def encb(v): return 1 if v == "Yes" else 0
+
+
+# ── INPUT BOUNDS ───────────────────────────────────────────────
+# (min, max) of each input as exposed by the app's sliders / selectboxes.
+BOUNDS = {
+    "Hours_Studied":        (1, 44),
+    "Attendance":           (60, 100),
+    "Sleep_Hours":          (4, 10),
+    "Previous_Scores":      (50, 100),
+    "Tutoring_Sessions":    (0, 8),
+    "Physical_Activity":    (0, 6),
+    "Parental_Involvement": (0, 2),
+    "Access_to_Resources":  (0, 2),
+    "Motivation_Level":     (0, 2),
+    "Internet_Access":      (0, 1),
+    "Family_Income":        (0, 2),
+    "Teacher_Quality":      (0, 2),
+}
+LOWER = np.array([BOUNDS[f][0] for f in FEATURES], dtype=np.float64)
+UPPER = np.array([BOUNDS[f][1] for f in FEATURES], dtype=np.float64)
+
+# The app's default profile: 20/85/7/75/2/2 · Medium ×3 · Yes · Medium ×2
+DEFAULTS = {
+    "Hours_Studied": 20, "Attendance": 85, "Sleep_Hours": 7, "Previous_Scores": 75,
+    "Tutoring_Sessions": 2, "Physical_Activity": 2, "Parental_Involvement": "Medium",
+    "Access_to_Resources": "Medium", "Motivation_Level": "Medium", "Internet_Access": "Yes",
+    "Family_Income": "Medium", "Teacher_Quality": "Medium",
+}
+
+
+def encode_value(name, v):
+    """Encode one raw input (number or category label) and range-check it."""
+    if name not in BOUNDS:
+        raise ValueError(f"unknown feature {name!r}")
+    if isinstance(v, str) and name in CATEGORY_MAPS:
+        if v not in CATEGORY_MAPS[name]:
+            raise ValueError(f"{name}: {v!r} is not one of {list(CATEGORY_MAPS[name])}")
+        return float(CATEGORY_MAPS[name][v])
+    try:
+        x = float(v)
+    except (TypeError, ValueError):
+        raise ValueError(f"{name}: expected a number, got {v!r}") from None
+    lo, hi = BOUNDS[name]
+    if not lo <= x <= hi:
+        raise ValueError(f"{name}: {x:g} is outside {lo}–{hi}")
+    if name in CATEGORY_MAPS and not x.is_integer():
+        raise ValueError(f"{name}: {x:g} is not a category code, expected one of "
+                         f"{sorted(CATEGORY_MAPS[name].values())} or {list(CATEGORY_MAPS[name])}")
+    return x
+
+
+def encode(profile, defaults=DEFAULTS):
+    """Feature row for a profile dict; missing inputs fall back to `defaults`."""
+    unknown = set(profile) - set(FEATURES)
+    if unknown:
+        raise ValueError(f"unknown features {sorted(unknown)}")
+    return [encode_value(f, profile.get(f, defaults[f])) for f in FEATURES]
+
+
+# ── GRADE SCALE ────────────────────────────────────────────────
+# (floor, letter, colour, background, border), highest band first.
+GRADE_BANDS = (
+    (90, "A+", "#059669", "#EDF8F2", "#B8D9CB"),
+    (80, "A",  "#1D4ED8", "#EFF5FF", "#BFCFFE"),
+    (70, "B",  "#C47C0A", "#FDF8EC", "#F0D898"),
+    (60, "C",  "#C2490A", "#FFF5EE", "#FECDAA"),
+    (0,  "D",  "#DC2626", "#FEF2F2", "#FDC5C5"),
+)
+_FLOORS = np.array([b[0] for b in GRADE_BANDS[::-1]], dtype=np.float64)
+_LETTERS = np.array([b[1] for b in GRADE_BANDS[::-1]])
+
+
+def grade_info(s):
+    for floor, *info in GRADE_BANDS:
+        if s >= floor:
+            return tuple(info)
+    return tuple(GRADE_BANDS[-1][1:])
+
+
+def grades(scores):
+    """Vectorized grade letters for an array of scores."""
+    idx = np.searchsorted(_FLOORS, np.asarray(scores, dtype=np.float64), side="right") - 1
+    return _LETTERS[np.maximum(idx, 0)]
@@ -0,0 +1,429 @@
+"""
+ScoreIQ — model registry
+A directory of versioned artifacts plus manifest.json naming the active
+version and an optional shadow candidate. LiveModel serves the active
+version and polls the manifest from a background thread: a new version is
+loaded, checked against the golden set and swapped in with one reference
+assignment, so every session picks it up on its next rerun and in-flight
+reruns finish on the model they started with. Shadow scoring replays a
+sampled fraction of traffic through the candidate on a worker thread and
+logs the score deltas.
+
+Run: python -m scoreiq registry publish student_model.npz --shadow 0.1
+"""
+
+import json, os, queue, random, shutil, sys, threading, time
+from collections import namedtuple
+
+import numpy as np
+
+from . import artifact, loader, shared
+from .engine import FEATURES
+from .profile import LOWER, UPPER, grades
+
+REGISTRY_DIR = "models"
+MANIFEST, GOLDEN = "manifest.json", "golden.npz"
+POLL_SECONDS = 2.0
+MAE_SLACK = 0.5        # golden-set MAE a new version may lose vs the one it replaces, in points
+PROBE_ROWS = 512       # seeded in-range profiles checked when there is no golden set
+SHADOW_QUEUE = 256     # pending shadow batches; beyond this they are dropped, never waited on
+
+Active = namedtuple("Active", "version scorer checksum")
+
+
+class RegistryError(ValueError):
+    """Raised when a version is unknown, fails to load or fails validation."""
+
+
+def _write_atomic(path, write):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "wb") as f:
+        write(f)
+    os.replace(tmp, path)
+
+
+# ── REGISTRY ───────────────────────────────────────────────────
+class Registry:
+    """Versioned artifacts `<version>.npz`, a golden set and the manifest under one directory."""
+
+    def __init__(self, root=REGISTRY_DIR):
+        self.root = root
+        self.manifest_path = os.path.join(root, MANIFEST)
+
+    def exists(self):
+        return os.path.exists(self.manifest_path)
+
+    def stamp(self):
+        """Cheap change marker for the manifest (None when absent)."""
+        try:
+            st = os.stat(self.manifest_path)
+        except FileNotFoundError:
+            return None
+        return st.st_mtime_ns, st.st_size
+
+    def manifest(self):
+        if not self.exists():
+            return {"active": None, "shadow": None, "shadow_rate": 0.0, "versions": {}}
+        with open(self.manifest_path) as f:
+            return json.load(f)
+
+    def _save_manifest(self, m):
+        os.makedirs(self.root, exist_ok=True)
+        _write_atomic(self.manifest_path, lambda f: f.write(json.dumps(m, indent=2).encode()))
+
+    def path(self, version):
+        return os.path.join(self.root, f"{version}.npz")
+
+    def load(self, version):
+        """Verified scorer for a published version."""
+        entry = self.manifest()["versions"].get(version)
+        if entry is None:
+            raise RegistryError(f"unknown model version {version!r}")
+        try:
+            scorer = artifact.load(self.path(version), FEATURES)
+        except artifact.ArtifactError as e:
+            raise RegistryError(str(e)) from e
+        if artifact.checksum(scorer) != entry["checksum"]:
+            raise RegistryError(f"{version}: artifact does not match the manifest checksum")
+        return scorer
+
+    # ── golden set ──
+    def golden(self):
+        """(X, y) of the golden set, or None when none was recorded."""
+        path = os.path.join(self.root, GOLDEN)
+        if not os.path.exists(path):
+            return None
+        with np.load(path, allow_pickle=False) as z:
+            return z["X"], z["y"]
+
+    def set_golden(self, X, y):
+        os.makedirs(self.root, exist_ok=True)
+        _write_atomic(os.path.join(self.root, GOLDEN), lambda f: np.savez(
+            f, X=np.asarray(X, dtype=np.float64), y=np.asarray(y, dtype=np.float64)))
+
+    def validate(self, scorer, against=None):
+        """Golden-set report for `scorer`; raises RegistryError when it fails.
+
+        Every score must be finite and inside the clip range. With a labelled
+        golden set, the MAE may not exceed that of `against` by more than
+        MAE_SLACK points.
+        """
+        gold = self.golden()
+        X = gold[0] if gold is not None else np.floor(
+            np.random.default_rng(0).uniform(LOWER, UPPER + 1, size=(PROBE_ROWS, len(FEATURES))))
+        y = scorer.predict(X)
+        if not np.isfinite(y).all() or (y < scorer.lo).any() or (y > scorer.hi).any():
+            raise RegistryError("golden set: non-finite or out-of-range scores")
+        report = {"rows": len(X)}
+        if gold is not None:
+            report["mae"] = float(np.abs(y - gold[1]).mean())
+            if against is not None:
+                limit = float(np.abs(against.predict(X) - gold[1]).mean()) + MAE_SLACK
+                if report["mae"] > limit:
+                    raise RegistryError(f"golden set: MAE {report['mae']:.3f} exceeds {limit:.3f}")
+        return report
+
+    # ── changes ──
+    def publish(self, src, version=None, activate=False, shadow=0.0):
+        """Copy an artifact in as a new version; returns its name.
+
+        The first version, or any with `activate`, becomes active; otherwise a
+        `shadow` rate > 0 makes it the shadow candidate.
+        """
+        try:
+            scorer = artifact.load(src, FEATURES)
+        except artifact.ArtifactError as e:
+            raise RegistryError(str(e)) from e
+        m = self.manifest()
+        if version is None:
+            n = [int(v[1:]) for v in m["versions"] if v[:1] == "v" and v[1:].isdigit()]
+            version = f"v{max(n, default=0) + 1}"
+        if version in m["versions"]:
+            raise RegistryError(f"version {version!r} already exists")
+        report = self.validate(scorer, self.load(m["active"]) if m["active"] else None)
+        os.makedirs(self.root, exist_ok=True)
+        # artifact before manifest: a watcher never sees a version whose file is missing
+        with open(src, "rb") as s:
+            _write_atomic(self.path(version), lambda f: shutil.copyfileobj(s, f))
+        m["versions"][version] = {
+            "checksum": artifact.checksum(scorer), "kind": scorer.kind, "source": os.path.basename(src),
+            "published": time.strftime("%Y-%m-%dT%H:%M:%S%z"), "golden": report,
+        }
+        if activate or m["active"] is None:
+            m["active"] = version
+        elif shadow > 0:
+            m["shadow"], m["shadow_rate"] = version, float(shadow)
+        self._save_manifest(m)
+        return version
+
+    def activate(self, version):
+        m = self.manifest()
+        scorer = self.load(version)
+        self.validate(scorer, self.load(m["active"]) if m["active"] and m["active"] != version else None)
+        m["active"] = version
+        if m.get("shadow") == version:
+            m["shadow"], m["shadow_rate"] = None, 0.0
+        self._save_manifest(m)
+
+    def set_shadow(self, version, rate):
+        """Shadow-score `rate` of traffic with `version`; None or rate 0 turns shadowing off."""
+        m = self.manifest()
+        if version is not None and rate > 0:
+            self.validate(self.load(version))
+            m["shadow"], m["shadow_rate"] = version, float(rate)
+        else:
+            m["shadow"], m["shadow_rate"] = None, 0.0
+        self._save_manifest(m)
+
+
+# ── SHADOW SCORING ─────────────────────────────────────────────
+class Shadow:
+    """Scores a sampled fraction of traffic with a candidate on a worker thread and logs deltas."""
+
+    def __init__(self, version, scorer, rate, log=None, maxsize=SHADOW_QUEUE):
+        self.version, self.scorer, self.rate, self.log = version, scorer, rate, log
+        self.queue = queue.Queue(maxsize)
+        self.rows = self.batches = self.dropped = self.grade_changes = 0
+        self.delta_sum = self.abs_sum = self.max_abs = 0.0
+        self._rng = random.Random()
+        self._lock = threading.Lock()
+        self.thread = threading.Thread(target=self._run, name=f"scoreiq-shadow-{version}", daemon=True)
+        self.thread.start()
+
+    def offer(self, X, scores):
+        """Queue rows and their served scores with probability `rate`; never blocks."""
+        if self._rng.random() >= self.rate:
+            return False
+        try:
+            self.queue.put_nowait((np.array(X, dtype=np.float64, ndmin=2),
+                                   np.array(scores, dtype=np.float64).reshape(-1)))
+        except queue.Full:
+            self.dropped += 1
+            return False
+        return True
+
+    def _run(self):
+        while True:
+            item = self.queue.get()
+            if item is None:
+                return
+            X, served = item
+            try:
+                d = self.scorer.predict(X) - served
+                flips = int((grades(served) != grades(served + d)).sum())
+            except Exception as e:   # a bad candidate must never take the worker down
+                print(f"scoreiq shadow {self.version}: {e}", file=sys.stderr)
+                continue
+            with self._lock:
+                self.rows += len(d); self.batches += 1; self.grade_changes += flips
+                self.delta_sum += float(d.sum()); self.abs_sum += float(np.abs(d).sum())
+                self.max_abs = max(self.max_abs, float(np.abs(d).max()))
+            if self.log:
+                with open(self.log, "a") as f:
+                    f.write(json.dumps({"ts": time.time(), "shadow": self.version, "rows": len(d),
+                                        "mean_delta": round(float(d.mean()), 4),
+                                        "max_abs_delta": round(float(np.abs(d).max()), 4),
+                                        "grade_changes": flips}) + "\n")
+
+    def stats(self):
+        with self._lock:
+            n = self.rows or 1
+            return {"version": self.version, "rate": self.rate, "rows": self.rows,
+                    "batches": self.batches, "dropped": self.dropped,
+                    "mean_delta": self.delta_sum / n, "mean_abs_delta": self.abs_sum / n,
+                    "max_abs_delta": self.max_abs, "grade_changes": self.grade_changes}
+
+    def stop(self):
+        self.queue.put(None)
+
+
+# ── LIVE MODEL ─────────────────────────────────────────────────
+class LiveModel:
+    """The serving model, as an Active snapshot replaced whole whenever the registry changes.
+
+    With a shared store and no registry, it follows the store's CURRENT version
+    instead; with both, each version it activates is published to the store.
+    """
+
+    def __init__(self, registry=None, scorer=None, log=None, store=None):
+        self.registry, self.log, self.store = registry, log, store
+        self.shadow = None
+        self.error = None
+        self.swaps = 0
+        self._stamp = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self.active = Active(None, scorer, artifact.checksum(scorer)) if scorer is not None else None
+        if registry is None and store is not None:
+            self._stamp = store.stamp()
+        if registry is not None:
+            self.refresh()
+        if self.active is None:   # empty or broken registry: serve what the loader finds
+            scorer = loader.load_model()
+            self.active = Active(None, scorer, artifact.checksum(scorer))
+
+    @property
+    def scorer(self):
+        return self.active.scorer
+
+    def offer(self, X, scores):
+        """Hand served rows to the shadow candidate, if any (sampled, non-blocking)."""
+        shadow = self.shadow
+        if shadow is not None:
+            shadow.offer(X, scores)
+
+    def refresh(self):
+        """Apply manifest (or shared store) changes; True when the active model was swapped."""
+        if self.registry is None:
+            return self._follow_store() if self.store is not None else False
+        with self._lock:
+            stamp = self.registry.stamp()
+            if stamp is None or stamp == self._stamp:
+                return False
+            self._stamp = stamp
+            swapped = False
+            try:
+                m = self.registry.manifest()
+                current = self.active
+                if m["active"] and (current is None or m["active"] != current.version):
+                    scorer = self.registry.load(m["active"])
+                    self.registry.validate(scorer, current.scorer if current else None)
+                    self.active = Active(m["active"], scorer, artifact.checksum(scorer))
+                    self.swaps += current is not None
+                    swapped = True
+                    self._share()
+                self._update_shadow(m.get("shadow"), m.get("shadow_rate", 0.0))
+                self.error = None
+            except (RegistryError, OSError, ValueError, KeyError) as e:
+                self.error = str(e)   # keep serving the current version
+            return swapped
+
+    def _follow_store(self):
+        with self._lock:
+            stamp = self.store.stamp()
+            if stamp is None or stamp == self._stamp:
+                return False
+            self._stamp = stamp
+            try:
+                att = self.store.attach()
+            except shared.SharedError as e:
+                self.error = str(e)   # keep serving the current version
+                return False
+            self.error = None
+            current = self.active
+            if att is None or att.scorer is current.scorer:
+                return False
+            self.active = Active(None, att.scorer, att.checksum)
+            self.swaps += att.checksum != current.checksum
+            return True
+
+    def _share(self):
+        if self.store is not None:
+            try:
+                self.store.publish(self.active.scorer)
+            except OSError:
+                pass   # the store is an optimisation; serving goes on without it
+
+    def warm(self, checksum):
+        """Precomputed cache entries for the model with `checksum` from the shared store, if any."""
+        return self.store.warm(checksum) if self.store is not None else []
+
+    def _update_shadow(self, version, rate):
+        old = self.shadow
+        if old is not None and old.version == version and rate > 0:
+            old.rate = rate
+            return
+        self.shadow = None
+        if old is not None:
+            old.stop()
+        active = self.active   # no registry version serving (loader fallback): nothing to shadow against
+        if version and rate > 0 and active is not None and active.version is not None and version != active.version:
+            self.shadow = Shadow(version, self.registry.load(version), rate, self.log)
+
+    def watch(self, every=POLL_SECONDS):
+        """Poll the manifest from a daemon thread; returns self."""
+        def loop():
+            while not self._stop.wait(every):
+                self.refresh()
+        threading.Thread(target=loop, name="scoreiq-registry-watch", daemon=True).start()
+        return self
+
+    def close(self):
+        self._stop.set()
+        if self.shadow is not None:
+            self.shadow.stop()
+
+    def status(self):
+        a = self.active
+        return {"version": a.version, "kind": a.scorer.kind, "checksum": a.checksum, "swaps": self.swaps,
+                "error": self.error, "shadow": self.shadow.stats() if self.shadow else None}
+
+
+def live(root=None, watch=True):
+    """LiveModel over the registry at `root` (SCOREIQ_REGISTRY, default models/), watched in the
+    background; without a manifest, the loader's model served as a fixed version, or as the
+    shared store's current one (SCOREIQ_SHARED_DIR), followed like the manifest."""
+    reg = Registry(root or os.environ.get("SCOREIQ_REGISTRY", REGISTRY_DIR))
+    store = shared.store()
+    if not reg.exists():
+        model = LiveModel(scorer=loader.load_model(), store=store)
+        if store is None:
+            return model
+    else:
+        model = LiveModel(reg, log=os.environ.get("SCOREIQ_SHADOW_LOG"), store=store)
+    return model.watch(float(os.environ.get("SCOREIQ_REGISTRY_POLL", POLL_SECONDS))) if watch else model
+
+
+# ── CLI ────────────────────────────────────────────────────────
+def add_parser(sub):
+    p = sub.add_parser("registry", help="publish, activate and shadow model versions")
+    p.add_argument("--root", default=os.environ.get("SCOREIQ_REGISTRY", REGISTRY_DIR))
+    act = p.add_subparsers(dest="action", required=True)
+    pub = act.add_parser("publish", help="add an artifact as a new version")
+    pub.add_argument("src", help="model artifact (.npz)")
+    pub.add_argument("--version")
+    how = pub.add_mutually_exclusive_group()
+    how.add_argument("--activate", action="store_true", help="serve it right away")
+    how.add_argument("--shadow", type=float, default=0.0, metavar="RATE",
+                     help="shadow-score this fraction of traffic with it")
+    a = act.add_parser("activate", help="serve a published version")
+    a.add_argument("version")
+    s = act.add_parser("shadow", help="set or clear (rate 0) the shadow candidate")
+    s.add_argument("version")
+    s.add_argument("rate", type=float)
+    g = act.add_parser("golden", help="record a labelled golden set from a dataset")
+    g.add_argument("src", help=".csv / .parquet with the notebook's columns")
+    g.add_argument("--rows", type=int, default=1000)
+    g.add_argument("--target", default="Exam_Score")
+    act.add_parser("list", help="show versions, active and shadow")
+    p.set_defaults(func=main)
+
+
+def main(args):
+    reg = Registry(args.root)
+    try:
+        if args.action == "publish":
+            v = reg.publish(args.src, args.version, args.activate, args.shadow)
+            print(f"published {v} ({reg.manifest()['versions'][v]['golden']})")
+        elif args.action == "activate":
+            reg.activate(args.version)
+        elif args.action == "shadow":
+            reg.set_shadow(args.version, args.rate)
+        elif args.action == "golden":
+            import pandas as pd
+            from .batch import encode_frame, read_chunks
+            df = pd.concat(read_chunks(args.src), ignore_index=True)
+            X = encode_frame(df)
+            y = pd.to_numeric(df[args.target], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+            ok = np.flatnonzero(~(np.isnan(X).any(axis=1) | np.isnan(y)))
+            rows = np.sort(np.random.default_rng(0).permutation(ok)[:args.rows])
+            reg.set_golden(X[rows], y[rows])
+            print(f"golden set: {len(rows):,} rows → {os.path.join(args.root, GOLDEN)}")
+    except RegistryError as e:
+        print(f"registry: {e}", file=sys.stderr)
+        return 1
+    m = reg.manifest()
+    for v, e in m["versions"].items():
+        tag = "active" if v == m["active"] else f"shadow {m['shadow_rate']:.0%}" if v == m.get("shadow") else ""
+        print(f"{v:<8} {e['kind']:<10} {e['checksum'][:12]}  {e['published']}  {e['source']:<28} {tag}")
+    return 0
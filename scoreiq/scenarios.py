@@ -0,0 +1,123 @@
+"""
+ScoreIQ — scenario explorer
+Every combination of several levers at once (hours, attendance, tutoring,
+motivation, ...), scored chunk by chunk over the Cartesian product. Keeps a
+running top-k by gain per unit of effort and the effort / gain Pareto
+frontier, and yields both after each chunk so callers can show results
+while the rest is still being scored.
+"""
+
+import numpy as np
+
+from .counterfactual import EFFORT as ACTION_EFFORT
+from .engine import FEATURES, as_matrix
+from .sensitivity import closed_form, is_quadratic
+
+# Effort per notch, in the same hours-per-week units as the grade planner.
+# Family income and previous scores are not levers.
+EFFORT = {**ACTION_EFFORT, "Physical_Activity": 1.0, "Parental_Involvement": 3.0,
+          "Access_to_Resources": 3.0, "Motivation_Level": 5.0, "Internet_Access": 2.0,
+          "Teacher_Quality": 5.0}
+SCENARIO_CHUNK = 1 << 18   # combinations scored per step
+TOP_K = 10
+
+
+class _Best:
+    """Running top-k (by gain per effort) and Pareto frontier over flat combination indices."""
+
+    def __init__(self, k):
+        self.k = k
+        self.top = (np.empty(0, np.int64), np.empty(0), np.empty(0))
+        self.front = (np.empty(0, np.int64), np.empty(0), np.empty(0))
+
+    def add(self, flat, gain, effort):
+        live = (gain > 1e-9) & (effort > 0)
+        flat, gain, effort = flat[live], gain[live], effort[live]
+        f, g, e = (np.concatenate(p) for p in zip(self.top, (flat, gain, effort)))
+        if len(f) > self.k:
+            keep = np.argpartition(-(g / e), self.k - 1)[:self.k]
+            f, g, e = f[keep], g[keep], e[keep]
+        order = np.lexsort((-g, -(g / e)))
+        self.top = (f[order], g[order], e[order])
+        self.front = pareto(*(np.concatenate(p) for p in zip(self.front, (flat, gain, effort))))
+
+
+def pareto(flat, gain, effort):
+    """Points no other point beats on both effort (lower) and gain (higher), by rising effort."""
+    order = np.lexsort((-gain, effort))
+    g = gain[order]
+    best_before = np.concatenate(([-np.inf], np.maximum.accumulate(g)[:-1]))
+    keep = order[g > best_before]
+    return flat[keep], gain[keep], effort[keep]
+
+
+def size(levers):
+    return int(np.prod([len(v) for _, v in levers]))
+
+
+def explore(scorer, base, levers, k=TOP_K, chunk=SCENARIO_CHUNK, effort=EFFORT):
+    """Score every combination of `levers`, a sequence of (feature index, values).
+
+    Yields after each chunk a dict with ``done`` / ``total`` combinations,
+    the base ``score``, and ``top`` / ``pareto`` lists of scenarios, each a
+    dict of ``values`` (one per lever), ``score``, ``gain`` and ``effort``.
+    """
+    x0 = as_matrix(base)[0]
+    values = [np.asarray(v, dtype=np.float64) for _, v in levers]
+    idx = [int(i) for i, _ in levers]
+    missing = [FEATURES[i] for i in idx if FEATURES[i] not in effort]
+    if missing:
+        raise ValueError(f"no effort defined for levers {missing}")
+    shape = tuple(len(v) for v in values)
+    total = size(levers)
+    cost = [effort[FEATURES[i]] * np.abs(v - x0[i]) for i, v in zip(idx, values)]
+    s0 = float(scorer.predict(x0[None])[0])
+    exact = closed_form(scorer)
+    if exact:
+        # per-lever 1-D terms, plus pairwise products for a quadratic form
+        raw0 = float(scorer.raw(x0[None])[0])
+        delta = [v - x0[i] for i, v in zip(idx, values)]
+        if is_quadratic(scorer):
+            g = scorer.gradient(x0)
+            pts = [g[i] * d + scorer.Q[i, i] * d * d for i, d in zip(idx, delta)]
+            pairs = [(a, b, 2 * scorer.Q[idx[a], idx[b]]) for a in range(len(idx))
+                     for b in range(a + 1, len(idx)) if scorer.Q[idx[a], idx[b]]]
+        else:
+            pts = [scorer.coef[i] * d for i, d in zip(idx, delta)]
+            pairs = []
+    best = _Best(k)
+    if total == 0:   # some lever has no values: nothing to score
+        yield {"done": 0, "total": 0, "score": s0, "top": [], "pareto": []}
+        return
+
+    def rows(flat, gain, eff):
+        digits = np.unravel_index(flat, shape)
+        return [{"values": [float(values[j][d[n]]) for j, d in enumerate(digits)],
+                 "score": s0 + float(gain[n]), "gain": float(gain[n]), "effort": float(eff[n])}
+                for n in range(len(flat))]
+
+    for start in range(0, total, chunk):
+        flat = np.arange(start, min(start + chunk, total))
+        digits = np.unravel_index(flat, shape)
+        eff = sum(c[d] for c, d in zip(cost, digits))
+        if exact:
+            z = raw0 + sum(p[d] for p, d in zip(pts, digits))
+            for a, b, q in pairs:
+                z = z + q * delta[a][digits[a]] * delta[b][digits[b]]
+            y = np.clip(z, scorer.lo, scorer.hi)
+        else:
+            X = np.repeat(x0[None], len(flat), axis=0)
+            for i, v, d in zip(idx, values, digits):
+                X[:, i] = v[d]
+            y = scorer.predict(X)
+        best.add(flat, y - s0, eff)
+        yield {"done": int(flat[-1]) + 1, "total": total, "score": s0,
+               "top": rows(*best.top), "pareto": rows(*best.front)}
+
+
+def run(scorer, base, levers, k=TOP_K, chunk=SCENARIO_CHUNK, effort=EFFORT):
+    """The final result of `explore`."""
+    out = None
+    for out in explore(scorer, base, levers, k, chunk, effort):
+        pass
+    return out
@@ -0,0 +1,86 @@
+"""
+ScoreIQ — sensitivity analysis
+1-D sweeps and N-D grids around a reference profile.
+Linear and quadratic scorers are solved in closed form (a sweep is a 1-D
+quadratic, a grid an outer sum plus pairwise outer products); anything else
+is scored in batches.
+"""
+
+import numpy as np
+
+from .engine import as_matrix, vary
+
+GRID_CHUNK = 65536   # rows per batch when a grid has to be materialised
+
+
+def is_linear(scorer):
+    return getattr(scorer, "kind", None) == "linear"
+
+
+def is_quadratic(scorer):
+    return getattr(scorer, "kind", None) == "quadratic"
+
+
+def closed_form(scorer):
+    """Linear or quadratic: raw scores, sweeps and attributions have exact formulas."""
+    return is_linear(scorer) or is_quadratic(scorer)
+
+
+def _terms(scorer, x0, idx):
+    """Gradient at x0 and Q's diagonal for `idx` (None for linear scorers: no curvature term)."""
+    if is_linear(scorer):
+        return scorer.coef[idx], None
+    return scorer.gradient(x0)[idx], np.diag(scorer.Q)[idx]
+
+
+def curve(scorer, base, idx, values):
+    """Scores of `base` with feature `idx` swept over `values`."""
+    values = np.asarray(values, dtype=np.float64)
+    if closed_form(scorer):
+        x0 = as_matrix(base)[0]
+        g, q = _terms(scorer, x0, idx)
+        d = values - x0[idx]
+        ys = scorer.raw(x0)[0] + g * d
+        if q is not None:
+            ys += q * d * d
+        return np.clip(ys, scorer.lo, scorer.hi)
+    return scorer.predict(vary(base, idx, values))
+
+
+def grid(scorer, base, axes):
+    """Scores over the Cartesian product of `axes`, a sequence of (idx, values).
+
+    The result has one dimension per axis, in the order given — e.g.
+    ``grid(s, base, [(1, attend), (0, hours)])`` is indexed ``[attend, hours]``.
+    """
+    x0 = as_matrix(base)[0]
+    axes = [(idx, np.asarray(v, dtype=np.float64)) for idx, v in axes]
+    shape = tuple(len(v) for _, v in axes)
+
+    if closed_form(scorer):
+        # outer sum of per-axis 1-D terms (+ pairwise outer products for Q), broadcast into the grid
+        Z = np.full(shape, scorer.raw(x0)[0])
+        deltas = []
+        for k, (idx, v) in enumerate(axes):
+            step = [1] * len(axes); step[k] = len(v)
+            g, q = _terms(scorer, x0, idx)
+            d = (v - x0[idx]).reshape(step)
+            Z = Z + (g * d if q is None else g * d + q * d * d)
+            deltas.append((idx, d))
+        if is_quadratic(scorer):
+            for k, (i, di) in enumerate(deltas):
+                for j, dj in deltas[k + 1:]:
+                    if scorer.Q[i, j]:
+                        Z = Z + 2 * scorer.Q[i, j] * di * dj
+        return np.clip(Z, scorer.lo, scorer.hi)
+
+    mesh = np.meshgrid(*[v for _, v in axes], indexing="ij")
+    flat = [m.ravel() for m in mesh]
+    n = flat[0].size if flat else 1
+    out = np.empty(n)
+    for s in range(0, n, GRID_CHUNK):
+        X = np.repeat(x0[None, :], min(GRID_CHUNK, n - s), axis=0)
+        for (idx, _), col in zip(axes, flat):
+            X[:, idx] = col[s:s + GRID_CHUNK]
+        out[s:s + GRID_CHUNK] = scorer.predict(X)
+    return out.reshape(shape)
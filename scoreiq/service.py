@@ -0,0 +1,161 @@
+"""
+ScoreIQ — scoring service
+Headless JSON API over the same model, encodings and grade scale as the app.
+Concurrent single-profile requests are coalesced into vectorized micro-batches.
+The model comes from the registry and is hot-swapped when a new version is
+activated; a shadow candidate sees a sampled copy of the traffic, and every
+scored profile feeds the input drift monitor (GET /drift).
+
+Run: uvicorn scoreiq.service:app --port 8000 --workers 4
+"""
+
+import asyncio, os
+from contextlib import asynccontextmanager
+
+import numpy as np
+from fastapi import Body, FastAPI, HTTPException
+from fastapi.responses import PlainTextResponse
+
+from . import attribution, drift, registry
+from .engine import FEATURES
+from .profile import encode, grades
+
+MAX_BATCH = int(os.environ.get("SCOREIQ_MAX_BATCH", 512))           # rows per micro-batch
+MAX_WAIT = float(os.environ.get("SCOREIQ_MAX_WAIT_MS", 2)) / 1000   # linger for more rows
+MAX_ROWS = int(os.environ.get("SCOREIQ_MAX_ROWS", 10000))           # cap on /score/batch
+
+
+def score_rows(scorer, X):
+    """Score, grade and per-feature contributions vs the training mean for each row of an (N, 12) matrix.
+
+    `baseline` is the reference profile's score; adding the contributions gives the unclipped score.
+    `percentile` ranks the score in the model's reference cohort (None when it carries none).
+    """
+    scores = scorer.predict(X)
+    base = round(attribution.baseline(scorer), 4)
+    contrib = np.round(attribution.attribute(scorer, X), 4).tolist()
+    pct = np.round(scorer.cohort.rank(scores), 1).tolist() if scorer.cohort is not None else [None] * len(X)
+    return [
+        {"score": round(float(s), 2), "grade": str(g), "percentile": p, "baseline": base,
+         "contributions": dict(zip(FEATURES, c))}
+        for s, g, p, c in zip(scores, grades(scores), pct, contrib)
+    ]
+
+
+def encode_all(profiles):
+    try:
+        return np.array([encode(p) for p in profiles], dtype=np.float64).reshape(-1, len(FEATURES))
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=422, detail=str(e)) from None
+
+
+def model_fields(active):
+    """The model that produced a response, as read when it was scored (not after a later swap)."""
+    return {"intercept": active.scorer.intercept, "version": active.version, "checksum": active.checksum}
+
+
+# ── MICRO-BATCHER ──────────────────────────────────────────────
+class MicroBatcher:
+    """Collects rows submitted by concurrent requests and scores them together."""
+
+    def __init__(self, live, monitor=None, max_batch=MAX_BATCH, max_wait=MAX_WAIT):
+        self.live, self.monitor, self.max_batch, self.max_wait = live, monitor, max_batch, max_wait
+        self.queue = asyncio.Queue()
+        self.task = None
+
+    def start(self):
+        self.task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        if self.task:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+
+    async def submit(self, row):
+        """(result, Active model that scored it) for one encoded row."""
+        fut = asyncio.get_running_loop().create_future()
+        await self.queue.put((row, fut))
+        return await fut
+
+    def _drain(self, rows, futs):
+        while len(rows) < self.max_batch and not self.queue.empty():
+            row, fut = self.queue.get_nowait()
+            rows.append(row); futs.append(fut)
+
+    async def _run(self):
+        while True:
+            row, fut = await self.queue.get()
+            rows, futs = [row], [fut]
+            self._drain(rows, futs)
+            if len(rows) < self.max_batch and self.max_wait > 0:
+                await asyncio.sleep(self.max_wait)
+                self._drain(rows, futs)
+            try:
+                X = np.stack(rows)
+                active = self.live.active   # one version per micro-batch, returned with each result
+                results = score_rows(active.scorer, X)
+                self.live.offer(X, [r["score"] for r in results])
+                if self.monitor:
+                    self.monitor.observe(X)
+            except Exception as e:   # never leave callers hanging
+                for f in futs:
+                    if not f.done():
+                        f.set_exception(e)
+                continue
+            for f, r in zip(futs, results):
+                if not f.done():
+                    f.set_result((r, active))
+
+
+# ── APP ────────────────────────────────────────────────────────
+@asynccontextmanager
+async def lifespan(app):
+    app.state.live = registry.live()
+    app.state.drift = drift.monitor()
+    app.state.batcher = MicroBatcher(app.state.live, app.state.drift)
+    app.state.batcher.start()
+    yield
+    await app.state.batcher.stop()
+    app.state.live.close()
+    app.state.drift.close()
+
+app = FastAPI(title="ScoreIQ", lifespan=lifespan)
+
+
+@app.get("/healthz")
+async def healthz():
+    ms = app.state.live.status()
+    return {"status": "ok", "model": ms["kind"], "version": ms["version"], "checksum": ms["checksum"],
+            "swaps": ms["swaps"], "registry_error": ms["error"], "shadow": ms["shadow"],
+            "features": list(FEATURES)}
+
+
+@app.post("/score")
+async def score(profile: dict = Body(...)):
+    """Score one profile, e.g. {"Hours_Studied": 25, "Motivation_Level": "High"}."""
+    X = encode_all([profile])
+    result, active = await app.state.batcher.submit(X[0])
+    return {**result, **model_fields(active)}
+
+
+@app.post("/score/batch")
+async def score_batch(profiles: list[dict] = Body(..., embed=True)):
+    """Score up to MAX_ROWS profiles in one vectorized pass."""
+    if len(profiles) > MAX_ROWS:
+        raise HTTPException(status_code=413, detail=f"at most {MAX_ROWS} profiles per request")
+    X = encode_all(profiles)
+    active = app.state.live.active
+    results = score_rows(active.scorer, X)
+    app.state.live.offer(X, [r["score"] for r in results])
+    app.state.drift.observe(X)
+    return {"results": results, **model_fields(active)}
+
+
+@app.get("/drift")
+async def drift_report(format: str = "json"):
+    """Per-feature PSI / KS of the scored inputs vs the training inputs (format=prom for Prometheus)."""
+    report = app.state.drift.report(app.state.live.scorer)
+    return PlainTextResponse(drift.prometheus(report)) if format == "prom" else report
@@ -0,0 +1,311 @@
+"""
+ScoreIQ — host-level shared store
+One copy of the serving model per host, for every Streamlit process, service
+worker and batch job on it. The first process to need a model publishes it
+once as an immutable version directory: the artifact, its percentile index
+and drift reference as raw .npy tables, and the results a new session asks
+for first (the default profile's sensitivity curves and score map) as one
+flat table. Every other process attaches with np.load(mmap_mode="r"), so the
+tables exist once in the page cache however many replicas run, and a fresh
+process is ready without retraining or recomputing anything. CURRENT names
+the live version and is replaced with os.replace, so a reader sees a version
+bump whole or not at all.
+
+Opt in with SCOREIQ_SHARED_DIR; a tmpfs such as /dev/shm/scoreiq keeps it in RAM.
+
+Run: python -m scoreiq shared publish [student_model.npz]
+"""
+
+import copy, functools, hashlib, json, os, shutil, sys, threading, time
+from collections import namedtuple
+
+import numpy as np
+
+from . import artifact, sensitivity
+from .drift import Histograms
+from .engine import FEATURES
+from .percentile import ScoreIndex
+from .profile import BOUNDS, DEFAULTS, encode
+
+SHARED_DIR = "/dev/shm/scoreiq"
+CURRENT, INDEX, MODEL, WARM = "CURRENT", "index.json", "model.npz", "warm.npy"
+LOCK = ".publishing"
+KEEP = 2                  # versions kept on disk (and attached per process), the current one included
+BOOTSTRAP_SECONDS = 60.0  # how long a process waits for another one publishing the first version
+# the Analytics page's score map: attendance × study hours
+GRID_AXES = ((1, np.linspace(60, 100, 40)), (0, np.linspace(1, 44, 40)))
+
+Attached = namedtuple("Attached", "name scorer checksum warm")
+
+
+class SharedError(ValueError):
+    """Raised when a published version is missing, incomplete or fails its checksums."""
+
+
+def version_name(scorer):
+    """Directory name of a version: the model checksum together with its cohort and input tables."""
+    h = hashlib.sha256(artifact.checksum(scorer).encode())
+    if scorer.cohort is not None:
+        h.update(artifact.cohort_checksum(scorer.cohort).encode())
+    if scorer.inputs is not None:
+        h.update(artifact.inputs_checksum(scorer.inputs).encode())
+    return h.hexdigest()[:16]
+
+
+def warm_set(scorer):
+    """(namespace, key, array) PredictionCache entries for the default profile, keyed as app.py
+    asks for them: every feature's sensitivity curve over its range, and the Analytics score map."""
+    base = encode(DEFAULTS)
+    out = []
+    for j, f in enumerate(FEATURES):
+        xs = np.arange(BOUNDS[f][0], BOUNDS[f][1] + 1)
+        out.append(("curve", [base, j, xs.tolist()], sensitivity.curve(scorer, base, j, xs)))
+    axes = [[j, v.tolist()] for j, v in GRID_AXES]
+    out.append(("grid", [base, axes], sensitivity.grid(scorer, base, GRID_AXES)))
+    return out
+
+
+def _set_current(path, name):
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, "w") as f:
+        f.write(name + "\n")
+    os.replace(tmp, path)
+
+
+# ── STORE ──────────────────────────────────────────────────────
+class Store:
+    """Published versions under one directory, and this process's attachments to them."""
+
+    def __init__(self, root=SHARED_DIR):
+        self.root = root
+        self._attached = {}
+        self._lock = threading.Lock()
+
+    def _path(self, *parts):
+        return os.path.join(self.root, *parts)
+
+    def current(self):
+        try:
+            with open(self._path(CURRENT)) as f:
+                return f.read().strip() or None
+        except FileNotFoundError:
+            return None
+
+    def stamp(self):
+        """Cheap change marker for CURRENT (None when nothing is published)."""
+        try:
+            st = os.stat(self._path(CURRENT))
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns
+
+    def versions(self):
+        """Complete versions, oldest first."""
+        try:
+            names = [d for d in os.listdir(self.root) if os.path.isfile(self._path(d, INDEX))]
+        except FileNotFoundError:
+            return []
+        return sorted(names, key=lambda d: os.stat(self._path(d, INDEX)).st_mtime_ns)
+
+    # ── publishing ──
+    def publish(self, scorer, activate=True):
+        """Write `scorer` as a version unless the host already has it; returns its name.
+
+        With `activate` it becomes CURRENT, and versions beyond the newest KEEP are removed.
+        """
+        name = version_name(scorer)
+        if not os.path.isfile(self._path(name, INDEX)):
+            self._write(name, scorer)
+        if activate and self.current() != name:
+            _set_current(self._path(CURRENT), name)
+            self.gc()
+        return name
+
+    def _write(self, name, scorer):
+        # built under a temporary name and renamed whole: a version directory never changes once visible
+        tmp = self._path(f".{name}.{os.getpid()}.tmp")
+        shutil.rmtree(tmp, ignore_errors=True)
+        os.makedirs(tmp)
+        model = copy.copy(scorer)
+        model.cohort = model.inputs = None   # stored beside it as raw, mappable tables
+        index = {"checksum": artifact.save(model, os.path.join(tmp, MODEL)), "kind": scorer.kind,
+                 "published": time.strftime("%Y-%m-%dT%H:%M:%S%z")}
+        if scorer.cohort is not None:
+            np.save(os.path.join(tmp, "cohort_keys.npy"), scorer.cohort.keys)
+            np.save(os.path.join(tmp, "cohort_counts.npy"), scorer.cohort.counts)
+            index["cohort"] = {"resolution": scorer.cohort.resolution,
+                               "checksum": artifact.cohort_checksum(scorer.cohort)}
+        if scorer.inputs is not None:
+            np.save(os.path.join(tmp, "inputs.npy"), scorer.inputs.counts)
+            index["inputs"] = artifact.inputs_checksum(scorer.inputs)
+        entries, flat, offset = [], [], 0
+        for ns, key, value in warm_set(scorer):
+            value = np.asarray(value, dtype=np.float64)
+            entries.append([ns, key, offset, list(value.shape)])
+            flat.append(value.ravel())
+            offset += value.size
+        np.save(os.path.join(tmp, WARM), np.concatenate(flat))
+        index["warm"] = entries
+        with open(os.path.join(tmp, INDEX), "w") as f:
+            json.dump(index, f)
+        try:
+            os.rename(tmp, self._path(name))
+        except OSError:   # another process published the same version first
+            shutil.rmtree(tmp, ignore_errors=True)
+
+    def bootstrap(self, build, wait=BOOTSTRAP_SECONDS):
+        """Scorer of the current version; when there is none, one process on the host runs
+        `build()` and publishes the result while the others wait for it and attach."""
+        att = self._attach_current()
+        if att is not None:
+            return att.scorer
+        lock = self._path(LOCK)
+        deadline = time.monotonic() + wait
+        try:
+            os.makedirs(self.root, exist_ok=True)
+            while True:
+                try:
+                    os.close(os.open(lock, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                    break
+                except FileExistsError:
+                    if time.monotonic() > deadline:   # the publisher died or hung: take over from it
+                        os.unlink(lock)
+                        return self._build(build)
+                    time.sleep(0.05)
+                    att = self._attach_current()
+                    if att is not None:
+                        return att.scorer
+        except OSError:   # store not writable: serve this process's own model
+            return build()
+        try:
+            att = self._attach_current()
+            return att.scorer if att is not None else self._build(build)
+        finally:
+            try:
+                os.unlink(lock)
+            except OSError:
+                pass
+
+    def _build(self, build):
+        scorer = build()
+        try:
+            self.publish(scorer)
+        except OSError:
+            pass
+        return scorer
+
+    # ── attaching ──
+    def attach(self, name=None):
+        """Version `name` (default: CURRENT) with memory-mapped tables; None when nothing is published."""
+        name = name or self.current()
+        if name is None:
+            return None
+        with self._lock:
+            if name in self._attached:
+                return self._attached[name]
+        d = self._path(name)
+        try:
+            with open(os.path.join(d, INDEX)) as f:
+                index = json.load(f)
+            scorer = artifact.load(os.path.join(d, MODEL), FEATURES)
+            table = lambda f: np.load(os.path.join(d, f), mmap_mode="r")
+            if "cohort" in index:
+                scorer.cohort = ScoreIndex(table("cohort_keys.npy"), table("cohort_counts.npy"),
+                                           index["cohort"]["resolution"])
+                if artifact.cohort_checksum(scorer.cohort) != index["cohort"]["checksum"]:
+                    raise SharedError(f"{d}: cohort index checksum mismatch")
+            if "inputs" in index:
+                scorer.inputs = Histograms(table("inputs.npy"))
+                if artifact.inputs_checksum(scorer.inputs) != index["inputs"]:
+                    raise SharedError(f"{d}: input histogram checksum mismatch")
+            flat = table(WARM)
+            warm = [(ns, key, flat[o:o + int(np.prod(shape))].reshape(shape))
+                    for ns, key, o, shape in index["warm"]]
+        except (OSError, ValueError, KeyError) as e:   # ArtifactError is a ValueError
+            raise SharedError(f"{d}: unreadable shared version ({e})") from e
+        att = Attached(name, scorer, index["checksum"], warm)
+        with self._lock:
+            att = self._attached.setdefault(name, att)
+            while len(self._attached) > KEEP:
+                self._attached.pop(next(iter(self._attached)))
+        return att
+
+    def _attach_current(self):
+        try:
+            return self.attach()
+        except SharedError:
+            return None   # removed or half-written under us: treated as nothing published
+
+    def warm(self, checksum):
+        """Precomputed cache entries of the attached version with model `checksum`, if any."""
+        self._attach_current()
+        with self._lock:
+            for att in self._attached.values():
+                if att.checksum == checksum:
+                    return att.warm
+        return []
+
+    # ── housekeeping ──
+    def gc(self, keep=KEEP):
+        """Remove all but the newest `keep` versions, never the current one; returns their names.
+
+        Processes still mapping a removed version keep reading it until they move on.
+        """
+        current = self.current()
+        old = [v for v in self.versions()[:-max(keep, 1)] if v != current]
+        for v in old:
+            shutil.rmtree(self._path(v), ignore_errors=True)
+        return old
+
+    def status(self):
+        current = self.current()
+        out = []
+        for v in self.versions():
+            with open(self._path(v, INDEX)) as f:
+                index = json.load(f)
+            size = sum(e.stat().st_size for e in os.scandir(self._path(v)))
+            out.append({"name": v, "kind": index["kind"], "checksum": index["checksum"],
+                        "published": index["published"], "bytes": size, "current": v == current})
+        return out
+
+
+@functools.lru_cache(maxsize=None)
+def _store(root):
+    return Store(root)
+
+
+def store():
+    """This process's Store at SCOREIQ_SHARED_DIR, or None when sharing is off."""
+    root = os.environ.get("SCOREIQ_SHARED_DIR")
+    return _store(root) if root else None
+
+
+# ── CLI ────────────────────────────────────────────────────────
+def add_parser(sub):
+    p = sub.add_parser("shared", help="publish models into the host's shared store")
+    p.add_argument("--root", default=os.environ.get("SCOREIQ_SHARED_DIR", SHARED_DIR))
+    act = p.add_subparsers(dest="action", required=True)
+    pub = act.add_parser("publish", help="publish an artifact and make it current")
+    pub.add_argument("src", nargs="?", help="model artifact (.npz); default: what the loader finds")
+    act.add_parser("status", help="list published versions")
+    gc = act.add_parser("gc", help="remove old versions")
+    gc.add_argument("--keep", type=int, default=KEEP)
+    p.set_defaults(func=main)
+
+
+def main(args):
+    s = Store(args.root)
+    try:
+        if args.action == "publish":
+            from .loader import load_model, model_path
+            scorer = artifact.load(args.src, FEATURES) if args.src else load_model(model_path())
+            print(f"published {s.publish(scorer)} → {args.root}")
+        elif args.action == "gc":
+            print(f"removed {len(s.gc(args.keep))} version(s)")
+    except (OSError, artifact.ArtifactError) as e:
+        print(f"shared: {e}", file=sys.stderr)
+        return 1
+    for v in s.status():
+        tag = "current" if v["current"] else ""
+        print(f"{v['name']}  {v['kind']:<10} {v['checksum'][:12]}  {v['published']}  {v['bytes']:>9,} B  {tag}")
+    return 0
@@ -0,0 +1,186 @@
+"""
+ScoreIQ — synthetic cohorts
+Rosters in the schema of the notebook's fallback dataset (its 19 input columns
+as category labels, plus Exam_Score) at any size, for load and scale testing.
+Rows are drawn in fixed blocks of BLOCK rows; block b has its own generator
+seeded by SeedSequence(seed, spawn_key=(b,)), which is child b of
+SeedSequence(seed).spawn(). Output is bit-for-bit the same for a given seed,
+whatever the chunk size or number of workers. Chunks stream to CSV, Parquet
+or NPY, so memory is bounded by chunk size × in-flight chunks.
+
+Run: python -m scoreiq synth -n 10000000 -o cohort.parquet --workers 8
+"""
+
+import os, sys, time
+from collections import deque
+
+import numpy as np
+
+from .engine import FEATURES
+from .profile import CATEGORY_MAPS
+
+SEED = 42
+BLOCK = 1 << 16                 # rows per independent stream
+CHUNK_SIZE = 4 * BLOCK
+TARGET = "Exam_Score"
+LEVELS = ("Low", "Medium", "High")
+YES_NO = ("Yes", "No")
+
+# Column order and draws of the notebook's fallback cell: integers in [lo, hi), labels uniform.
+SCHEMA = (
+    ("Hours_Studied", (1, 44)), ("Attendance", (60, 100)), ("Sleep_Hours", (4, 10)),
+    ("Previous_Scores", (50, 100)), ("Tutoring_Sessions", (0, 8)), ("Physical_Activity", (0, 6)),
+    ("Parental_Involvement", LEVELS), ("Access_to_Resources", LEVELS), ("Motivation_Level", LEVELS),
+    ("Internet_Access", YES_NO), ("Family_Income", LEVELS), ("Teacher_Quality", LEVELS),
+    ("School_Type", ("Public", "Private")), ("Peer_Influence", ("Negative", "Neutral", "Positive")),
+    ("Gender", ("Male", "Female")), ("Learning_Disabilities", YES_NO),
+    ("Extracurricular_Activities", YES_NO),
+    ("Parental_Education_Level", ("High School", "College", "Postgraduate")),
+    ("Distance_from_Home", ("Near", "Moderate", "Far")),
+)
+COLUMNS = [name for name, _ in SCHEMA] + [TARGET]
+_SPEC = dict(SCHEMA)
+# label index -> the model's code (ordinal_maps / binary_maps), for the 12 model features
+_CODES = {f: np.array([CATEGORY_MAPS[f][lbl] for lbl in _SPEC[f]], dtype=np.float64)
+          for f in FEATURES if f in CATEGORY_MAPS}
+
+
+# ── GENERATION ─────────────────────────────────────────────────
+def block(b, seed=SEED):
+    """Block `b` as {column: int array}: values for numeric columns, label indices for categories."""
+    rng = np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(b,)))
+    cols = {}
+    for name, spec in SCHEMA:
+        lo, hi = (0, len(spec)) if isinstance(spec[0], str) else spec
+        cols[name] = rng.integers(lo, hi, BLOCK, dtype=np.int16)
+    h, a, s, p, t = (cols[k].astype(np.float64) for k in
+                     ("Hours_Studied", "Attendance", "Sleep_Hours", "Previous_Scores", "Tutoring_Sessions"))
+    # the notebook's "realistic target"
+    score = 40 + h * 0.8 + (a - 75) * 0.3 + p * 0.25 + t * 1.2 + s * 0.5 + rng.normal(0, 3, BLOCK)
+    cols[TARGET] = score.clip(55, 101).astype(np.int16)
+    return cols
+
+
+def _rows(start, stop, seed):
+    """Columns of rows [start, stop), cut from the blocks that cover them."""
+    first, last = start // BLOCK, (stop - 1) // BLOCK
+    parts = [block(b, seed) for b in range(first, last + 1)]
+    lo = start - first * BLOCK
+    return {k: np.concatenate([p[k] for p in parts])[lo:lo + stop - start] for k in COLUMNS}
+
+
+def frame(start, stop, seed=SEED):
+    """Rows [start, stop) as a roster DataFrame: categories as labels, like the real dataset."""
+    import pandas as pd
+    cols = _rows(start, stop, seed)
+    return pd.DataFrame({name: pd.Categorical.from_codes(cols[name], spec)
+                         if isinstance(spec[0], str) else cols[name]
+                         for name, spec in SCHEMA} | {TARGET: cols[TARGET]})
+
+
+def matrix(start, stop, seed=SEED):
+    """Rows [start, stop) as the encoded (N, 12) feature matrix in FEATURES order and Exam_Score."""
+    cols = _rows(start, stop, seed)
+    X = np.empty((stop - start, len(FEATURES)))
+    for j, f in enumerate(FEATURES):
+        X[:, j] = _CODES[f][cols[f]] if f in _CODES else cols[f]
+    return X, cols[TARGET].astype(np.float64)
+
+
+def spans(n, chunk_size=CHUNK_SIZE):
+    """(start, stop) of each chunk; chunks are whole blocks so none is drawn twice."""
+    step = max(1, -(-chunk_size // BLOCK)) * BLOCK
+    return [(s, min(s + step, n)) for s in range(0, n, step)]
+
+
+def chunks(n, seed=SEED, chunk_size=CHUNK_SIZE):
+    """Yield the cohort as roster DataFrames, in order (train.accumulate / batch.score_frame input)."""
+    for start, stop in spans(n, chunk_size):
+        yield frame(start, stop, seed)
+
+
+# ── OUTPUT ─────────────────────────────────────────────────────
+def _kind(path):
+    ext = os.path.splitext(path)[1].lower()
+    return "npy" if ext == ".npy" else "parquet" if ext in (".parquet", ".pq") else "csv"
+
+
+def _chunk(start, stop, seed, kind):
+    if kind == "npy":
+        X, y = matrix(start, stop, seed)
+        return start, stop, np.column_stack([X, y])
+    from .batch import serialize
+    return start, stop, serialize(frame(start, stop, seed), kind == "parquet")
+
+
+def write(path, n, seed=SEED, chunk_size=CHUNK_SIZE, workers=1, progress=sys.stderr):
+    """Generate `n` rows into `path` (.csv, .parquet or .npy); returns seconds taken.
+
+    NPY holds the encoded matrix: the 12 model features in FEATURES order, then Exam_Score.
+    """
+    kind = _kind(path)
+    done_rows = 0
+    t0 = time.perf_counter()
+    if kind == "npy":
+        out = np.lib.format.open_memmap(path, mode="w+", dtype=np.float64, shape=(n, len(FEATURES) + 1))
+    else:
+        from .batch import ChunkWriter
+        out = ChunkWriter(path)
+
+    def done(result):
+        nonlocal done_rows
+        start, stop, payload = result
+        if kind == "npy":
+            out[start:stop] = payload
+        else:
+            out.write(payload)
+        done_rows += stop - start
+        if progress:
+            dt = time.perf_counter() - t0
+            print(f"\r  {done_rows:>12,} rows · {done_rows/max(dt,1e-9):>10,.0f} rows/s",
+                  end="", file=progress, flush=True)
+
+    try:
+        work = spans(n, chunk_size)
+        if workers <= 1:
+            for start, stop in work:
+                done(_chunk(start, stop, seed, kind))
+        else:
+            import multiprocessing as mp
+            with mp.get_context("spawn").Pool(workers) as pool:
+                pending = deque()   # ordered, at most 2 chunks in flight per worker
+                for start, stop in work:
+                    pending.append(pool.apply_async(_chunk, (start, stop, seed, kind)))
+                    while len(pending) >= 2 * workers:
+                        done(pending.popleft().get())
+                while pending:
+                    done(pending.popleft().get())
+    finally:
+        if kind == "npy":
+            out.flush()
+        else:
+            out.close()
+    if progress:
+        print(file=progress)
+    return time.perf_counter() - t0
+
+
+# ── CLI ────────────────────────────────────────────────────────
+def add_parser(sub):
+    p = sub.add_parser("synth", help="generate a reproducible synthetic cohort in streaming chunks")
+    p.add_argument("-n", "--rows", type=int, required=True)
+    p.add_argument("-o", "--output", required=True, help="output .csv, .parquet or .npy")
+    p.add_argument("--seed", type=int, default=SEED)
+    p.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help=f"rows, rounded up to whole {BLOCK:,}-row blocks")
+    p.add_argument("--workers", type=int, default=1, help="processes (0 = all cores)")
+    p.add_argument("--quiet", action="store_true")
+    p.set_defaults(func=main)
+
+
+def main(args):
+    workers = args.workers or os.cpu_count() or 1
+    secs = write(args.output, args.rows, args.seed, args.chunk_size, workers,
+                 progress=None if args.quiet else sys.stderr)
+    print(f"generated {args.rows:,} rows (seed {args.seed}) in {secs:.1f}s "
+          f"— {args.rows/max(secs,1e-9):,.0f} rows/s → {args.output}")
+    return 0
@@ -0,0 +1,163 @@
+"""
+ScoreIQ — out-of-core Ridge training
+One pass over the data in chunks accumulates mergeable sufficient statistics
+(count, means, centered XᵀX / Xᵀy); the standardized Ridge system is then
+solved exactly. Memory is O(features²) whatever the row count, and new
+terms are merged into stored statistics without re-reading history.
+Matches StandardScaler + Ridge(alpha) to floating-point tolerance.
+
+Run: python -m scoreiq train StudentPerformanceFactors.csv --stats ridge_stats.npz -o student_model.npz
+"""
+
+import os, sys
+
+import numpy as np
+
+from . import artifact
+from .engine import FEATURES, LinearScorer
+
+TARGET = "Exam_Score"
+STATS_VERSION = 1
+
+
+class RidgeStats:
+    """Running n, means and centered cross-products of (X, y), merged with Chan's update."""
+
+    def __init__(self, p=len(FEATURES), features=FEATURES):
+        self.features = tuple(features)
+        self.n = 0
+        self.x_mean = np.zeros(p)
+        self.y_mean = 0.0
+        self.sxx = np.zeros((p, p))   # Σ (x - x̄)(x - x̄)ᵀ
+        self.sxy = np.zeros(p)        # Σ (x - x̄)(y - ȳ)
+        self.syy = 0.0                # Σ (y - ȳ)²
+
+    @classmethod
+    def from_arrays(cls, X, y, features=FEATURES):
+        X = np.asarray(X, dtype=np.float64); y = np.asarray(y, dtype=np.float64).reshape(-1)
+        st = cls(X.shape[1], features)
+        if len(y):
+            st.n = len(y)
+            st.x_mean = X.mean(axis=0); st.y_mean = float(y.mean())
+            Xc = X - st.x_mean; yc = y - st.y_mean
+            st.sxx = Xc.T @ Xc; st.sxy = Xc.T @ yc; st.syy = float(yc @ yc)
+        return st
+
+    def merge(self, other):
+        """Fold `other` into self in place; returns self."""
+        if other.features != self.features:
+            raise ValueError("cannot merge statistics over different features")
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            self.__dict__.update({k: np.copy(v) if isinstance(v, np.ndarray) else v
+                                  for k, v in other.__dict__.items()})
+            return self
+        n = self.n + other.n
+        w = self.n * other.n / n
+        dx = other.x_mean - self.x_mean
+        dy = other.y_mean - self.y_mean
+        self.sxx = self.sxx + other.sxx + w * np.outer(dx, dx)
+        self.sxy = self.sxy + other.sxy + w * dx * dy
+        self.syy = self.syy + other.syy + w * dy * dy
+        self.x_mean = self.x_mean + dx * other.n / n
+        self.y_mean = self.y_mean + dy * other.n / n
+        self.n = n
+        return self
+
+    def update(self, X, y):
+        return self.merge(RidgeStats.from_arrays(X, y, self.features))
+
+    # ── SOLVE ──────────────────────────────────────────────────
+    def scale(self):
+        """StandardScaler's scale_: population std, 1 for constant features."""
+        var = np.maximum(np.diag(self.sxx) / self.n, 0)
+        eps = np.finfo(np.float64).eps
+        constant = var <= self.n * eps * var + (self.n * self.x_mean * eps) ** 2
+        return np.where(constant, 1.0, np.sqrt(var))
+
+    def standardized(self):
+        """(XsᵀXs, Xsᵀy_c) of the standardized, centered design."""
+        s = self.scale()
+        return self.sxx / np.outer(s, s), self.sxy / s
+
+    def solve(self, alpha=1.0, lo=None, hi=None):
+        """Ridge on standardized features, folded back into a raw-space LinearScorer."""
+        if self.n == 0:
+            raise ValueError("no rows accumulated")
+        A, b = self.standardized()
+        w = np.linalg.solve(A + alpha * np.eye(len(b)), b)
+        coef = w / self.scale()
+        bounds = {k: v for k, v in (("lo", lo), ("hi", hi)) if v is not None}
+        return LinearScorer(coef, self.y_mean - coef @ self.x_mean, features=self.features,
+                            mean=self.x_mean, **bounds)
+
+    # ── PERSISTENCE ────────────────────────────────────────────
+    def save(self, path):
+        # written beside the old file and renamed over it: an interrupted save keeps the previous statistics
+        tmp = f"{path}.tmp"
+        with open(tmp, "wb") as f:
+            np.savez(f, version=np.int64(STATS_VERSION), features=np.array(self.features),
+                     n=np.int64(self.n), x_mean=self.x_mean, y_mean=np.float64(self.y_mean),
+                     sxx=self.sxx, sxy=self.sxy, syy=np.float64(self.syy))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path):
+        with np.load(path, allow_pickle=False) as z:
+            if int(z["version"]) != STATS_VERSION:
+                raise ValueError(f"{path}: statistics version {int(z['version'])}, expected {STATS_VERSION}")
+            st = cls(len(z["features"]), [str(f) for f in z["features"]])
+            st.n = int(z["n"]); st.x_mean = z["x_mean"]; st.y_mean = float(z["y_mean"])
+            st.sxx = z["sxx"]; st.sxy = z["sxy"]; st.syy = float(z["syy"])
+        return st
+
+
+def accumulate(chunks, stats=None, target=TARGET):
+    """Fold an iterable of roster DataFrames into `stats`; rows with unusable cells are skipped."""
+    from .batch import encode_frame
+    import pandas as pd
+    stats = stats or RidgeStats()
+    skipped = 0
+    for df in chunks:
+        X = encode_frame(df)
+        y = pd.to_numeric(df[target], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+        ok = ~(np.isnan(X).any(axis=1) | np.isnan(y))
+        skipped += int((~ok).sum())
+        stats.update(X[ok], y[ok])
+    return stats, skipped
+
+
+# ── CLI ────────────────────────────────────────────────────────
+def add_parser(sub):
+    p = sub.add_parser("train", help="fit Ridge out-of-core from CSV / Parquet chunks")
+    p.add_argument("src", nargs="*", help="new .csv / .parquet files to fold in")
+    p.add_argument("--stats", help="sufficient-statistics .npz to extend and rewrite")
+    p.add_argument("--alpha", type=float, default=1.0)
+    p.add_argument("--target", default=TARGET)
+    p.add_argument("--chunk-size", type=int, default=100_000)
+    p.add_argument("-o", "--output", default=artifact.DEFAULT_PATH, help="model artifact to write")
+    p.set_defaults(func=main)
+
+
+def main(args):
+    from .batch import read_chunks
+    try:
+        stats = RidgeStats.load(args.stats) if args.stats and os.path.exists(args.stats) else RidgeStats()
+        before = stats.n
+        for src in args.src:
+            stats, skipped = accumulate(read_chunks(src, args.chunk_size), stats, args.target)
+            if skipped:
+                print(f"{src}: skipped {skipped:,} rows with missing / unknown values", file=sys.stderr)
+        if stats.n == 0:
+            raise ValueError("no usable rows: give data files, or --stats with accumulated statistics")
+        if args.stats:
+            stats.save(args.stats)
+        scorer = stats.solve(args.alpha)
+        digest = artifact.save(scorer, args.output)
+    except (OSError, ValueError, KeyError) as e:   # unreadable input, missing column, no rows, bad stats file
+        print(f"train: {e}", file=sys.stderr)
+        return 1
+    print(f"{stats.n:,} rows ({stats.n - before:+,} new) · alpha={args.alpha:g} "
+          f"→ {args.output} (sha256 {digest[:12]})")
+    return 0
@@ -0,0 +1,217 @@
+"""
+ScoreIQ — Ridge regularization path
+One eigendecomposition of the standardized XᵀX prices every alpha at once:
+GCV straight from sufficient statistics (so it works out-of-core), exact
+leave-one-out from an SVD when the rows fit in memory, and k-fold from
+per-fold statistics — one decomposition per fold, not per alpha.
+
+Run: python -m scoreiq tune StudentPerformanceFactors.csv --folds 5 --json alpha_report.json
+"""
+
+import json, sys, time
+
+import numpy as np
+
+from . import artifact
+from .train import TARGET, RidgeStats
+
+ALPHAS = np.logspace(-3, 4, 100)
+
+
+def _eig(stats):
+    A, b = stats.standardized()
+    lam, V = np.linalg.eigh(A)
+    return np.maximum(lam, 0), V, V.T @ b
+
+
+def ridge_path(stats, alphas=ALPHAS):
+    """Coefficients, degrees of freedom, RSS and GCV for every alpha from one decomposition.
+
+    coef is (len(alphas), p) in raw feature space; the intercept for row k is
+    ``stats.y_mean - coef[k] @ stats.x_mean``.
+    """
+    alphas = np.asarray(alphas, dtype=np.float64)
+    lam, V, c = _eig(stats)
+    inv = 1.0 / (lam[None, :] + alphas[:, None])               # (A, p)
+    w = (inv * c) @ V.T                                          # standardized coefs
+    coef = w / stats.scale()
+    df = (lam * inv).sum(axis=1) + 1                             # + intercept
+    rss = stats.syy - (c ** 2 * (lam + 2 * alphas[:, None]) * inv ** 2).sum(axis=1)
+    rss = np.maximum(rss, 0)
+    gcv = stats.n * rss / np.maximum(stats.n - df, 1e-12) ** 2
+    return {"alphas": alphas, "coef": coef, "df": df, "rss": rss, "gcv": gcv}
+
+
+def loo_path(X, y, alphas=ALPHAS):
+    """Exact leave-one-out MSE for every alpha (in-memory rows; scaling fitted on all rows)."""
+    X = np.asarray(X, dtype=np.float64); y = np.asarray(y, dtype=np.float64)
+    alphas = np.asarray(alphas, dtype=np.float64)
+    scale = RidgeStats.from_arrays(X, y).scale()
+    Xs = (X - X.mean(axis=0)) / scale
+    yc = y - y.mean()
+    U, s, _ = np.linalg.svd(Xs, full_matrices=False)
+    s2 = s ** 2
+    F = s2[None, :] / (s2[None, :] + alphas[:, None])            # (A, p) shrinkage factors
+    c = U.T @ yc
+    n = len(y)
+    out = np.empty(len(alphas))
+    U2 = U ** 2
+    for k0 in range(0, len(alphas), 16):                          # bound the (n, A) temporaries
+        Fk = F[k0:k0 + 16]
+        resid = yc[:, None] - U @ (Fk * c).T
+        h = U2 @ Fk.T + 1.0 / n
+        out[k0:k0 + 16] = np.mean((resid / (1 - h)) ** 2, axis=0)
+    return {"alphas": alphas, "loo_mse": out}
+
+
+def kfold_path(folds, alphas=ALPHAS):
+    """Held-out MSE / R² per fold and alpha, from one RidgeStats per fold."""
+    alphas = np.asarray(alphas, dtype=np.float64)
+    mse = np.empty((len(folds), len(alphas)))
+    r2 = np.empty_like(mse)
+    for i, held in enumerate(folds):
+        tr = RidgeStats(len(held.x_mean), held.features)
+        for j, f in enumerate(folds):
+            if j != i:
+                tr.merge(f)
+        B = ridge_path(tr, alphas)["coef"]                       # (A, p)
+        dx, dy = held.x_mean - tr.x_mean, held.y_mean - tr.y_mean
+        # Σ (y - ŷ)² over the held-out fold, expanded around its own means
+        sse = (held.syy - 2 * B @ held.sxy + np.einsum("ap,pq,aq->a", B, held.sxx, B)
+               + held.n * (dy - B @ dx) ** 2)
+        mse[i] = sse / held.n
+        r2[i] = 1 - sse / held.syy if held.syy > 0 else np.nan
+    return {"alphas": alphas, "mse": mse, "r2": r2,
+            "mse_mean": mse.mean(axis=0), "mse_std": mse.std(axis=0),
+            "r2_mean": r2.mean(axis=0), "r2_std": r2.std(axis=0)}
+
+
+def fold_stats(X, y, k=5, seed=42):
+    """Shuffle in-memory rows into k folds and summarize each one."""
+    idx = np.random.default_rng(seed).permutation(len(y))
+    X = np.asarray(X, dtype=np.float64); y = np.asarray(y, dtype=np.float64)
+    return [RidgeStats.from_arrays(X[part], y[part]) for part in np.array_split(idx, k)]
+
+
+def select_alpha(folds, alphas=ALPHAS, criterion="kfold", X=None, y=None):
+    """Pick alpha by 'gcv', 'kfold' or 'loo' (needs X, y); returns the curves and timings."""
+    if criterion == "kfold" and len(folds) < 2:
+        raise ValueError("k-fold needs at least two folds")
+    t0 = time.perf_counter()
+    total = RidgeStats(len(folds[0].x_mean), folds[0].features)
+    for f in folds:
+        total.merge(f)
+    res = {"criterion": criterion, "n": total.n, "alphas": np.asarray(alphas, dtype=np.float64)}
+    path = ridge_path(total, alphas)
+    res["gcv"], res["df"] = path["gcv"], path["df"]
+    res["timing_s"] = {"path_gcv": time.perf_counter() - t0}
+    if criterion == "kfold" or len(folds) > 1:
+        t = time.perf_counter()
+        cv = kfold_path(folds, alphas)
+        res.update({f"cv_{k}": cv[k] for k in ("mse_mean", "mse_std", "r2_mean", "r2_std")})
+        res["timing_s"]["kfold"] = time.perf_counter() - t
+    if criterion == "loo":
+        if X is None or y is None:
+            raise ValueError("leave-one-out needs the in-memory rows (X, y)")
+        t = time.perf_counter()
+        res["loo_mse"] = loo_path(X, y, alphas)["loo_mse"]
+        res["timing_s"]["loo"] = time.perf_counter() - t
+    curve = {"gcv": res["gcv"], "kfold": res.get("cv_mse_mean"), "loo": res.get("loo_mse")}[criterion]
+    best = int(np.argmin(curve))
+    res["best_index"], res["alpha"] = best, float(res["alphas"][best])
+    res["timing_s"]["total"] = time.perf_counter() - t0
+    return res
+
+
+def accumulate_folds(chunks, k=5, target=TARGET):
+    """Stream roster chunks into k fold statistics (row i goes to fold i mod k)."""
+    from .train import accumulate
+    folds = [RidgeStats() for _ in range(k)]
+    seen = skipped = 0
+    for df in chunks:
+        pos = (np.arange(len(df)) + seen) % k
+        seen += len(df)
+        for i in range(k):
+            _, bad = accumulate([df[pos == i]], folds[i], target)
+            skipped += bad
+    return folds, skipped
+
+
+# ── CLI ────────────────────────────────────────────────────────
+def add_parser(sub):
+    p = sub.add_parser("tune", help="choose Ridge alpha over a regularization path")
+    p.add_argument("src", nargs="+", help=".csv / .parquet training files")
+    p.add_argument("--folds", type=int, default=5)
+    p.add_argument("--criterion", choices=("kfold", "gcv", "loo"), default="kfold",
+                   help="loo holds every row in memory")
+    p.add_argument("--alphas", default="1e-3:1e4:100", help="lo:hi:count, log-spaced")
+    p.add_argument("--target", default=TARGET)
+    p.add_argument("--chunk-size", type=int, default=100_000)
+    p.add_argument("--json", help="write the error curves and timings here")
+    p.add_argument("-o", "--output", help="also write a model artifact fitted at the chosen alpha")
+    p.set_defaults(func=main)
+
+
+def _jsonable(v):
+    return v.tolist() if isinstance(v, np.ndarray) else v
+
+
+def _rows(frames, target):
+    """In-memory (X, y) of the usable rows of roster frames, for leave-one-out."""
+    from .batch import encode_frame
+    import pandas as pd
+    X = np.vstack([encode_frame(df) for df in frames])
+    y = np.concatenate([pd.to_numeric(df[target], errors="coerce").to_numpy(dtype=np.float64, na_value=np.nan)
+                        for df in frames])
+    ok = ~(np.isnan(X).any(axis=1) | np.isnan(y))
+    return X[ok], y[ok]
+
+
+def _alphas(spec):
+    try:
+        lo, hi, num = spec.split(":")
+        return np.logspace(np.log10(float(lo)), np.log10(float(hi)), int(num))
+    except ValueError:
+        raise ValueError(f"--alphas {spec!r}: expected lo:hi:count, e.g. 1e-3:1e4:100") from None
+
+
+def main(args):
+    from .batch import read_chunks
+    frames = []   # kept only for leave-one-out, which needs the rows themselves
+
+    def chunks(src):
+        for df in read_chunks(src, args.chunk_size):
+            if args.criterion == "loo":
+                frames.append(df)
+            yield df
+
+    try:
+        alphas = _alphas(args.alphas)
+        folds, skipped = [], 0
+        for src in args.src:
+            chunk_folds, bad = accumulate_folds(chunks(src), args.folds, args.target)
+            folds = chunk_folds if not folds else [a.merge(b) for a, b in zip(folds, chunk_folds)]
+            skipped += bad
+        if skipped:
+            print(f"skipped {skipped:,} rows with missing / unknown values", file=sys.stderr)
+        if sum(f.n for f in folds) == 0:
+            raise ValueError("no usable rows")
+        X, y = _rows(frames, args.target) if frames else (None, None)
+        res = select_alpha(folds, alphas, args.criterion, X, y)
+        t = res["timing_s"]
+        print(f"{res['n']:,} rows · {len(alphas)} alphas · {args.criterion} → alpha={res['alpha']:.4g} "
+              f"(path {t['path_gcv']*1000:.1f} ms, k-fold {t.get('kfold', 0)*1000:.1f} ms"
+              + (f", loo {t['loo']*1000:.1f} ms)" if "loo" in t else ")"))
+        if args.json:
+            with open(args.json, "w") as f:
+                json.dump({k: _jsonable(v) for k, v in res.items()}, f, indent=2)
+        if args.output:
+            total = RidgeStats()
+            for f in folds:
+                total.merge(f)
+            digest = artifact.save(total.solve(res["alpha"]), args.output)
+            print(f"→ {args.output} (sha256 {digest[:12]})")
+    except (OSError, ValueError, KeyError) as e:   # unreadable input, bad --alphas, missing column, no rows
+        print(f"tune: {e}", file=sys.stderr)
+        return 1
+    return 0
@@ -0,0 +1,83 @@
+import numpy as np
+import pytest
+
+from scoreiq import artifact
+from scoreiq.drift import Histograms
+from scoreiq.engine import LinearScorer, QuadraticScorer
+from scoreiq.percentile import ScoreIndex
+from scoreiq.profile import LOWER, UPPER
+
+ROWS = np.floor(np.random.default_rng(0).uniform(LOWER, UPPER + 1, size=(300, len(LOWER))))
+
+
+def linear():
+    return LinearScorer(np.linspace(-0.5, 1.0, 12), 42.0, mean=ROWS.mean(axis=0))
+
+
+def quadratic():
+    Q = np.random.default_rng(1).normal(0, 1e-3, (12, 12))
+    return QuadraticScorer(np.linspace(-0.5, 1.0, 12), Q, 42.0, lo=30, hi=110)
+
+
+@pytest.fixture(params=[linear, quadratic])
+def scorer(request):
+    s = request.param()
+    s.cohort = ScoreIndex.from_scores(s.predict(ROWS))
+    s.inputs = Histograms.from_rows(ROWS)
+    return s
+
+
+def rewrite(path, **fields):
+    """Re-save the npz at `path` with some fields replaced, leaving the stored checksums as they were."""
+    with np.load(path, allow_pickle=False) as z:
+        data = {k: z[k] for k in z.files}
+    data.update(fields)
+    with open(path, "wb") as f:
+        np.savez(f, **data)
+
+
+def test_round_trip(tmp_path, scorer):
+    path = str(tmp_path / "model.npz")
+    digest = artifact.save(scorer, path)
+    back = artifact.load(path)
+
+    assert back.kind == scorer.kind and back.features == scorer.features
+    assert np.array_equal(back.predict(ROWS), scorer.predict(ROWS))
+    assert artifact.checksum(back) == digest
+    assert np.array_equal(back.cohort.keys, scorer.cohort.keys)
+    assert np.array_equal(back.cohort.counts, scorer.cohort.counts)
+    assert np.array_equal(back.inputs.counts, scorer.inputs.counts)
+    assert not (tmp_path / "model.npz.tmp").exists()
+
+
+def test_checksum_is_stable(tmp_path, scorer):
+    path = str(tmp_path / "model.npz")
+    digest = artifact.save(scorer, path)
+
+    assert artifact.save(artifact.load(path), path) == digest
+    assert artifact.save_cohort(path, scorer.cohort.add([55.5, 90.0])) == digest   # the cohort has its own
+    assert artifact.checksum(LinearScorer(np.arange(12) / 10, 50.0)) == (
+        "c32aa02e31c0bc39ed34c4307e76e7328436b4d1ef01c148af66195bce03ffd5")   # pinned: the format is stable
+
+
+@pytest.mark.parametrize("field, msg", [("coef", "checksum mismatch"), ("intercept", "checksum mismatch"),
+                                        ("cohort_counts", "cohort index checksum"),
+                                        ("inputs_counts", "input histogram checksum")])
+def test_tampered_artifact_is_rejected(tmp_path, scorer, field, msg):
+    path = str(tmp_path / "model.npz")
+    artifact.save(scorer, path)
+    with np.load(path) as z:
+        value = z[field] + 1
+    rewrite(path, **{field: value})
+
+    with pytest.raises(artifact.ArtifactError, match=msg):
+        artifact.load(path)
+
+
+def test_truncated_artifact_is_rejected(tmp_path, scorer):
+    path = tmp_path / "model.npz"
+    artifact.save(scorer, str(path))
+    path.write_bytes(path.read_bytes()[:200])
+
+    with pytest.raises(artifact.ArtifactError, match="unreadable"):
+        artifact.load(str(path))
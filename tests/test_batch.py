@@ -0,0 +1,38 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from scoreiq import batch, loader, synth
+
+pq = pytest.importorskip("pyarrow.parquet")
+
+
+@pytest.fixture(scope="module")
+def scorer():
+    return loader.retrain()
+
+
+def roster(n=1000):
+    df = synth.frame(0, n)
+    return df.astype({c: object for c in df.columns if isinstance(df[c].dtype, pd.CategoricalDtype)})
+
+
+def test_parquet_output_keeps_one_schema_across_mixed_dtype_chunks(tmp_path, scorer):
+    df = roster()
+    df.loc[:499, "School_Type"] = np.nan                  # all-empty pass-through in the first chunks
+    df["Attendance"] = df["Attendance"].astype(float)
+    df.loc[700:, "Attendance"] = np.nan                   # int chunks, then float-with-NaN chunks
+    df.loc[750:, "Hours_Studied"] = np.nan                # a chunk with no scoreable row
+    src, dst = tmp_path / "in.csv", tmp_path / "out.parquet"
+    df.to_csv(src, index=False)
+
+    rows, invalid, _, _ = batch.run(str(src), str(dst), chunk_size=250, scorer=scorer, progress=None, target="A")
+
+    out = pq.read_table(dst)
+    assert (rows, out.num_rows) == (1000, 1000)
+    assert str(out.schema.field("School_Type").type) == "string"
+    assert out.column("School_Type").null_count == 500
+    assert str(out.schema.field("score").type) == "double"
+    assert str(out.schema.field("plan_feasible").type) == "bool"
+    assert str(out.schema.field("plan").type) == "string"
+    assert out.column("score").null_count == invalid
@@ -0,0 +1,78 @@
+import itertools
+
+import numpy as np
+import pytest
+
+from scoreiq import counterfactual, loader
+from scoreiq.engine import FEATURES
+from scoreiq.profile import DEFAULTS, LOWER, UPPER, encode
+
+pytest.importorskip("sklearn")
+
+IDX = np.array([FEATURES.index(f) for f in counterfactual.ACTIONABLE])
+COST = np.array([counterfactual.EFFORT[f] for f in counterfactual.ACTIONABLE])
+GRID = np.array(list(itertools.product(*[np.arange(LOWER[j], UPPER[j] + 1) for j in IDX])))
+
+
+def curved():
+    """Degree-2 Ridge on a target with real curvature, so the quadratic path is not near-linear."""
+    from sklearn.linear_model import Ridge
+    from sklearn.preprocessing import PolynomialFeatures, StandardScaler
+    from scoreiq import QuadraticScorer
+    X, y = loader.synthetic_training_set()
+    y = y - (0.01 * (X[:, 0] - 22) ** 2 + 0.004 * (X[:, 1] - 80) ** 2 - 0.02 * X[:, 0] * X[:, 4]
+             + 0.05 * (X[:, 2] - 7) ** 2)
+    sc = StandardScaler().fit(X)
+    poly = PolynomialFeatures(degree=2, include_bias=False).fit(sc.transform(X))
+    return QuadraticScorer.from_sklearn(Ridge(alpha=1.0).fit(poly.transform(sc.transform(X)), y), poly, sc)
+
+
+@pytest.fixture(scope="module", params=["linear", "quadratic"])
+def scorer(request):
+    return loader.retrain() if request.param == "linear" else curved()
+
+
+def profiles():
+    rows = [encode({**DEFAULTS, "Hours_Studied": h, "Attendance": a, "Previous_Scores": p, "Tutoring_Sessions": t})
+            for h, a, p, t in itertools.product((2, 20, 40), (62, 85), (55, 95), (0, 6))]
+    return np.array(rows, dtype=np.float64)
+
+
+def brute(scorer, x, floor):
+    """(least effort reaching floor or inf, best reachable score) over every notch of the actionable box."""
+    cand = np.repeat(x[None], len(GRID), axis=0)
+    cand[:, IDX] = GRID
+    y = scorer.predict(cand)
+    effort = np.abs(GRID - x[IDX]) @ COST
+    reach = y >= floor - 1e-9
+    return (effort[reach].min() if reach.any() else np.inf), y.max()
+
+
+@pytest.mark.parametrize("target", ["A+", "A", "B"])
+def test_plan_is_least_effort_against_brute_force(scorer, target):
+    X = profiles()
+    floor = counterfactual.grade_floor(target)
+    p = counterfactual.plan(scorer, X, target)
+
+    for i, x in enumerate(X):
+        effort, top = brute(scorer, x, floor)
+        assert p["feasible"][i] == np.isfinite(effort)
+        if np.isfinite(effort):
+            assert p["effort"][i] == pytest.approx(effort)
+            assert p["score"][i] >= floor - 1e-9
+        else:
+            assert p["score"][i] == pytest.approx(top)
+
+
+def test_unreachable_target_is_flagged_with_the_best_reachable_profile(scorer):
+    x = np.array(encode({**DEFAULTS, "Previous_Scores": 50, "Motivation_Level": "Low", "Parental_Involvement": "Low",
+                         "Access_to_Resources": "Low", "Internet_Access": "No"}), dtype=np.float64)[None]
+    _, top = brute(scorer, x[0], np.inf)
+    target = top + 0.25   # just out of reach, inside the score range
+
+    p = counterfactual.plan(scorer, x, target)
+
+    assert not p["feasible"][0]
+    assert p["score"][0] == pytest.approx(top)
+    after = x[0, IDX] + p["delta"][0]
+    assert np.all(after >= LOWER[IDX]) and np.all(after <= UPPER[IDX])
@@ -0,0 +1,18 @@
+import json
+import os
+import sys
+
+import pytest
+
+pytest.importorskip("streamlit.testing.v1")
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+import delta  # noqa: E402
+
+
+@pytest.mark.parametrize("page", delta.PAGES)
+def test_rerun_delta_stays_within_recorded_size(page, monkeypatch):
+    monkeypatch.chdir(os.path.dirname(delta.APP))   # .streamlit/config.toml enables static serving
+    before = json.load(open(delta.BASELINE))[page]["bytes"]
+    sent = delta.bench_page(page)["bytes"]
+    assert sent <= delta.LIMITS[page]
+    assert sent <= before * 1.05
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from scoreiq import QuadraticScorer, attribution, loader, sensitivity
+from scoreiq.engine import vary
+from scoreiq.profile import DEFAULTS, LOWER, UPPER, encode
+
+pytest.importorskip("sklearn")
+
+
+@pytest.fixture(scope="module")
+def fitted():
+    """StandardScaler → PolynomialFeatures(2) → Ridge on a target with real curvature and interactions."""
+    from sklearn.linear_model import Ridge
+    from sklearn.preprocessing import PolynomialFeatures, StandardScaler
+    X, y = loader.synthetic_training_set()
+    y = y - 0.01 * (X[:, 0] - 22) ** 2 + 0.02 * X[:, 0] * X[:, 4] - 0.004 * (X[:, 1] - 80) ** 2
+    sc = StandardScaler().fit(X)
+    poly = PolynomialFeatures(degree=2, include_bias=False).fit(sc.transform(X))
+    ridge = Ridge(alpha=1.0).fit(poly.transform(sc.transform(X)), y)
+    return sc, poly, ridge
+
+
+@pytest.fixture(scope="module")
+def rows():
+    return np.floor(np.random.default_rng(1).uniform(LOWER, UPPER + 1, size=(500, len(LOWER))))
+
+
+def test_from_sklearn_matches_the_pipeline(fitted, rows):
+    sc, poly, ridge = fitted
+    q = QuadraticScorer.from_sklearn(ridge, poly, sc)
+    want = ridge.predict(poly.transform(sc.transform(rows)))
+
+    assert np.allclose(q.raw(rows), want)
+    assert np.allclose(q.predict(rows), np.clip(want, q.lo, q.hi))
+    assert np.allclose(q.mean, sc.mean_)
+
+
+def test_curve_and_grid_match_scoring_every_profile(fitted):
+    sc, poly, ridge = fitted
+    q = QuadraticScorer.from_sklearn(ridge, poly, sc)
+    base = encode(DEFAULTS)
+    for idx in (0, 1, 2, 4):
+        values = np.arange(LOWER[idx], UPPER[idx] + 1)
+        assert np.allclose(sensitivity.curve(q, base, idx, values), q.predict(vary(base, idx, values)))
+
+    axes = [(1, np.linspace(60, 100, 9)), (0, np.linspace(1, 44, 11)), (4, np.arange(0, 9))]
+    mesh = np.meshgrid(*[v for _, v in axes], indexing="ij")
+    X = np.repeat(np.asarray(base, dtype=np.float64)[None], mesh[0].size, axis=0)
+    for (idx, _), m in zip(axes, mesh):
+        X[:, idx] = m.ravel()
+    assert np.allclose(sensitivity.grid(q, base, axes), q.predict(X).reshape(mesh[0].shape))
+
+
+def test_attribution_is_exact_shapley(fitted, rows):
+    sc, poly, ridge = fitted
+    q = QuadraticScorer.from_sklearn(ridge, poly, sc, lo=-np.inf, hi=np.inf)   # unclipped, so sampling is exact too
+    phi = attribution.attribute(q, rows)
+
+    assert np.allclose(phi.sum(axis=1) + attribution.baseline(q), q.raw(rows))
+    # for a degree-2 model one permutation and its reverse already give the exact Shapley values
+    assert np.allclose(phi, attribution._shapley(q, rows, attribution.reference(q), 2, 0))
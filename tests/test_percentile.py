@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+
+from scoreiq.percentile import ScoreIndex
+
+
+def cohort(n, seed, lo=40, hi=100):
+    return np.round(np.random.default_rng(seed).uniform(lo, hi, n), 2)
+
+
+@pytest.mark.parametrize("a, b", [
+    (cohort(1000, 0), cohort(700, 1)),
+    (cohort(50, 2, 60, 61), cohort(50, 3, 60, 61)),            # almost every key shared
+    (cohort(100, 4), np.r_[cohort(100, 5), -1e6, 1e6]),         # unclipped outliers: the sparse path
+    (cohort(100, 6), []),
+])
+def test_merge_equals_indexing_the_concatenation(a, b):
+    merged = ScoreIndex.from_scores(a).merge(ScoreIndex.from_scores(b))
+    whole = ScoreIndex.from_scores(np.concatenate([a, b]))
+
+    assert np.array_equal(merged.keys, whole.keys)
+    assert np.array_equal(merged.counts, whole.counts)
+    assert merged.n == len(a) + len(b)
+    q = cohort(200, 7)
+    assert np.array_equal(merged.rank(q), whole.rank(q))
+
+
+def test_rank_is_mid_rank_over_duplicate_keys():
+    scores = np.r_[cohort(500, 8), [75.0] * 40, 74.999, 75.004, [80.0] * 3]   # 74.999 and 75.004 share 75.0's key
+    idx = ScoreIndex.from_scores(scores)
+    key = np.rint(scores / idx.resolution)
+
+    q = np.array([75.0, 74.996, 75.0, 80.0, 80.0, 39.0, 101.0])
+    k = np.rint(q / idx.resolution)
+    want = 100 * ((key[None] < k[:, None]).sum(axis=1) + 0.5 * (key[None] == k[:, None]).sum(axis=1)) / len(scores)
+
+    got = idx.rank(q)
+    assert np.allclose(got, want)
+    assert got[0] == got[1] == got[2]     # every score on the same key ranks the same
+    assert got[3] == got[4]
+    assert (got[5], got[6]) == (0.0, 100.0)
+    assert np.isnan(idx.rank([np.nan])[0])
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+from scoreiq import artifact, loader, registry
+from scoreiq.train import RidgeStats
+
+
+@pytest.fixture
+def src(tmp_path):
+    path = str(tmp_path / "model.npz")
+    artifact.save(RidgeStats.from_arrays(*loader.synthetic_training_set()).solve(), path)
+    return path
+
+
+@pytest.fixture
+def reg(tmp_path):
+    return registry.Registry(str(tmp_path / "registry"))
+
+
+def test_no_shadow_without_a_versioned_active_model(reg, src):
+    scorer = artifact.load(src)
+    live = registry.LiveModel(reg, scorer=scorer)   # empty registry: serving an unversioned model
+    live._update_shadow("v9", 1.0)
+
+    assert live.active.version is None and live.shadow is None
+    live.close()
+
+
+def test_shadow_follows_the_manifest(reg, src):
+    reg.publish(src, "v1")
+    reg.publish(src, "v2", shadow=0.5)
+    live = registry.LiveModel(reg)
+    assert live.active.version == "v1" and live.shadow.version == "v2"
+
+    reg.activate("v2")
+    assert live.refresh()
+    assert live.active.version == "v2" and live.shadow is None
+    assert np.array_equal(live.scorer.coef, artifact.load(src).coef)
+    live.close()
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from scoreiq import loader
+from scoreiq.train import RidgeStats
+
+pytest.importorskip("sklearn")
+
+
+@pytest.fixture(scope="module")
+def data():
+    return loader.synthetic_training_set()
+
+
+@pytest.mark.parametrize("alpha", [0.1, 1.0, 100.0])
+def test_solve_matches_standard_scaler_and_ridge(data, alpha):
+    from sklearn.linear_model import Ridge
+    from sklearn.preprocessing import StandardScaler
+    X, y = data
+    sc = StandardScaler().fit(X)
+    ridge = Ridge(alpha=alpha).fit(sc.transform(X), y)
+
+    scorer = RidgeStats.from_arrays(X, y).solve(alpha)
+
+    assert np.allclose(scorer.coef, ridge.coef_ / sc.scale_)
+    assert np.allclose(scorer.intercept, ridge.intercept_ - ridge.coef_ @ (sc.mean_ / sc.scale_))
+    assert np.allclose(scorer.raw(X), ridge.predict(sc.transform(X)))
+
+
+@pytest.mark.parametrize("chunk", [1, 7, 500, 4999])
+def test_chunked_fit_equals_single_pass(data, chunk):
+    X, y = data
+    whole = RidgeStats.from_arrays(X, y)
+    chunked = RidgeStats()
+    for s in range(0, len(y), chunk):
+        chunked.update(X[s:s + chunk], y[s:s + chunk])
+
+    assert chunked.n == whole.n
+    for k in ("x_mean", "y_mean", "sxx", "sxy", "syy"):
+        assert np.allclose(getattr(chunked, k), getattr(whole, k)), k
+    a, b = chunked.solve(), whole.solve()
+    assert np.allclose(a.coef, b.coef) and np.allclose(a.intercept, b.intercept)
+    assert np.allclose(a.predict(X), b.predict(X))
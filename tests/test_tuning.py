@@ -0,0 +1,88 @@
+import argparse
+
+import numpy as np
+import pytest
+
+from scoreiq import loader, tuning
+from scoreiq.train import RidgeStats
+
+pytest.importorskip("sklearn")
+
+ALPHAS = np.logspace(-2, 3, 12)
+
+
+@pytest.fixture(scope="module")
+def data():
+    return loader.synthetic_training_set(n=200, seed=7)
+
+
+def test_loo_matches_ridgecv(data):
+    from sklearn.linear_model import RidgeCV
+    from sklearn.preprocessing import StandardScaler
+    X, y = data
+    cv = RidgeCV(alphas=ALPHAS, store_cv_results=True).fit(StandardScaler().fit_transform(X), y)
+
+    loo = tuning.loo_path(X, y, ALPHAS)["loo_mse"]
+
+    assert np.allclose(loo, cv.cv_results_.mean(axis=0))
+
+
+def test_gcv_matches_explicit_ridge_fits(data):
+    from sklearn.linear_model import Ridge
+    from sklearn.preprocessing import StandardScaler
+    X, y = data
+    Xs = StandardScaler().fit_transform(X)
+    Xc = Xs - Xs.mean(axis=0)
+    n = len(y)
+    want = []
+    for a in ALPHAS:
+        rss = ((y - Ridge(alpha=a).fit(Xs, y).predict(Xs)) ** 2).sum()
+        df = np.trace(Xc @ np.linalg.solve(Xc.T @ Xc + a * np.eye(X.shape[1]), Xc.T)) + 1
+        want.append(n * rss / (n - df) ** 2)
+
+    path = tuning.ridge_path(RidgeStats.from_arrays(X, y), ALPHAS)
+
+    assert np.allclose(path["gcv"], want)
+
+
+def test_kfold_matches_cross_val_score(data):
+    from sklearn.linear_model import Ridge
+    from sklearn.model_selection import cross_val_score
+    from sklearn.pipeline import make_pipeline
+    from sklearn.preprocessing import StandardScaler
+    X, y = data
+    parts = np.array_split(np.random.default_rng(42).permutation(len(y)), 5)   # fold_stats' split
+    splits = [(np.concatenate(parts[:i] + parts[i + 1:]), held) for i, held in enumerate(parts)]
+    want = [-cross_val_score(make_pipeline(StandardScaler(), Ridge(alpha=a)), X, y, cv=splits,
+                             scoring="neg_mean_squared_error").mean() for a in ALPHAS]
+
+    cv = tuning.kfold_path(tuning.fold_stats(X, y, k=5, seed=42), ALPHAS)
+
+    assert np.allclose(cv["mse_mean"], want)
+
+
+@pytest.mark.parametrize("argv, msg", [(["missing.csv"], "No such file"),
+                                       (["{src}", "--alphas", "1,x"], "--alphas"),
+                                       (["{src}", "--folds", "1"], "two folds")])
+def test_cli_reports_bad_input_in_one_line(tmp_path, capsys, argv, msg):
+    from scoreiq import synth
+    src = tmp_path / "roster.csv"
+    synth.frame(0, 100).to_csv(src, index=False)
+    p = argparse.ArgumentParser().add_subparsers()
+    tuning.add_parser(p)
+    args = p.choices["tune"].parse_args([a.format(src=src) for a in argv])
+
+    assert tuning.main(args) == 1
+    err = capsys.readouterr().err
+    assert err.startswith("tune: ") and msg in err and err.count("\n") == 1
+
+
+def test_cli_loo_criterion(tmp_path, capsys):
+    from scoreiq import synth
+    src = tmp_path / "roster.csv"
+    synth.frame(0, 300).to_csv(src, index=False)
+    p = argparse.ArgumentParser().add_subparsers()
+    tuning.add_parser(p)
+
+    assert tuning.main(p.choices["tune"].parse_args([str(src), "--criterion", "loo"])) == 0
+    assert "loo →" in capsys.readouterr().out